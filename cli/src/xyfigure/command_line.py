@@ -4,16 +4,33 @@ client.py).
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import glob
 from pathlib import Path
+import sys
+import time
+import traceback
+from typing import Iterable, NamedTuple
 
+import matplotlib
 import yaml
 
 # import xyfigure.constants as cc
 from xyfigure.factory import XYFactory
+from xyfigure import xymodel
 from xyfigure.xymodel import XYModel, XYModelAbaqus
 from xyfigure.xyview import XYView, XYViewAbaqus
 
 
+class RecipeResult(NamedTuple):
+    """The outcome of processing one recipe in a batch."""
+
+    path: str  # the recipe file
+    processed: bool  # True if the recipe completed
+    seconds: float  # the wall time to process the recipe
+    error: str  # the error, or "" if processed
+
+
 def process(yml_path_file: Path) -> bool:
     """Given a .yml file, processes it to create a figure.
 
@@ -83,6 +100,115 @@ def process(yml_path_file: Path) -> bool:
     return processed  # success if we reach this line
 
 
+def recipe_paths(patterns: Iterable[str]) -> tuple[Path, ...]:
+    """Given recipe files and glob patterns, e.g., "figures/*.yml", returns the
+    recipe files, in the given order, with the matches of each pattern sorted.
+    A pattern without a match, or a file that does not exist, is returned as
+    is, so that it is reported as a failure.
+    """
+    paths = []
+    for pattern in patterns:
+        expanded = str(Path(pattern).expanduser())
+        matches = sorted(glob.glob(expanded)) if glob.has_magic(expanded) else []
+        paths.extend(Path(m) for m in (matches or [expanded]))
+    return tuple(paths)
+
+
+def _process_timed(yml_path_file: Path) -> RecipeResult:
+    """Processes one recipe, and returns its outcome, rather than raising, so
+    one failed recipe does not end the batch.
+    """
+    start = time.perf_counter()
+    try:
+        if not yml_path_file.is_file():
+            raise FileNotFoundError(f"could not find file: {yml_path_file}")
+        # each recipe starts from the default rcParams, e.g., a recipe with
+        # latex: 1 sets usetex, and the caller's rcParams are restored after
+        with matplotlib.rc_context():
+            matplotlib.rcdefaults()
+            processed, error = process(yml_path_file=yml_path_file), ""
+    except (Exception, SystemExit) as exception:  # sys.exit() of a defective recipe
+        processed = False
+        error = "".join(traceback.format_exception_only(type(exception), exception))
+    return RecipeResult(
+        path=str(yml_path_file),
+        processed=processed,
+        seconds=time.perf_counter() - start,
+        error=error.strip(),
+    )
+
+
+def _batch_worker_initializer(cache: bool = True, folder=None):
+    """Uses the non-interactive backend, since a batch worker has no display,
+    enables or disables the model cache, and, if given, sets its folder, since
+    a worker that is spawned rather than forked starts with the default cache.
+    """
+    matplotlib.use("Agg")
+    xymodel.MODEL_CACHE.enabled = cache
+    if folder is not None:
+        xymodel.MODEL_CACHE.folder = folder
+
+
+def process_batch(
+    *, yml_path_files: Iterable[Path], workers: int = 1, cache: bool = True
+) -> tuple[RecipeResult, ...]:
+    """Given .yml recipes, processes them all in this interpreter, so Python and
+    Matplotlib are imported once, rather than once per recipe.  A data file that
+    is used by several recipes is read once per process.
+
+    Args:
+        yml_path_files: The fully pathed recipe files.
+        workers: The number of processes.  Default is one (1), which processes
+            the recipes serially in this process.  With more than one, the
+            recipes are processed in a process pool with the non-interactive
+            Agg backend, so figures are serialized but not displayed.
+        cache: If True, the default, model data are read from and written to the
+            model cache.  If False, the cache is bypassed.
+
+    Returns:
+        The outcome of each recipe, in the given order.
+
+    Raises:
+        ValueError if workers < 1.
+    """
+    if workers < 1:
+        raise ValueError("workers must be one or greater")
+
+    paths = tuple(Path(p) for p in yml_path_files)
+    if workers == 1:
+        enabled, xymodel.MODEL_CACHE.enabled = xymodel.MODEL_CACHE.enabled, cache
+        try:
+            return tuple(map(_process_timed, paths))
+        finally:
+            xymodel.MODEL_CACHE.enabled = enabled
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_batch_worker_initializer,
+        initargs=(cache, xymodel.MODEL_CACHE.folder),
+    ) as executor:
+        return tuple(executor.map(_process_timed, paths))
+
+
+def report(results: Iterable[RecipeResult]) -> str:
+    """Returns a summary of the timing and outcome of each recipe."""
+    results = tuple(results)
+    lines = ["====================================", "xyfigure batch summary:"]
+    for r in results:
+        lines.append(
+            f"  {'ok' if r.processed else 'FAILED':6s} {r.seconds:8.2f} s  {r.path}"
+        )
+        if not r.processed:
+            lines.append(f"         {r.error}")
+    n_failed = sum(not r.processed for r in results)
+    total = sum(r.seconds for r in results)
+    lines.append(
+        f"{len(results) - n_failed} of {len(results)} recipe(s) processed, "
+        + f"{n_failed} failed, {total:.2f} s total recipe time."
+    )
+    return "\n".join(lines)
+
+
 def main():
     """Runs the module from the command line."""
     # print(cl.BANNER)
@@ -93,17 +219,58 @@ def main():
         epilog="xyfigure finished",
     )
     parser.add_argument(
-        "input_file", help="the .yml recipe used to create the xyfigure"
+        "input_file",
+        nargs="*",
+        help="the .yml recipe(s), or glob pattern(s), used to create the xyfigure(s)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="the number of processes for a batch of recipes (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="bypass the cache of model data, neither reading nor writing it",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help=f"delete the cached model data in {xymodel.MODEL_CACHE.folder} before processing",
     )
 
     args = parser.parse_args()
-    if args.input_file:
-        aa = Path(args.input_file).expanduser()
+    if args.clear_cache:
+        n_cleared = xymodel.MODEL_CACHE.clear()
+        print(f"Cleared {n_cleared} cached model(s) from {xymodel.MODEL_CACHE.folder}")
+        if not args.input_file:
+            return
+    elif not args.input_file:
+        parser.error("the following arguments are required: input_file")
+
+    xymodel.MODEL_CACHE.enabled = not args.no_cache
+    paths = recipe_paths(args.input_file)
+
+    if len(paths) == 1 and args.workers == 1:
+        # a single recipe, processed as always, e.g., with interactive display
+        aa = paths[0]
         if aa.is_file():
             print(f"Processing file: {aa}")
             process(yml_path_file=aa)
         else:
             print(f"Error: could not find file: {aa}")
+        return
+
+    # the batch, serial or not, is non-interactive
+    _batch_worker_initializer(cache=xymodel.MODEL_CACHE.enabled)
+    results = process_batch(
+        yml_path_files=paths, workers=args.workers, cache=xymodel.MODEL_CACHE.enabled
+    )
+    print(report(results))
+    if not all(r.processed for r in results):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,18 @@
 # https://www.python.org/dev/peps/pep-0008/#imports
 # standard library imports
-# import os
+from collections import OrderedDict
+import glob
+import hashlib
+from itertools import islice
+import json
+import os
 import sys
+import tempfile
 
 # related third-party imports
 import numpy as np
 from pathlib import Path
+from scipy import fft as sp_fft
 from scipy import signal
 
 # from scipy.integrate import cumtrapz  # version 0.14.0, now deprecated
@@ -20,7 +27,435 @@ from xyfigure.xybase import XYBase
 
 
 # Helper functions
-def cross_correlation(reference, subject, verbose=False):
+LOADERS = ("genfromtxt", "fast")  # the readers of a comma separated file
+
+# the most recently loaded columns, (file, stat, read options) -> read only
+# (n, 2) array, evicted least recently used first beyond COLUMNS_LOADED_BYTES
+_COLUMNS_LOADED = OrderedDict()
+COLUMNS_LOADED_BYTES = 256 * 2**20
+
+
+def _read_fast(path, *, skip_header, skip_footer, usecols):
+    """Returns the (n, 2) float columns of a comma separated file, parsed by the
+    C reader of np.loadtxt, which reads the file a chunk at a time.  As with
+    np.genfromtxt, the footer is the last skip_footer lines that are neither
+    blank nor comments.  Unlike np.genfromtxt, a value that is not a number
+    raises a ValueError rather than becoming nan.
+    """
+    max_rows = None  # all rows
+    if skip_footer > 0:
+        # count, without parsing, the rows of data between header and footer
+        with open(path, "rb") as f:
+            n_rows = sum(
+                1
+                for line in islice(f, skip_header, None)
+                if line.split(b"#", 1)[0].strip()
+            )
+        max_rows = n_rows - skip_footer
+        if max_rows <= 0:
+            return np.zeros((0, len(usecols)))
+
+    return np.loadtxt(
+        path,
+        dtype=np.float64,
+        delimiter=",",
+        skiprows=skip_header,
+        usecols=usecols,
+        max_rows=max_rows,
+        ndmin=2,
+    )
+
+
+def sidecar_path(path_file, *, skip_header=0, skip_footer=0, usecols=(0, 1)):
+    """Returns the binary .npy sidecar of the columns of a comma separated file,
+    beside the file, and named for the rows and columns read, and for the size
+    and modification time of the file, so any change to the file, even to an
+    older modification time, names a new sidecar.
+    """
+    path = Path(path_file).expanduser().resolve()
+    stat = path.stat()
+    options = json.dumps([skip_header, skip_footer, list(usecols)])
+    digest = hashlib.sha256(options.encode("utf-8")).hexdigest()[:12]
+    return path.with_name(
+        f"{path.name}.{digest}.{stat.st_size}-{stat.st_mtime_ns}.npy"
+    )
+
+
+def load_columns(
+    path_file,
+    *,
+    skip_header=0,
+    skip_footer=0,
+    usecols=(0, 1),
+    loader="genfromtxt",
+    sidecar=False,
+):
+    """Returns the (n, 2) float columns of a comma separated file, as a read only
+    array.  Files are read once per process, and shared by all models of all
+    recipes that read the same columns of the same, unmodified file.
+
+    Args:
+        path_file: The fully pathed .csv file.
+        skip_header: The number of rows to skip at the start of the file.
+        skip_footer: The number of rows to skip at the end of the file.
+        usecols: The (x, y) column indices.
+        loader: "genfromtxt", the default, or "fast", which parses the file with
+            the C reader of np.loadtxt, many times faster for large files.
+        sidecar: If True, the columns are also written to a binary .npy sidecar
+            beside the file, which later loads memory map rather than parse,
+            until the file is modified.  Default is False.
+
+    Returns:
+        The read only array, copy it before modifying it.
+
+    Raises:
+        ValueError if the loader is not one of LOADERS.
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"loader '{loader}' is not one of {LOADERS}")
+
+    path = Path(path_file).expanduser().resolve()
+    stat = path.stat()
+    key = (
+        str(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        skip_header,
+        skip_footer,
+        tuple(usecols),
+        loader,
+    )
+    data = _COLUMNS_LOADED.get(key, None)
+    if data is not None:
+        _COLUMNS_LOADED.move_to_end(key)
+        return data
+
+    read_options = {
+        "skip_header": skip_header,
+        "skip_footer": skip_footer,
+        "usecols": tuple(usecols),
+    }
+    side = sidecar_path(path, **read_options) if sidecar else None
+    try:
+        # the sidecar of the file as it is now holds its columns
+        if side is not None:
+            data = np.load(side, mmap_mode="r")
+    except (OSError, ValueError):  # no sidecar, or a damaged one
+        data = None
+
+    if data is None:
+        if loader == "fast":
+            data = _read_fast(path, **read_options)
+        else:
+            data = np.genfromtxt(path, dtype="float", delimiter=",", **read_options)
+        if side is not None and _save_atomic(side, data):
+            # remove the sidecars of earlier versions of the file
+            prefix = side.name[: side.name.rindex(".", 0, -len(".npy")) + 1]
+            for stale in side.parent.glob(f"{glob.escape(prefix)}*.npy"):
+                if stale != side:
+                    stale.unlink(missing_ok=True)
+        data.flags.writeable = False
+
+    _remember_columns(key, data)
+    return data
+
+
+def _nbytes(data) -> int:
+    """Returns the memory held by loaded columns, none if memory mapped."""
+    return 0 if isinstance(data, np.memmap) else data.nbytes
+
+
+def _remember_columns(key, data) -> None:
+    """Memoizes loaded columns, and evicts the least recently used columns so
+    the memo holds at most COLUMNS_LOADED_BYTES.
+    """
+    if _nbytes(data) > COLUMNS_LOADED_BYTES:
+        return  # too large to keep
+    _COLUMNS_LOADED[key] = data
+    held = sum(_nbytes(d) for d in _COLUMNS_LOADED.values())
+    while held > COLUMNS_LOADED_BYTES:
+        _, evicted = _COLUMNS_LOADED.popitem(last=False)
+        held -= _nbytes(evicted)
+
+
+def _save_atomic(path_file, data) -> bool:
+    """Saves an array to a .npy file, written whole to a temporary file, then
+    renamed, so concurrent processes never read a partial file.
+
+    Returns:
+        True if saved, False if the folder is not writable.
+    """
+    path = Path(path_file)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, data)
+        # the mode of a new file, rather than the owner only mode of mkstemp,
+        # so a sidecar beside a shared file is readable by its other users
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp, 0o666 & ~umask)
+        os.replace(temp, path)
+    except OSError:
+        Path(temp).unlink(missing_ok=True)
+        return False
+    return True
+
+
+# Increment to invalidate all cache entries, e.g., if a signal process changes.
+CACHE_VERSION = 2
+
+# keys of a signal process that do not change its data, only its serialization
+_SERIALIZE_KEYS = ("serialize", "folder", "file", "verbose")
+
+_FILE_DIGESTS = {}  # (file, stat) -> sha256 hex digest of the file contents
+
+
+def file_digest(path_file) -> str:
+    """Returns the sha256 hex digest of the contents of a file, computed once
+    per process for each unmodified file.
+    """
+    path = Path(path_file).expanduser().resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _FILE_DIGESTS.get(key, None)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        _FILE_DIGESTS[key] = digest
+    return digest
+
+
+class ModelCache:
+    """An on disk cache of model data, as .npy files named by a content hash of
+    the input file, the column selection, and the signal processes applied.
+    Any change to these gives a new name, so a stale entry is never used.
+    """
+
+    def __init__(self, *, folder=None, enabled=True):
+        self._folder = folder
+        self.enabled = enabled
+
+    @property
+    def folder(self) -> Path:
+        """Returns the cache folder, given or else from the XYFIGURE_CACHE
+        environment variable at the time of use, default ~/.cache/xyfigure.
+        """
+        folder = self._folder
+        if folder is None:
+            folder = os.environ.get("XYFIGURE_CACHE", "~/.cache/xyfigure")
+        return Path(folder).expanduser()
+
+    @folder.setter
+    def folder(self, value):
+        self._folder = value
+
+    def key(self, *, path_file, read_options: dict, steps: list) -> str:
+        """Returns the hex digest key of the data of a file, read with the
+        read_options, after the signal process steps, a list of (name, value).
+        """
+        chain = []
+        for name, value in steps:
+            value = dict(value) if isinstance(value, dict) else value
+            if isinstance(value, dict):
+                for k in _SERIALIZE_KEYS:
+                    value.pop(k, None)
+                reference = value.get("reference", None)
+                if isinstance(reference, dict) and reference.get("file", None):
+                    ref_file = Path(reference.get("folder", ".")).expanduser()
+                    ref_file = ref_file.joinpath(reference["file"])
+                    value["reference_digest"] = file_digest(ref_file)
+            chain.append([name, value])
+
+        description = json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "file": file_digest(path_file),
+                "read": read_options,
+                "steps": chain,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Returns the .npy file of a key."""
+        return self.folder.joinpath(key + ".npy")
+
+    def load(self, key: str):
+        """Returns the cached array of a key, or None if not cached."""
+        if not self.enabled:
+            return None
+        try:
+            return np.load(self.path(key))
+        except (OSError, ValueError):  # not cached, or a damaged entry
+            return None
+
+    def save(self, key: str, data) -> None:
+        """Caches the array of a key.  The file is written whole, then renamed,
+        so concurrent processes never read a partial entry.
+        """
+        if self.enabled:
+            _save_atomic(self.path(key), data)
+
+    def clear(self) -> int:
+        """Deletes all cached entries, and returns the number deleted."""
+        n = 0
+        if self.folder.is_dir():
+            for entry in self.folder.glob("*.npy"):
+                entry.unlink(missing_ok=True)
+                n += 1
+        return n
+
+
+MODEL_CACHE = ModelCache()
+
+
+def _correlate_full(ref_y, y, *, spectra=None, key=None):
+    """Returns the sliding dot product of two signals of equal length n, as
+    np.correlate(ref_y, y, mode="full"), but computed in O(n log n) with the
+    FFT rather than in O(n^2).
+
+    Args:
+        ref_y: The (n,) reference signal.
+        y: The (n,) subject signal.
+        spectra: An optional dict of reference transforms, so a reference is
+            transformed once for many subjects on the same time samples.
+        key: The key of the reference transform in spectra.
+
+    Returns:
+        The (2n - 1,) sliding dot product, in which index n - 1 is zero lag.
+    """
+    n = len(y)
+    n_fft = sp_fft.next_fast_len(2 * n - 1, real=True)  # no circular overlap
+    ref_spectrum = None if spectra is None else spectra.get((key, n_fft), None)
+    if ref_spectrum is None:
+        ref_spectrum = sp_fft.rfft(ref_y, n_fft)
+        if spectra is not None:
+            spectra[(key, n_fft)] = ref_spectrum
+    circular = sp_fft.irfft(ref_spectrum * np.conj(sp_fft.rfft(y, n_fft)), n_fft)
+    return np.concatenate((circular[n_fft - n + 1 :], circular[:n]))
+
+
+def read_abaqus_mesh(path_file):
+    """Returns the nodes and elements of an ABAQUS .inp file, read in a single
+    pass over its lines.  Values are converted as they are read, and other
+    keywords, e.g., *NSET, are skipped.  Node and element lines are read as
+    ptg.abaqus.read_inp() reads them, which xyfigure does not depend on.
+
+    Args:
+        path_file: The fully pathed .inp file.
+
+    Returns:
+        The (n,) node numbers, the (n, 3) nodal coordinates, with a 0.0 z value
+        for 2D nodes, and the (m, 4) first four node numbers of each element,
+        e.g., the bottom face of a hexahedron.
+
+    Raises:
+        ValueError if a node or element line cannot be read, or an element has
+        fewer than four nodes.
+    """
+    node_ids, coordinates, elements = [], [], []
+    keyword = None  # of the data lines being read
+    pending = []  # the fields of an element continued on the next line
+
+    with open(path_file, "rt") as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("**"):
+                continue  # blank or comment line
+            try:
+                if line.startswith("*"):
+                    if pending:
+                        raise ValueError("element continues past end of block")
+                    keyword = line[1:].split(",")[0].strip().upper()
+                elif keyword == "NODE":
+                    # assume a 3D format even for planar problems
+                    values = line.rstrip(",").split(",")
+                    xyz = [float(v) for v in values[1:4]]
+                    node_ids.append(int(values[0]))
+                    coordinates.append(xyz + [0.0] * (3 - len(xyz)))
+                elif keyword == "ELEMENT":
+                    values = pending + line.split(",")
+                    if not values[-1].strip():
+                        # a trailing comma continues the element on the next line
+                        pending = values[:-1]
+                        continue
+                    pending = []
+                    if len(values) < 5:
+                        raise ValueError("an element must have at least four nodes")
+                    elements.append([int(v) for v in values[1:5]])
+            except ValueError as error:
+                raise ValueError(f"{path_file}, line {number}: {error}") from error
+
+    if pending:
+        raise ValueError(f"{path_file}: element continues past end of file")
+
+    return (
+        np.array(node_ids, dtype=np.int64),
+        np.array(coordinates, dtype=np.float64).reshape(-1, 3),
+        np.array(elements, dtype=np.int64).reshape(-1, 4),
+    )
+
+
+def cross_correlation(reference, subject, verbose=False, *, max_lag=None):
+    """Returns the subject shifted in time to best correlate with the reference.
+
+    Args:
+        reference: The (n, 2) time and value of the reference signal.
+        subject: The (m, 2) time and value of the subject signal.
+        verbose: If True, prints the steps of the correlation.
+        max_lag: The largest shift in time of the subject, in either direction.
+            Default is None, which searches all shifts that overlap.
+
+    Returns:
+        The correlated times, the correlated subject values, the relative error
+        of the cross-correlation, and the L2-norm error rate.
+
+    Raises:
+        ValueError if max_lag is negative.
+    """
+    return _cross_correlation(reference, subject, verbose=verbose, max_lag=max_lag)
+
+
+def cross_correlation_batch(reference, subjects, verbose=False, *, max_lag=None):
+    """Returns the cross_correlation() of one reference with each of many
+    subjects.  The reference is transformed once for all subjects that share
+    the same time samples, e.g., sensors of one test.
+
+    Args:
+        reference: The (n, 2) time and value of the reference signal.
+        subjects: The (m, 2) time and value of each subject signal.
+        verbose: If True, prints the steps of each correlation.
+        max_lag: The largest shift in time of each subject, see
+            cross_correlation().
+
+    Returns:
+        The tuple of results of cross_correlation(), one per subject, in order.
+    """
+    spectra = {}
+    return tuple(
+        _cross_correlation(
+            reference, subject, verbose=verbose, max_lag=max_lag, spectra=spectra
+        )
+        for subject in subjects
+    )
+
+
+def _cross_correlation(reference, subject, *, verbose, max_lag, spectra=None):
+    """Returns the cross_correlation(), with the reference transforms of
+    spectra, see _correlate_full().
+    """
+    if max_lag is not None and max_lag < 0:
+        raise ValueError("max_lag must be zero or greater")
 
     if verbose:
         print("\nThis is xymodel.cross_correlation...")
@@ -59,23 +494,29 @@ def cross_correlation(reference, subject, verbose=False):
 
     y_span = np.interp(t_span, subject[:, 0], subject[:, 1], left=0.0, right=0.0)
 
-    cross_corr = np.correlate(ref_y_span, y_span, mode="full")
-    cross_corr_max = np.max(cross_corr)
-
-    cross_corr_unit = np.correlate(
-        ref_y_span / np.linalg.norm(ref_y_span),
-        y_span / np.linalg.norm(y_span),
-        mode="full",
+    cross_corr = _correlate_full(
+        ref_y_span, y_span, spectra=spectra, key=(T_MIN, DT, n_samples)
     )
 
-    ref_self_corr = np.correlate(ref_y_span, ref_y_span)[0]  # self correlated reference
+    # the shifts searched, index n_samples - 1 is no shift
+    lo, hi = 0, len(cross_corr)
+    if max_lag is not None:
+        n_lag = min(int(max_lag / DT * (1.0 + 1.0e-12)), n_samples - 1)
+        lo, hi = n_samples - 1 - n_lag, n_samples + n_lag
+
+    # the first of the largest values, within the round off of the transform
+    cross_corr_max = np.max(cross_corr[lo:hi])
+    ref_norm = np.linalg.norm(ref_y_span)
+    y_norm = np.linalg.norm(y_span)
+    tol = 1.0e-10 * ref_norm * y_norm
+    offset_index = lo + np.flatnonzero(cross_corr[lo:hi] >= cross_corr_max - tol)[0]
+
+    ref_self_corr = ref_norm**2  # self correlated reference
     rel_corr_error = 0.0
 
     if ref_self_corr > 0:
         rel_corr_error = abs(cross_corr_max - ref_self_corr) / ref_self_corr
 
-    offset_index = np.argmax(cross_corr)
-
     # shift time full-left, then incrementally to the right
     # t_shift = t_span - t_span[-1] + t_span[offset_index]  # nope!
     # t_shift = t_span - t_span[-1] + offset_index * DT  # bug! should shift to t0 referance signal
@@ -102,6 +543,9 @@ def cross_correlation(reference, subject, verbose=False):
         print(f"  Sliding dot product (cross-correlation): {cross_corr}")
         print(f"  Length of the sliding dot product: {len(cross_corr)}")
         print(f"  Max sliding dot product (cross-correlation): {cross_corr_max}")
+        # normalized signals, from the same transform
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross_corr_unit = cross_corr / (ref_norm * y_norm)
         print(
             f"  Sliding dot product of normalized signals (cross-correlation): {cross_corr_unit}"
         )
@@ -144,6 +588,13 @@ class XYModel(XYBase):
         self._skip_rows_footer = kwargs.get("skip_rows_footer", 0)
         self._xcolumn = kwargs.get("xcolumn", 0)  # default to the 1st column
         self._ycolumn = kwargs.get("ycolumn", 1)  # default to the 2nd column
+        self._loader = kwargs.get("loader", "genfromtxt")  # or "fast"
+        self._sidecar = kwargs.get("sidecar", 0)  # default is no binary sidecar
+
+        if self._loader not in LOADERS:
+            print(f'Error: keyword "loader" value "{self._loader}" is not one of:')
+            print(LOADERS)
+            raise KeyError("loader not found")
 
         # relative to current run location
         # rel_path_and_file = os.path.join(self._folder, self._file)
@@ -155,14 +606,6 @@ class XYModel(XYBase):
         #     skip_footer=self._skip_rows_footer,
         #     usecols=(self._xcolumn, self._ycolumn),
         # )
-        self._data = np.genfromtxt(
-            self._path_file_input,
-            dtype="float",
-            delimiter=",",
-            skip_header=self._skip_rows,
-            skip_footer=self._skip_rows_footer,
-            usecols=(self._xcolumn, self._ycolumn),
-        )
 
         # default value if plot_kwargs not client-supplied
         default = {"linewidth": 2.0, "linestyle": "-"}
@@ -175,21 +618,75 @@ class XYModel(XYBase):
 
         self._signal_process = kwargs.get("signal_process", None)
 
-        if self._signal_process:
-            for process_id in self._signal_process:
-                process_dict = self._signal_process.get(process_id)
-                key = next(iter(process_dict))
-                value = process_dict[key]
+        steps = []  # the (key, value) of each signal process, in order
+        for process_id in self._signal_process or {}:
+            process_dict = self._signal_process.get(process_id)
+            key = next(iter(process_dict))
+            steps.append((key, process_dict[key]))
+
+        # the cache holds the data after each prefix of the signal processes,
+        # so processing resumes after the longest prefix already cached
+        read_options = {
+            "skip_header": self._skip_rows,
+            "skip_footer": self._skip_rows_footer,
+            "usecols": (self._xcolumn, self._ycolumn),
+            "loader": self._loader,
+        }
+        cache_keys = []
+        if MODEL_CACHE.enabled:
+            cache_keys = [
+                MODEL_CACHE.key(
+                    path_file=self._path_file_input,
+                    read_options=read_options,
+                    steps=steps[:k],
+                )
+                for k in range(len(steps) + 1)
+            ]
+
+        self._data, start, replays = None, 0, []
+        for start in range(len(cache_keys) - 1, -1, -1):
+            self._data = MODEL_CACHE.load(cache_keys[start])
+            if self._data is not None:
+                # the cached data of each skipped step that is serialized
+                replays = [
+                    (value, MODEL_CACHE.load(cache_keys[k + 1]))
+                    for k, (_, value) in enumerate(steps[:start])
+                    if value.get("serialize", 0)
+                ]
+                if all(data is not None for _, data in replays):
+                    break
+                self._data = None  # an incomplete entry, so process it all
+
+        if self._data is None:
+            # a copy, since signal processes overwrite the data
+            start, replays = 0, []
+            self._data = load_columns(
+                self._path_file_input, sidecar=bool(self._sidecar), **read_options
+            ).copy()
+            if cache_keys:
+                MODEL_CACHE.save(cache_keys[0], self._data)
+        elif self._verbose:
+            print(f"  Loaded {start} signal process(es) from cache.")
+
+        # serialize the cached steps as if they were processed
+        data = self._data
+        for value, self._data in replays:
+            self._serialize_step(value)
+        self._data = data
+
+        for k, (key, value) in enumerate(steps[start:], start=start):
+            try:
+                method = getattr(self, key)
+                method(value)
+            except AttributeError as error:
+                print(f"Error: invalid signal process key: {key}")
+                print(error.__class__.__name__)
 
-                try:
-                    method = getattr(self, key)
-                    method(value)
-                except AttributeError as error:
-                    print(f"Error: invalid signal process key: {key}")
-                    print(error.__class__.__name__)
+            if cache_keys:
+                MODEL_CACHE.save(cache_keys[k + 1], self._data)
 
-                if self._verbose:
-                    print('  Signal process "' + key + '" completed.')
+            if self._verbose:
+                print('  Signal process "' + key + '" completed.')
 
     @property
     def x(self):
@@ -217,6 +714,19 @@ class XYModel(XYBase):
         if self._verbose:
             print(f"  Serialized model to: {self._path_file_output}")
 
+    def _serialize_step(self, value):
+        """Serializes the data after a signal process, if its value requests it."""
+        serialize = value.get("serialize", 0)  # default is not to serialize
+        if serialize:
+            folder = value.get("folder", ".")  # default to current folder
+            file_output = value.get("file", None)
+
+            if file_output is None:
+                print('Error: keyword "file" not found.')
+                sys.exit("Abnormal termination.")
+            else:
+                self.serialize(folder, file_output)
+
     def butterworth(self, value):
 
         fc = value.get("cutoff", None)  # Hz, cutoff frequency
@@ -257,16 +767,7 @@ class XYModel(XYBase):
         yfiltered = signal.filtfilt(b, a, self._data[:, 1])
         self._data[:, 1] = yfiltered  # overwrite
 
-        serialize = value.get("serialize", 0)  # default is not to serialize
-        if serialize:
-            folder = value.get("folder", ".")  # default to current folder
-            file_output = value.get("file", None)
-
-            if file_output is None:
-                print('Error: keyword "file" not found.')
-                sys.exit("Abnormal termination.")
-            else:
-                self.serialize(folder, file_output)
+        self._serialize_step(value)
 
     def correlation(self, value):
 
@@ -296,33 +797,27 @@ class XYModel(XYBase):
         ref_skip_rows_footer = reference.get("skip_rows_footer", 0)
         ref_xcolumn = reference.get("xcolumn", 0)  # default to the 1st column
         ref_ycolumn = reference.get("ycolumn", 1)  # default to the 2nd column
+        ref_loader = reference.get("loader", self._loader)  # default to the model's
+        ref_sidecar = reference.get("sidecar", self._sidecar)
 
-        ref_data = np.genfromtxt(
+        ref_data = load_columns(
             ref_path_file_input,
-            dtype="float",
-            delimiter=",",
             skip_header=ref_skip_rows,
             skip_footer=ref_skip_rows_footer,
             usecols=(ref_xcolumn, ref_ycolumn),
+            loader=ref_loader,
+            sidecar=bool(ref_sidecar),
         )
 
+        max_lag = value.get("max_lag", None)  # default is to search all shifts
+
         tcorrelated, ycorrelated, cc_relative_error, L2_error = cross_correlation(
-            ref_data, self._data, verbose=verbosity
+            ref_data, self._data, verbose=verbosity, max_lag=max_lag
         )
 
         self._data = np.transpose([tcorrelated, ycorrelated])  # overwrite
 
-        serialize = value.get("serialize", 0)  # default is not to serialize
-        if serialize:
-            folder = value.get("folder", ".")  # default to current folder
-            file_output = value.get("file", None)
-
-            if file_output is None:
-                print('Error: keyword "file" not found.')
-                sys.exit("Abnormal termination.")
-            else:
-                # self.serialize(folder, file_output, header=corr_str)
-                self.serialize(folder, file_output)
+        self._serialize_step(value)
 
     def gradient(self, value):
 
@@ -345,16 +840,7 @@ class XYModel(XYBase):
             if self._verbose:
                 print(f"  Derivative {k + 1} completed.")
 
-        serialize = value.get("serialize", 0)  # default is not to serialize
-        if serialize:
-            folder = value.get("folder", ".")  # default to current folder
-            file_output = value.get("file", None)
-
-            if file_output is None:
-                print('Error: keyword "file" not found.')
-                sys.exit("Abnormal termination.")
-            else:
-                self.serialize(folder, file_output)
+        self._serialize_step(value)
 
     def integration(self, value):
 
@@ -399,16 +885,7 @@ class XYModel(XYBase):
             self._data[:, 1] = inty  # overwrite
             print(f"  Integral {k + 1} completed.")
 
-        serialize = value.get("serialize", 0)  # default is not to serialize
-        if serialize:
-            folder = value.get("folder", ".")  # default to current folder
-            file_output = value.get("file", None)
-
-            if file_output is None:
-                print('Error: keyword "file" not found.')
-                sys.exit("Abnormal termination.")
-            else:
-                self.serialize(folder, file_output)
+        self._serialize_step(value)
 
 
 class XYModelAbaqus(XYBase):
@@ -426,76 +903,18 @@ class XYModelAbaqus(XYBase):
             print(self._file_pathlib)
             raise KeyError("file not found")
 
-        with open(str(self._file_pathlib), "rt") as f:
-            self._nodes = tuple()
-            self._elements = tuple()
-            # nice ref: https://www.pythontutorial.net/python-basics/python-read-text-file/
-            try:
-                # lines = f.readlines()
-
-                # for line in f:
-                line = f.readline()
-
-                while line:
-                    if "*NODE" in line or "*Node" in line:
-                        # collect all nodes
-                        line = f.readline()  # get the next line
-                        while "*" not in line:
-                            line = line.split(",")
-                            # assume a 3D format even for planar problems, and catch
-                            # exceptions as needed
-                            try:
-                                new_nodes = (
-                                    tuple(
-                                        [
-                                            float(eval(line[1])),
-                                            float(eval(line[2])),
-                                            float(eval(line[3])),
-                                        ]
-                                    ),
-                                )
-                            except (
-                                IndexError
-                            ):  # handle 2D input files, append 0.0 as z coordinate
-                                new_nodes = (
-                                    tuple(
-                                        [
-                                            float(eval(line[1])),
-                                            float(eval(line[2])),
-                                            0.0,
-                                        ]
-                                    ),
-                                )
-
-                            self._nodes = self._nodes + new_nodes
-                            # print(self._nodes)
-                            line = f.readline()
-                        # print(line)
-                    elif "*ELEMENT" in line or "*Element" in line:
-                        # collect all elements
-                        line = f.readline()  # get the next line
-                        while "*" not in line and len(line) > 0:
-                            line = line.split(",")
-                            new_element = (
-                                tuple(
-                                    [
-                                        int(line[1]),
-                                        int(line[2]),
-                                        int(line[3]),
-                                        int(line[4]),
-                                    ]
-                                ),
-                            )
-                            self._elements = self._elements + new_element
-                            # print(self._elements)
-                            line = f.readline()
-                    else:
-                        line = f.readline()
-
-                print(f"Finished reading file: {self._file_pathlib}")
-
-            except OSError:
-                print(f"Cannot read file: {self._file_pathlib}")
+        try:
+            node_ids, xyz, elements = read_abaqus_mesh(self._file_pathlib)
+        except (OSError, ValueError) as error:
+            print(f"Cannot read file: {self._file_pathlib}")
+            raise OSError(str(error)) from error
+
+        self._node_ids = node_ids  # generally nonsequential
+        self._coordinates = xyz
+        self._nodes = tuple(map(tuple, xyz.tolist()))
+        self._elements = tuple(map(tuple, elements.tolist()))
+
+        print(f"Finished reading file: {self._file_pathlib}")
 
         # default value if plot_kwargs not client-supplied
         # default = {"linewidth": 2.0, "linestyle": "solid", "color": "black", }
@@ -1,12 +1,14 @@
 # https://www.python.org/dev/peps/pep-0008/#imports
 # standard library imports
-import os
 from datetime import datetime
+import getpass
 from pathlib import Path
 import socket
 
 # related third-party imports
+from matplotlib.collections import PolyCollection
 import matplotlib.pyplot as plt
+import numpy as np
 from PIL import Image
 from tzlocal import get_localzone
 
@@ -16,6 +18,86 @@ from tzlocal import get_localzone
 from xyfigure.xybase import XYBase
 
 
+def face_vertices(*, coordinates, faces, node_ids=None, pad=-1):
+    """Returns the (x, y) vertices of the faces of a mesh, as
+    ptg.view_mesh.face_vertices() does, without a dependency on ptg.  The two
+    are tested together in cli/tests/test_abaqus.py.
+
+    Args:
+        coordinates: The (n_nodes, >= 2) nodal coordinates, of which the first
+            two columns are x and y.
+        faces: The (n_faces, n) nodes of each face.
+        node_ids: The (n_nodes,) node number of each row of coordinates,
+            generally nonsequential.  Default is None, in which case the faces
+            are zero-based row indices of the coordinates.
+        pad: The value that pads faces with fewer than n nodes, e.g., a
+            triangle among quadrilaterals.  A pad repeats the last node of its
+            face, which does not change how the face is drawn.  Default is
+            negative one (-1).  None if the faces have no padding.
+
+    Returns:
+        The (n_faces, n, 2) vertices of the faces.
+
+    Raises:
+        KeyError if a node number is not in node_ids.
+        ValueError if a face starts with a pad.
+    """
+    if np.size(faces) == 0:
+        return np.zeros((0, 0, 2))
+
+    xy = np.asarray(coordinates, dtype=np.float64)[:, 0:2]
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, np.shape(faces)[-1])
+
+    if pad is not None:
+        padded = faces == pad
+        if np.any(padded):
+            if np.any(padded[:, 0]):
+                raise ValueError("Error: a face must not start with a pad.")
+            # the column of the last node that is not a pad, in each position
+            columns = np.where(padded, 0, np.arange(faces.shape[1]))
+            np.maximum.accumulate(columns, axis=1, out=columns)
+            faces = np.take_along_axis(faces, columns, axis=1)
+
+    if node_ids is None:
+        rows = faces
+    else:
+        # the row of each node number, found among the sorted node numbers
+        ids = np.asarray(node_ids, dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        if sorted_ids.size == 0:
+            raise KeyError("Error: no node numbers are defined.")
+
+        positions = np.minimum(np.searchsorted(sorted_ids, faces), ids.size - 1)
+        missing = sorted_ids[positions] != faces
+        if np.any(missing):
+            raise KeyError(f"Error: undefined node number(s): {faces[missing][:10]}")
+        rows = order[positions]
+
+    return xy[rows]
+
+
+def face_collection(*, coordinates, faces, node_ids=None, pad=-1, **kwargs):
+    """Returns the faces of a mesh as a single PolyCollection, rather than one
+    artist per face, so figures of large meshes are created quickly.
+
+    Args:
+        coordinates, faces, node_ids, pad: The mesh, see face_vertices().
+        kwargs: The matplotlib properties of the faces, e.g., facecolor.
+
+    Returns:
+        The faces, to be added to an axis with ax.add_collection().
+
+    Raises:
+        KeyError if a node number of a face is not in node_ids.
+        ValueError if a face starts with a pad.
+    """
+    vertices = face_vertices(
+        coordinates=coordinates, faces=faces, node_ids=node_ids, pad=pad
+    )
+    return PolyCollection(vertices, closed=True, **kwargs)
+
+
 class XYViewBase(XYBase):
     """The base class used by all XYViews."""
 
@@ -260,7 +342,7 @@ class XYView(XYViewBase):
                 # Format the date and time stamp
                 timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S %Z%z")
 
-                user = str(os.getlogin())
+                user = getpass.getuser()  # os.getlogin() needs a terminal
                 # host = str(os.getenv("HOSTNAME"))
                 host = socket.gethostname()
                 details_str = (
@@ -354,28 +436,22 @@ class XYViewAbaqus(XYViewBase):
                 print("  Figure size set to " + str(self._size) + " inches.")
 
             for model in self._models:
-                xs, ys, _ = zip(*model._nodes)
-
-                for face in model._elements:
-                    xf = tuple(xs[k - 1] for k in face)  # 1-base index to 0-base index
-                    yf = tuple(ys[k - 1] for k in face)
-                    # plt.fill(
-                    #     xf,
-                    #     yf,
-                    #     linestyle="dotted",
-                    #     edgecolor="magenta",
-                    #     alpha=0.5,
-                    #     facecolor="gray",
-                    # )
-                    plt.fill(
-                        xf,
-                        yf,
+                # all faces of the model as a single collection, with the node
+                # numbers of the .inp file, which are generally nonsequential
+                ax.add_collection(
+                    face_collection(
+                        coordinates=model._coordinates,
+                        faces=model._elements,
+                        node_ids=model._node_ids,
+                        pad=None,
                         alpha=model._alpha,
                         edgecolor=model._edgecolor,
                         facecolor=model._facecolor,
                         linestyle=model._linestyle,
                         linewidth=model._linewidth,
                     )
+                )
+            ax.autoscale_view()
 
             if self._xticks:
                 ax.set_xticks(self._xticks)
@@ -0,0 +1,41 @@
+"""This module configures pytest for all xyfigure tests."""
+
+import matplotlib
+import pytest
+
+import xyfigure.xymodel as xm
+
+
+@pytest.fixture(autouse=True)
+def model_cache(tmp_path, monkeypatch):
+    """Isolates each test from the user's model cache, with an empty cache in a
+    temporary folder, so signal processes are always run, not read from cache.
+    """
+    cache = xm.ModelCache(folder=tmp_path.joinpath("model_cache"))
+    monkeypatch.setattr(xm, "MODEL_CACHE", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def default_rc_params():
+    """Runs each test with the default rcParams, e.g., not the usetex of an
+    earlier test in the same session, and restores them after.
+    """
+    with matplotlib.rc_context():
+        matplotlib.rcdefaults()
+        yield
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -17,6 +17,8 @@ from unittest import TestCase, main
 # import xyfigure.code.client as client
 import xyfigure.client as client
 from xyfigure.xymodel import cross_correlation as xycc
+from xyfigure.xymodel import cross_correlation_batch as xycc_batch
+from xyfigure.xymodel import _correlate_full
 
 
 class XYModelCrossCorrelation(TestCase):
@@ -447,6 +449,56 @@ class XYModelCrossCorrelation(TestCase):
         self.assertLess(abs(known_cc_rel_error - cc_rel_error), self.TOL)
         self.assertLess(abs(known_L2_error - L2_error), self.TOL)
 
+    def test_030_fft_matches_sliding_dot_product(self):
+        rng = np.random.default_rng(seed=42)
+        for n in (1, 2, 7, 64, 101):
+            a, b = rng.normal(size=n), rng.normal(size=n)
+            known = np.correlate(a, b, mode="full")
+            calculated = _correlate_full(a, b)
+            self.assertTrue(self.same(known, calculated))
+
+    def test_031_max_lag(self):
+        ref_t = [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        ref_y = [0.0, 1.0, 0.0, 0.0, 0.0, 2.0, 0.0]  # small hat at 1, tall at 5
+        reference = np.transpose([ref_t, ref_y])
+
+        sub_t = [1.0, 2.0, 3.0]
+        sub_y = [0.0, 1.0, 0.0]  # hat at 2
+        subject = np.transpose([sub_t, sub_y])
+
+        # all shifts, so the subject moves to the tall hat at 5
+        calculated_t, calculated_y, _, _ = xycc(reference, subject)
+        self.assertAlmostEqual(calculated_t[np.argmax(calculated_y)], 5.0)
+
+        # shifts of at most 1.5, so the subject moves to the small hat at 1
+        calculated_t, calculated_y, _, _ = xycc(reference, subject, max_lag=1.5)
+        self.assertAlmostEqual(calculated_t[np.argmax(calculated_y)], 1.0)
+
+        # no shift
+        calculated_t, calculated_y, _, _ = xycc(reference, subject, max_lag=0.0)
+        self.assertAlmostEqual(calculated_t[np.argmax(calculated_y)], 2.0)
+
+        with self.assertRaises(ValueError):
+            xycc(reference, subject, max_lag=-1.0)
+
+    def test_032_batch(self):
+        ref_t = [0.0, 0.5, 1.0, 1.5, 2.0]
+        ref_y = [0.0, 0.5, 1.0, 0.5, 0.0]  # hat at 1
+        reference = np.transpose([ref_t, ref_y])
+
+        subjects = (
+            np.transpose([[1.0, 2.0, 3.0], [0.0, 1.0, 0.0]]),  # hat at 2
+            np.transpose([[-1.0, 0.0, 1.0], [0.0, 1.0, 0.0]]),  # hat at 0
+            np.transpose([[1.0, 2.0, 3.0], [0.0, 2.0, 0.0]]),  # tall hat at 2
+        )
+
+        results = xycc_batch(reference, subjects, max_lag=2.0)
+        self.assertEqual(len(results), len(subjects))
+        for subject, result in zip(subjects, results):
+            known = xycc(reference, subject, max_lag=2.0)
+            for a, b in zip(known, result):
+                self.assertTrue(self.same(np.asarray(a), np.asarray(b)))
+
 
 # retain main for debugging this file in VS code
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+"""This module tests the ABAQUS model and view of xyfigure, which need no other
+package of sibl.
+
+Example:
+> conda activate siblenv
+> cd ~/sibl
+> pytest cli/tests/test_abaqus.py -v
+"""
+
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+
+import xyfigure.command_line as cl
+from xyfigure.xymodel import XYModelAbaqus, read_abaqus_mesh
+
+matplotlib.use("Agg")
+
+# two quadrilaterals, with nonsequential node numbers and 2D coordinates, and
+# the second element continued on the next line
+MESH = """********************************** N O D E S **********************************
+*NODE, NSET=ALLNODES
+10,   1.0,   2.0
+20,   2.0,   2.0
+30,   3.0,   2.0
+40,   1.0,   4.0
+50,   2.0,   4.0
+60,   3.0,   4.0
+********************************** E L E M E N T S ****************************
+*ELEMENT, TYPE=CPE4, ELSET=EB1
+1,   10,   20,   50,  40
+2,   20,   30,
+    60,  50
+*NSET, NSET=LEFT
+10, 40
+"""
+
+RECIPE = """mesh:
+  class: model_abaqus
+  folder: {folder}
+  file: mesh.inp
+  verbose: 0
+figure:
+  class: view_abaqus
+  folder: {folder}
+  file: mesh.png
+  display: 0
+  serialize: 1
+  verbose: 0
+"""
+
+
+def test_read_abaqus_mesh(tmp_path):
+    path = tmp_path.joinpath("mesh.inp")
+    path.write_text(MESH)
+    node_ids, coordinates, elements = read_abaqus_mesh(path)
+    assert np.array_equal(node_ids, (10, 20, 30, 40, 50, 60))
+    assert coordinates.shape == (6, 3)
+    assert np.array_equal(coordinates[4], (2.0, 4.0, 0.0))
+    assert np.array_equal(elements, ((10, 20, 50, 40), (20, 30, 60, 50)))
+
+    path.write_text(MESH.replace("40,   1.0", "40,   one"))
+    with pytest.raises(ValueError):
+        read_abaqus_mesh(path)
+
+    path.write_text(MESH)
+    model = XYModelAbaqus("mesh", folder=str(tmp_path), file="mesh.inp")
+    assert model._nodes[0] == (1.0, 2.0, 0.0)
+    assert model._elements[1] == (20, 30, 60, 50)
+
+
+MESHES = sorted(
+    Path(__file__).resolve().parents[2].joinpath("geo", "data", "mesh").glob("*.inp")
+)
+
+
+@pytest.mark.parametrize("path", MESHES, ids=[p.name for p in MESHES])
+def test_read_abaqus_mesh_as_ptg(path):
+    """The reader of xyfigure reads nodes and elements as the reader of ptg."""
+    abaqus = pytest.importorskip("ptg.abaqus")
+    try:
+        inp = abaqus.read_inp(pathfile=str(path), keywords=("NODE", "ELEMENT"))
+    except ValueError:
+        with pytest.raises(ValueError):
+            read_abaqus_mesh(path)
+        return
+
+    node_ids, coordinates, elements = read_abaqus_mesh(path)
+    assert np.array_equal(node_ids, inp.node_ids)
+    n_dimensions = min(inp.coordinates.shape[1], 3)
+    assert np.array_equal(coordinates[:, :n_dimensions], inp.coordinates[:, :3])
+    assert not np.any(coordinates[:, n_dimensions:])
+    blocks = [b.connectivity[:, :4] for b in inp.element_blocks]
+    assert np.array_equal(elements, np.concatenate(blocks) if blocks else elements)
+
+
+# xyfigure draws faces as ptg does, without a dependency on ptg, so both
+# implementations are tested together, and cannot drift apart
+VIEWS = ("xyfigure.xyview", "ptg.view_mesh")
+
+
+@pytest.mark.parametrize("module", VIEWS)
+def test_face_vertices(module):
+    """Given a quad and a triangle, padded with -1, on nonsequential node numbers,
+    the vertices are gathered by node number, and the pad repeats the last node.
+    """
+    face_vertices = pytest.importorskip(module).face_vertices
+    coordinates = ((0.0, 0.0, 9.0), (1.0, 0.0, 9.0), (1.0, 1.0, 9.0), (0.0, 1.0, 9.0))
+    node_ids = (10, 30, 20, 40)  # not in sorted order
+    faces = ((10, 30, 20, 40), (30, 40, 10, -1))
+    v = face_vertices(coordinates=coordinates, faces=faces, node_ids=node_ids)
+    assert v.shape == (2, 4, 2)
+    assert np.array_equal(v[0], ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)))
+    assert np.array_equal(v[1], ((1.0, 0.0), (0.0, 1.0), (0.0, 0.0), (0.0, 0.0)))
+
+    # two pads, and a single face
+    v = face_vertices(
+        coordinates=coordinates, faces=(20, 10, -1, -1), node_ids=node_ids
+    )
+    assert np.array_equal(v[0], ((1.0, 1.0), (0.0, 0.0), (0.0, 0.0), (0.0, 0.0)))
+
+    # zero-based rows, without padding
+    v = face_vertices(coordinates=coordinates, faces=((0, 1, 2, 3),), pad=None)
+    assert np.array_equal(v[0], np.array(coordinates)[:, 0:2])
+
+    # no faces
+    assert face_vertices(coordinates=(), faces=(), node_ids=()).shape[0] == 0
+
+    with pytest.raises(KeyError):
+        face_vertices(coordinates=coordinates, faces=((10, 30, 50),), node_ids=node_ids)
+    with pytest.raises(KeyError):
+        face_vertices(coordinates=coordinates, faces=((10, 30, 20),), node_ids=())
+    with pytest.raises(ValueError):
+        face_vertices(coordinates=coordinates, faces=((-1, 0, 1),))
+
+
+@pytest.mark.parametrize("module", VIEWS)
+def test_face_collection(module):
+    face_collection = pytest.importorskip(module).face_collection
+    coordinates = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (2.0, 0.0))
+    node_ids = (7, 3, 9, 1, 5)
+    faces = ((7, 3, 9, 1), (3, 5, 9, -1))
+    collection = face_collection(
+        coordinates=coordinates, faces=faces, node_ids=node_ids, facecolor="white"
+    )
+    paths = collection.get_paths()
+    assert len(paths) == 2
+    assert np.array_equal(paths[0].vertices[:4], coordinates[:4])
+    assert np.array_equal(paths[1].vertices[:4], ((1, 0), (2, 0), (1, 1), (1, 1)))
+    assert np.allclose(collection.get_facecolor(), (1.0, 1.0, 1.0, 1.0))
+
+    assert len(face_collection(coordinates=(), faces=(), node_ids=()).get_paths()) == 0
+    with pytest.raises(KeyError):
+        face_collection(
+            coordinates=coordinates, faces=((7, 3, 9, 2),), node_ids=node_ids
+        )
+
+
+def test_abaqus_recipe(tmp_path):
+    tmp_path.joinpath("mesh.inp").write_text(MESH)
+    recipe = tmp_path.joinpath("recipe.yml")
+    recipe.write_text(RECIPE.format(folder=tmp_path))
+    assert cl.process(yml_path_file=Path(recipe))
+    assert tmp_path.joinpath("mesh.png").is_file()
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,229 @@
+"""This module tests the batch mode of the `xyfigure.command_line.py` module,
+and the loading of model data it shares across recipes.
+
+Example:
+> conda activate siblenv
+> cd ~/sibl
+> pytest cli/tests/test_command_line.py -v
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import os
+from pathlib import Path
+import shutil
+import stat
+
+import matplotlib
+import numpy as np
+import pytest
+
+import xyfigure.command_line as cl
+import xyfigure.xymodel as xm
+from xyfigure.xymodel import _COLUMNS_LOADED, load_columns, sidecar_path
+
+matplotlib.use("Agg")
+
+DATA = Path(__file__).resolve().parent.joinpath("differentiation", "u-squared.csv")
+
+RECIPE = """model:
+  class: model
+  folder: {folder}
+  file: u-squared.csv
+  skip_rows: 1
+view:
+  class: view
+  folder: {folder}
+  file: {figure}
+  display: 0
+  serialize: 1
+"""
+
+
+def recipes(folder: Path, n: int) -> tuple[Path, ...]:
+    """Writes n recipes that plot the same data file to n figures."""
+    shutil.copy(DATA, folder)
+    paths = []
+    for k in range(n):
+        path = folder.joinpath(f"recipe_{k}.yml")
+        path.write_text(RECIPE.format(folder=folder, figure=f"figure_{k}.png"))
+        paths.append(path)
+    return tuple(paths)
+
+
+def test_recipe_paths(tmp_path):
+    paths = recipes(tmp_path, 3)
+    found = cl.recipe_paths([str(tmp_path.joinpath("recipe_*.yml")), "missing.yml"])
+    assert found == paths + (Path("missing.yml"),)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_process_batch(tmp_path, workers):
+    paths = recipes(tmp_path, 3)
+    defective = tmp_path.joinpath("defective.yml")
+    defective.write_text(RECIPE.format(folder=tmp_path / "nope", figure="x.png"))
+
+    results = cl.process_batch(
+        yml_path_files=paths + (defective, tmp_path / "missing.yml"), workers=workers
+    )
+    assert [r.processed for r in results] == [True, True, True, False, False]
+    assert all(r.seconds > 0.0 for r in results)
+    assert all(tmp_path.joinpath(f"figure_{k}.png").is_file() for k in range(3))
+    assert "folder not found" in results[3].error
+    assert "missing.yml" in results[4].error
+
+    summary = cl.report(results)
+    assert "3 of 5 recipe(s) processed, 2 failed" in summary
+
+    with pytest.raises(ValueError):
+        cl.process_batch(yml_path_files=paths, workers=0)
+
+
+def test_process_batch_spawn(tmp_path, model_cache, monkeypatch):
+    """A spawned worker uses the model cache folder of the caller."""
+    monkeypatch.setenv("XYFIGURE_CACHE", str(tmp_path.joinpath("environment")))
+    spawn = multiprocessing.get_context("spawn")
+    monkeypatch.setattr(
+        cl,
+        "ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=spawn),
+    )
+    results = cl.process_batch(yml_path_files=recipes(tmp_path, 2), workers=2)
+    assert all(r.processed for r in results)
+    assert list(model_cache.folder.glob("*.npy"))
+    assert not tmp_path.joinpath("environment").exists()
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_process_batch_rc_params(tmp_path, workers):
+    """A recipe does not change the rcParams of later recipes, or the caller."""
+    paths = recipes(tmp_path, 3)
+    latex = paths[0].read_text().replace("  display: 0", "  display: 0\n  latex: 1")
+    paths[0].write_text(latex)
+
+    # the caller's rcParams, e.g., from an earlier figure, are not used
+    with matplotlib.rc_context({"text.usetex": True}):
+        results = cl.process_batch(yml_path_files=paths, workers=workers)
+        assert matplotlib.rcParams["text.usetex"]
+
+    # the latex recipe needs a TeX installation, the others do not
+    assert [r.processed for r in results[1:]] == [True, True]
+    assert not matplotlib.rcParams["text.usetex"]
+
+
+def test_load_columns_shared(tmp_path):
+    """A data file is read once, and read again only after it changes."""
+    shutil.copy(DATA, tmp_path)
+    path = tmp_path.joinpath("u-squared.csv")
+    a = load_columns(path, skip_header=1)
+    assert load_columns(str(path), skip_header=1) is a
+    assert not a.flags.writeable
+    assert load_columns(path, skip_header=2) is not a
+
+    path.write_text(path.read_text() + "100.0, 10000.0\n")
+    b = load_columns(path, skip_header=1)
+    assert len(b) == len(a) + 1
+
+
+FOOTED = """time,x,y
+# some comment
+0.0,1.0,10.0
+1.0,2.0,20.0
+
+2.0,3.0,30.0
+end of data
+summary,1,2
+"""
+
+
+@pytest.mark.parametrize("skip_footer", (0, 2))
+def test_load_columns_fast(tmp_path, skip_footer):
+    path = tmp_path.joinpath("footed.csv")
+    path.write_text(FOOTED if skip_footer else FOOTED.rsplit("end", 1)[0])
+    options = dict(skip_header=1, skip_footer=skip_footer, usecols=(0, 2))
+    slow = load_columns(path, **options)
+    fast = load_columns(path, loader="fast", **options)
+    assert np.array_equal(fast, slow)
+    assert np.array_equal(fast, [[0.0, 10.0], [1.0, 20.0], [2.0, 30.0]])
+    assert not fast.flags.writeable
+
+    with pytest.raises(ValueError):
+        load_columns(path, loader="slow", **options)
+
+
+def test_load_columns_fast_all_footer(tmp_path):
+    path = tmp_path.joinpath("footer.csv")
+    path.write_text("x,y\n0.0,1.0\n\n# comment\nend of data\n")
+    fast = load_columns(path, skip_header=1, skip_footer=2, loader="fast")
+    assert fast.shape == (0, 2)
+
+
+def test_load_columns_sidecar(tmp_path):
+    path = tmp_path.joinpath("u-squared.csv")
+    shutil.copy(DATA, path)
+    data = load_columns(path, skip_header=1, loader="fast", sidecar=True)
+    side = sidecar_path(path, skip_header=1)
+    assert side.is_file()
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(side.stat().st_mode) == 0o666 & ~umask
+
+    # a new process memory maps the sidecar, rather than parse the file
+    _COLUMNS_LOADED.clear()
+    mapped = load_columns(path, skip_header=1, loader="fast", sidecar=True)
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(mapped, data)
+
+    # a modified file is parsed, and its sidecar replaced, even when the file
+    # keeps an older modification time, as after cp -p, rsync -t, or tar
+    before = path.stat()
+    path.write_text("x,y\n0.0,1.0\n1.0,2.0\n")
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns - 10**9))
+    _COLUMNS_LOADED.clear()
+    assert np.array_equal(
+        load_columns(path, skip_header=1, loader="fast", sidecar=True),
+        [[0.0, 1.0], [1.0, 2.0]],
+    )
+    assert not side.exists()
+    side = sidecar_path(path, skip_header=1)
+    assert np.array_equal(np.load(side), [[0.0, 1.0], [1.0, 2.0]])
+
+    # the sidecar of other rows is kept
+    load_columns(path, skip_header=2, loader="fast", sidecar=True)
+    assert side.is_file()
+    assert len(list(tmp_path.glob("u-squared.csv.*.npy"))) == 2
+
+
+def test_load_columns_evicted(tmp_path, monkeypatch):
+    """The least recently used columns are evicted beyond the memo's bound."""
+    monkeypatch.setattr(xm, "COLUMNS_LOADED_BYTES", 0)
+    path = tmp_path.joinpath("u-squared.csv")
+    shutil.copy(DATA, path)
+    a = load_columns(path, skip_header=1)
+    assert load_columns(path, skip_header=1) is not a  # too large to keep
+
+    monkeypatch.setattr(xm, "COLUMNS_LOADED_BYTES", 2 * a.nbytes)
+    _COLUMNS_LOADED.clear()
+    a = load_columns(path, skip_header=1)
+    b = load_columns(path, skip_header=2)
+    assert load_columns(path, skip_header=1) is a  # a is now most recent
+    load_columns(path, skip_header=3)  # evicts b
+    assert len(_COLUMNS_LOADED) == 2
+    assert load_columns(path, skip_header=1) is a
+    assert load_columns(path, skip_header=2) is not b
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,127 @@
+"""This module tests the on disk cache of model data of the `xyfigure.xymodel.py`
+module.
+
+Example:
+> conda activate siblenv
+> cd ~/sibl
+> pytest cli/tests/test_xymodel_cache.py -v
+"""
+
+from pathlib import Path
+import shutil
+
+import numpy as np
+
+import xyfigure.xymodel as xm
+
+DATA = Path(__file__).resolve().parent.joinpath("differentiation", "u-squared.csv")
+
+
+def model(folder: Path, *, order: int = 1, serialize: int = 0) -> xm.XYModel:
+    """Returns the derivative of the data, with the signal process serialized
+    to gradient.csv if serialize is 1.
+    """
+    return xm.XYModel(
+        "model",
+        folder=str(folder),
+        file="u-squared.csv",
+        skip_rows=1,
+        verbose=False,
+        signal_process={
+            "process1": {
+                "gradient": {
+                    "order": order,
+                    "serialize": serialize,
+                    "folder": str(folder),
+                    "file": "gradient.csv",
+                }
+            }
+        },
+    )
+
+
+def test_cache_hit(tmp_path, model_cache, monkeypatch):
+    shutil.copy(DATA, tmp_path)
+    first = model(tmp_path)
+    assert len(list(model_cache.folder.glob("*.npy"))) == 2  # loaded, and gradient
+
+    def unread(*args, **kwargs):
+        raise AssertionError("a cache hit does not read the file")
+
+    monkeypatch.setattr(xm, "load_columns", unread)
+    second = model(tmp_path)
+    assert np.array_equal(first.x, second.x)
+    assert np.array_equal(first.y, second.y)
+    assert len(list(model_cache.folder.glob("*.npy"))) == 2
+
+
+def test_cache_invalidation(tmp_path, model_cache):
+    shutil.copy(DATA, tmp_path)
+    first = model(tmp_path)
+
+    # a change to the signal process chain is a new entry
+    second = model(tmp_path, order=2)
+    assert not np.array_equal(first.y, second.y)
+    assert len(list(model_cache.folder.glob("*.npy"))) == 3  # shares the loaded data
+
+    # a change to the file is a new entry, and is not stale
+    data = np.genfromtxt(DATA, delimiter=",", skip_header=1)
+    data[:, 1] *= 2.0
+    np.savetxt(tmp_path.joinpath("u-squared.csv"), data, delimiter=",", header="x,y")
+    third = model(tmp_path)
+    assert np.allclose(third.y, 2.0 * first.y)
+    assert len(list(model_cache.folder.glob("*.npy"))) == 5
+
+    assert model_cache.clear() == 5
+    assert model_cache.clear() == 0
+
+
+def test_cache_disabled(tmp_path, model_cache):
+    shutil.copy(DATA, tmp_path)
+    model_cache.enabled = False
+    model(tmp_path)
+    assert not model_cache.folder.exists()
+
+
+def test_cache_serialize(tmp_path, model_cache):
+    shutil.copy(DATA, tmp_path)
+    first = model(tmp_path, serialize=1)
+    output = tmp_path.joinpath("gradient.csv")
+    expected = output.read_text()
+    output.unlink()
+
+    # a cache hit still serializes the signal process
+    model(tmp_path, serialize=1)
+    assert output.read_text() == expected
+
+    # serialization does not change the key
+    assert np.array_equal(model(tmp_path).y, first.y)
+    assert len(list(model_cache.folder.glob("*.npy"))) == 2
+
+
+def test_cache_folder(tmp_path, monkeypatch):
+    # the environment is read when the cache is used, not when it is created
+    model_cache = xm.ModelCache()
+    monkeypatch.setenv("XYFIGURE_CACHE", str(tmp_path.joinpath("a")))
+    assert model_cache.folder == tmp_path.joinpath("a")
+    monkeypatch.setenv("XYFIGURE_CACHE", str(tmp_path.joinpath("b")))
+    assert model_cache.folder == tmp_path.joinpath("b")
+
+    # a given folder overrides the environment
+    model_cache.folder = tmp_path.joinpath("c")
+    assert model_cache.folder == tmp_path.joinpath("c")
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,293 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module provides a single-pass reader of Abaqus `.inp` files.
+
+The *NODE, *ELEMENT, *BOUNDARY, *NSET, and *ELSET keyword blocks are read in one
+scan of the file.  Each data line is converted as it is read, into compact
+buffers that become NumPy arrays, so neither the file nor a block of it is held
+in memory as text.
+"""
+
+from array import array
+from pathlib import Path
+from typing import Final, Iterable, NamedTuple
+
+import numpy as np
+
+KEYWORDS: Final = ("NODE", "ELEMENT", "BOUNDARY", "NSET", "ELSET")
+
+
+class ElementBlock(NamedTuple):
+    """Creates the elements of one *ELEMENT keyword block, all of the same type."""
+
+    element_type: str  # e.g., "CPE4", or "" if not given
+    elset: str  # the ELSET name, or "" if not given
+    ids: np.ndarray  # (n_elements,) element numbers, generally nonsequential
+    connectivity: np.ndarray  # (n_elements, n_nodes_per_element) node numbers
+
+
+class AbaqusInp(NamedTuple):
+    """Creates the mesh of an Abaqus `.inp` file.  The node numbers and element
+    numbers are those of the file, which are generally nonsequential.  Use
+    node_rows() to map node numbers to rows of the coordinates array.
+    """
+
+    node_ids: np.ndarray  # (n_nodes,) node numbers, in file order
+    coordinates: np.ndarray  # (n_nodes, n_dimensions) float positions
+    element_blocks: tuple[ElementBlock, ...]
+    boundary: dict[str, tuple[int, ...]]  # node number or set name -> dofs
+    nsets: dict[str, np.ndarray]  # set name -> node numbers
+    elsets: dict[str, np.ndarray]  # set name -> element numbers
+
+    def node_rows(self, ids) -> np.ndarray:
+        """Maps node numbers to rows of the coordinates array.
+
+        Arguments:
+            ids (array_like of int): Node numbers, of any shape, e.g., the
+                connectivity of an ElementBlock.
+
+        Returns:
+            The array of row indices, of the same shape as ids.
+
+        Raises:
+            KeyError if a node number is not defined in the file.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        order = np.argsort(self.node_ids, kind="stable")
+        sorted_ids = self.node_ids[order]
+        if sorted_ids.size == 0:
+            if ids.size > 0:
+                raise KeyError("Error: no nodes are defined.")
+            return np.zeros(ids.shape, dtype=np.int64)
+
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), sorted_ids.size - 1)
+        missing = sorted_ids[positions] != ids
+        if np.any(missing):
+            raise KeyError(f"Error: undefined node number(s): {ids[missing][:10]}")
+        return order[positions]
+
+
+def _keyword(line: str) -> tuple[str, dict[str, str]]:
+    """Given a keyword line, e.g., "*ELEMENT, TYPE=CPE4, ELSET=EB1", returns the
+    upper case keyword and its parameters, e.g.,
+    ("ELEMENT", {"TYPE": "CPE4", "ELSET": "EB1"}).  A parameter without a value,
+    e.g., GENERATE, has a value of "".
+    """
+    fields = line.strip()[1:].split(",")
+    parameters = {}
+    for field in fields[1:]:
+        key, _, value = field.partition("=")
+        if key.strip():
+            parameters[key.strip().upper()] = value.strip()
+    return fields[0].strip().upper(), parameters
+
+
+def _fields(line: str) -> list[str]:
+    """Returns the comma separated fields of a data line, without a trailing
+    empty field from a trailing comma.
+    """
+    fields = line.split(",")
+    if not fields[-1].strip():
+        fields.pop()
+    return fields
+
+
+class _InpParser:
+    """Accumulates the data lines of an .inp file, one line at a time."""
+
+    def __init__(self, *, keywords: Iterable[str]):
+        self.keywords = tuple(k.upper() for k in keywords)
+        self.keyword = ""
+        self.parameters: dict[str, str] = {}
+
+        self.node_ids = array("q")
+        self.coordinates = array("d")
+        self.node_widths = array("q")
+        self.node_block_start = 0
+
+        self.element_blocks: list[ElementBlock] = []
+        self.element_ids = array("q")
+        self.element_nodes = array("q")
+        self.element_width = 0
+        self.element_pending: list[str] = []
+
+        self.boundary: dict[str, tuple[int, ...]] = {}
+        self.nsets: dict[str, list] = {}
+        self.elsets: dict[str, list] = {}
+        self.set_ids = array("q")
+
+    def start(self, keyword: str, parameters: dict[str, str]):
+        """Ends the current block and starts a new keyword block."""
+        self.end()
+        self.keyword = keyword if keyword in self.keywords else ""
+        self.parameters = parameters
+        self.node_block_start = len(self.node_ids)
+        self.set_ids = array("q")
+
+    def end(self):
+        """Ends the current block, collecting its numbers into arrays."""
+        if self.keyword == "NODE":
+            nset = self.parameters.get("NSET", "")
+            if nset:
+                ids = np.frombuffer(self.node_ids, dtype=np.int64)
+                ids = ids[self.node_block_start :].copy()
+                self.nsets.setdefault(nset, []).append(ids)
+
+        elif self.keyword == "ELEMENT":
+            if self.element_pending:
+                raise ValueError("element definition continues past end of block")
+            n = len(self.element_ids)
+            ids = np.frombuffer(self.element_ids, dtype=np.int64).copy()
+            connectivity = np.frombuffer(self.element_nodes, dtype=np.int64).copy()
+            connectivity = connectivity.reshape(n, self.element_width if n else 0)
+            elset = self.parameters.get("ELSET", "")
+            self.element_blocks.append(
+                ElementBlock(
+                    element_type=self.parameters.get("TYPE", ""),
+                    elset=elset,
+                    ids=ids,
+                    connectivity=connectivity,
+                )
+            )
+            if elset:
+                self.elsets.setdefault(elset, []).append(ids)
+            self.element_ids = array("q")
+            self.element_nodes = array("q")
+            self.element_width = 0
+
+        elif self.keyword in ("NSET", "ELSET"):
+            sets = self.nsets if self.keyword == "NSET" else self.elsets
+            name = self.parameters.get(self.keyword, "")
+            ids = np.frombuffer(self.set_ids, dtype=np.int64).copy()
+            sets.setdefault(name, []).append(ids)
+
+        self.keyword = ""
+
+    def data(self, line: str):
+        """Converts one data line of the current keyword block."""
+        if self.keyword == "NODE":
+            fields = _fields(line)
+            self.node_ids.append(int(fields[0]))
+            self.coordinates.extend(map(float, fields[1:]))
+            self.node_widths.append(len(fields) - 1)
+
+        elif self.keyword == "ELEMENT":
+            fields = line.split(",")
+            if not fields[-1].strip():
+                # a trailing comma continues the element on the next line
+                self.element_pending.extend(fields[:-1])
+                return
+            fields = self.element_pending + fields
+            self.element_pending = []
+            if self.element_width == 0:
+                self.element_width = len(fields) - 1
+            elif len(fields) - 1 != self.element_width:
+                raise ValueError(
+                    f"element has {len(fields) - 1} nodes, "
+                    + f"expected {self.element_width}"
+                )
+            self.element_ids.append(int(fields[0]))
+            self.element_nodes.extend(map(int, fields[1:]))
+
+        elif self.keyword == "BOUNDARY":
+            fields = _fields(line)
+            if len(fields) < 2:
+                raise ValueError("boundary needs a node and degree(s) of freedom")
+            self.boundary[fields[0].strip()] = tuple(map(int, fields[1:]))
+
+        elif self.keyword in ("NSET", "ELSET"):
+            fields = [x.strip() for x in _fields(line)]
+            if "GENERATE" in self.parameters:
+                start, stop, *step = map(int, fields)
+                self.set_ids.extend(range(start, stop + 1, step[0] if step else 1))
+            else:
+                sets = self.nsets if self.keyword == "NSET" else self.elsets
+                for field in fields:
+                    if field.lstrip("+-").isdigit():
+                        self.set_ids.append(int(field))
+                    else:  # a previously defined set
+                        self.set_ids.extend(np.concatenate(sets[field]).tolist())
+
+    def result(self) -> AbaqusInp:
+        """Returns the mesh collected from all blocks."""
+        self.end()
+
+        n_nodes = len(self.node_ids)
+        widths = np.frombuffer(self.node_widths, dtype=np.int64)
+        values = np.frombuffer(self.coordinates, dtype=np.float64)
+        n_dimensions = int(widths.max()) if n_nodes else 0
+        if np.all(widths == n_dimensions):
+            coordinates = values.reshape(n_nodes, n_dimensions).copy()
+        else:
+            # pad nodes with fewer columns with zero, e.g., 2D nodes in a 3D file
+            coordinates = np.zeros((n_nodes, n_dimensions), dtype=np.float64)
+            columns = np.arange(n_dimensions) < widths[:, np.newaxis]
+            coordinates[columns] = values
+
+        return AbaqusInp(
+            node_ids=np.frombuffer(self.node_ids, dtype=np.int64).copy(),
+            coordinates=coordinates,
+            element_blocks=tuple(self.element_blocks),
+            boundary=self.boundary,
+            nsets={k: np.concatenate(v) for k, v in self.nsets.items()},
+            elsets={k: np.concatenate(v) for k, v in self.elsets.items()},
+        )
+
+
+def read_inp(*, pathfile: str, keywords: Iterable[str] = KEYWORDS) -> AbaqusInp:
+    """Reads the mesh of an Abaqus `.inp` file in a single pass.
+
+    Arguments:
+        pathfile (str): The fully pathed `.inp` file.
+        keywords (Iterable[str]): The keyword blocks to read, a subset of
+            ("NODE", "ELEMENT", "BOUNDARY", "NSET", "ELSET").  Other blocks are
+            skipped without parsing.  Default is all of them.
+
+    Returns:
+        AbaqusInp: The nodes, element blocks, boundary, and sets of the file.
+
+    Raises:
+        FileNotFoundError if the file does not exist.
+        ValueError if a data line of a keyword block cannot be read.
+    """
+    pf = Path(pathfile).expanduser()
+    if not pf.is_file():
+        raise FileNotFoundError(f"Error: no such file: {pf}")
+
+    parser = _InpParser(keywords=keywords)
+    number = 0
+    line = ""
+    try:
+        with open(str(pf), "rt") as f:
+            for number, line in enumerate(f, start=1):
+                stripped = line.lstrip()
+                if stripped.startswith("**") or not stripped:
+                    continue  # comment or blank line
+                elif stripped.startswith("*"):
+                    parser.start(*_keyword(stripped))
+                elif parser.keyword:
+                    parser.data(line)
+            return parser.result()
+
+    except (ValueError, KeyError, IndexError) as error:
+        raise ValueError(
+            f"Cannot read file: {pf}, line {number}, {line.strip()!r}: {error}"
+        ) from error
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -3,6 +3,7 @@
 # certain rights in this software.
 
 
+from functools import lru_cache
 from typing import NamedTuple, Union
 
 import numpy as np
@@ -66,18 +67,10 @@ def evaluation_times(
     if not all([dti >= 0 for dti in dt]):
         raise ValueError("Error: knot vector is decreasing.")
 
-    num_knots = len(knot_vector)
-    _evaluation_times = [
-        knots_lhs[k] + j * dt[k]
-        for k in np.arange(num_knots - 1)
-        for j in np.arange(2**n_bisections)
-    ]
-
-    # append the last knot
-    _evaluation_times.append(knot_vector[-1])
-
-    # recast as numpy array
-    _evaluation_times = np.array(_evaluation_times)
+    # the times of each knot span, row by row, then append the last knot
+    j = np.arange(2**n_bisections)
+    _span_times = np.asarray(knots_lhs)[:, np.newaxis] + j * dt[:, np.newaxis]
+    _evaluation_times = np.append(_span_times, knot_vector[-1])
 
     # retain only non-repeated evaluation points
     # at beginning and end
@@ -86,6 +79,219 @@ def evaluation_times(
     return _evaluation_times
 
 
+def basis_matrix(
+    *,
+    knot_vector: Union[list, tuple],
+    degree: int,
+    times,
+    derivative: int = 0,
+) -> np.ndarray:
+    """Returns the values of all B-spline basis functions of a knot vector at
+    the evaluation times, i.e., the `Curve` of every one-hot coefficient vector
+    evaluated at once, or their derivatives.
+
+    Arguments:
+        knot_vector (float array): knot vector, with
+            len(knot_vector) = n_basis + (degree + 1)
+        degree (int >= 0): B-spline polynomial degree.
+        times (float array): evaluation times, e.g., from `evaluation_times`.
+        derivative (int >= 0): order of the derivative with respect to time.
+            Defaults to 0, the basis functions themselves.
+
+    Returns:
+        np.ndarray: The (len(times), n_basis) basis matrix, with row `a` holding
+            N_i(times[a]) for all i.  Times outside of the knot vector are nan.
+
+    Raises:
+        ValueError: If `degree` < 0, `derivative` < 0, or the knot vector has
+            fewer than degree + 2 knots.
+    """
+    if not degree >= 0:
+        raise ValueError("Error: polynomial degree must be a non-negative integer.")
+
+    if not derivative >= 0:
+        raise ValueError("Error: derivative order must be a non-negative integer.")
+
+    n_basis = len(knot_vector) - degree - 1
+    if not n_basis >= 1:
+        raise ValueError("Error: knot vector length is invalid.")
+
+    # a vector-valued spline with identity coefficients has the basis
+    # functions as its components, so one de Boor pass evaluates all of them
+    basis = scipy_bspline(
+        np.asarray(knot_vector, dtype=float),
+        np.eye(n_basis),
+        degree,
+        extrapolate=False,
+    )
+    return basis(np.asarray(times, dtype=float), nu=derivative)
+
+
+class EvaluationPlan(NamedTuple):
+    """Creates the evaluation times and basis matrices of a parameterization,
+    shared by every curve, surface, or volume with the same knot vector,
+    degree, and number of bisections.  The arrays are read only.
+    """
+
+    knot_vector: tuple[float, ...]
+    degree: int
+    n_bisections: int
+    times: np.ndarray  # (n_times,) from evaluation_times
+    basis: np.ndarray  # (n_times, n_basis) from basis_matrix
+    first: np.ndarray  # (n_times, n_basis) first derivative of the basis
+    second: np.ndarray  # (n_times, n_basis) second derivative of the basis
+
+    def basis_derivative(self, order: int = 0) -> np.ndarray:
+        """Returns the basis matrix, or its first or second derivative.
+
+        Raises:
+            ValueError: If `order` is not 0, 1, or 2.
+        """
+        if order not in (0, 1, 2):
+            raise ValueError("Error: derivative order must be 0, 1, or 2.")
+        return (self.basis, self.first, self.second)[order]
+
+    def evaluate(self, coefficients, derivative: int = 0) -> np.ndarray:
+        """Returns the curve of coefficients (n_basis, ...) at all times, as
+        the (n_times, ...) matrix product of the basis with the coefficients,
+        or its first or second derivative with respect to time."""
+        basis = self.basis_derivative(derivative)
+        return np.tensordot(basis, np.asarray(coefficients, dtype=float), 1)
+
+
+def evaluation_plan(
+    *,
+    knot_vector: Union[list, tuple],
+    degree: int = 0,
+    n_bisections: int = 1,
+) -> EvaluationPlan:
+    """Returns the evaluation plan of a parameterization, from a least recently
+    used cache, so repeated evaluations with different coefficients reuse the
+    same evaluation times and basis matrix.
+
+    Arguments:
+        knot_vector (float array): knot vector, see `evaluation_times`.
+        degree (int >= 0): B-spline polynomial degree.  Defaults to 0.
+        n_bisections (int >= 1): number of bisections per knot span.
+            Defaults to 1.
+
+    Returns:
+        EvaluationPlan: The evaluation times and basis matrix.
+
+    Raises:
+        ValueError: As `evaluation_times` and `basis_matrix`.
+    """
+    key = tuple(float(k) for k in knot_vector)
+    return _evaluation_plan(key, int(degree), int(n_bisections))
+
+
+@lru_cache(maxsize=128)
+def _evaluation_plan(
+    knot_vector: tuple[float, ...], degree: int, n_bisections: int
+) -> EvaluationPlan:
+    """Creates the evaluation plan of `evaluation_plan`, once per key."""
+    times = evaluation_times(
+        knot_vector=knot_vector, degree=degree, n_bisections=n_bisections
+    )
+    first, second, basis = (
+        basis_matrix(
+            knot_vector=knot_vector, degree=degree, times=times, derivative=order
+        )
+        for order in (1, 2, 0)
+    )
+    for array in (times, basis, first, second):
+        array.flags.writeable = False
+    return EvaluationPlan(
+        knot_vector=knot_vector,
+        degree=degree,
+        n_bisections=n_bisections,
+        times=times,
+        basis=basis,
+        first=first,
+        second=second,
+    )
+
+
+def evaluate_tensor_product(
+    *,
+    plans: tuple[EvaluationPlan, ...],
+    coefficients,
+    derivatives: Union[tuple[int, ...], None] = None,
+) -> np.ndarray:
+    """Returns the tensor product B-spline of a control net at the evaluation
+    times of each plan, as one matrix product per parameter, or a partial
+    derivative of it.
+
+    Arguments:
+        plans (tuple of EvaluationPlan): One plan per parameter, e.g.,
+            (plan_t, plan_u) for a surface, or (plan_t, plan_u, plan_v) for a
+            volume.
+        coefficients (float array): The control net, with shape
+            (n_basis_t, n_basis_u, ..., n_space_dimensions).
+        derivatives (tuple of int or None): The order, 0, 1, or 2, of the
+            derivative with respect to each parameter, e.g., (1, 1) for the
+            mixed second derivative of a surface.  Default None, all zero.
+
+    Returns:
+        np.ndarray: The (n_times_t, n_times_u, ..., n_space_dimensions) points,
+            or partial derivatives.
+    """
+    if derivatives is None:
+        derivatives = (0,) * len(plans)
+    if len(derivatives) != len(plans):
+        raise ValueError("Error: one derivative order is required per plan.")
+
+    net = np.asarray(coefficients, dtype=float)
+    for plan, order in zip(plans, derivatives):
+        # contract the leading control index; it becomes the trailing time index
+        basis = plan.basis_derivative(order)
+        net = np.moveaxis(np.tensordot(basis, net, axes=(1, 0)), 0, -1)
+    return np.moveaxis(net, 0, -1)
+
+
+class SurfaceCurvature(NamedTuple):
+    """Creates the curvatures of a surface at each pair of evaluation times."""
+
+    gaussian: np.ndarray  # (n_times_t, n_times_u) product of principal curvatures
+    mean: np.ndarray  # (n_times_t, n_times_u) average of principal curvatures
+
+
+def _unit(vectors: np.ndarray) -> np.ndarray:
+    """Returns the vectors (..., n) scaled to unit length, nan if zero length."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def curve_curvature(*, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Returns the curvature |r' x r''| / |r'|^3 of a 2D or 3D curve from its
+    first and second derivatives.
+
+    Arguments:
+        first (np.ndarray): The (n_times, n_space_dimensions) first derivatives.
+        second (np.ndarray): The (n_times, n_space_dimensions) second derivatives.
+
+    Returns:
+        np.ndarray: The (n_times,) curvature, nan where the curve is singular.
+
+    Raises:
+        ValueError: If the curve is not in two or three space dimensions.
+    """
+    if first.ndim != 2 or first.shape[1] not in (2, 3):
+        raise ValueError("Error: curvature requires a curve in 2D or 3D.")
+    if first.shape[1] == 2:
+        cross = np.abs(first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0])
+    else:
+        cross = np.linalg.norm(np.cross(first, second), axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cross / np.linalg.norm(first, axis=1) ** 3
+
+
+def _check_knot_vector(knot_vector: Union[list, tuple], n_basis: int, degree: int):
+    """Raises a ValueError unless the knot vector has n_basis + degree + 1 knots."""
+    if not len(knot_vector) == n_basis + degree + 1:
+        raise ValueError("Error: knot vector length is invalid.")
+
+
 class Curve:
     """Creates a B-Spline curve.
 
@@ -167,6 +373,21 @@ class Curve:
         # return y
         return self._bspline(t)
 
+    def derivative(self, t, nu: int = 1):
+        """Evaluate the `nu`-th derivative of the BSpline curve at all points `t`."""
+        return self._bspline(t, nu=nu)
+
+    def tangents(self, t):
+        """Evaluate the unit tangent of the BSpline curve at all points `t`."""
+        return _unit(np.asarray(self.derivative(t, nu=1)))
+
+    def curvatures(self, t):
+        """Evaluate the curvature of a 2D or 3D BSpline curve at all points `t`."""
+        return curve_curvature(
+            first=np.asarray(self.derivative(t, nu=1)),
+            second=np.asarray(self.derivative(t, nu=2)),
+        )
+
 
 class SurfaceClientData(NamedTuple):
     """Creates the client-specific input pluggable into a surface,
@@ -303,45 +524,24 @@ class Surface:
         # assert np.norm(self._t_new - self.t < 0.00001)
         # assert np.norm(self._u_new - self.u > 0.00001)
 
-        self.t = evaluation_times(
-            knot_vector=knot_vector_t, degree=degree_t, n_bisections=n_bisections
+        # cached basis matrices (len(t), ncp_t) and (len(u), ncp_u), then
+        # contract the control net as sum_ij N_i(t) N_j(u) c_ij
+        _check_knot_vector(knot_vector_t, self.ncp_t, degree_t)
+        _check_knot_vector(knot_vector_u, self.ncp_u, degree_u)
+        plans = (
+            evaluation_plan(
+                knot_vector=knot_vector_t, degree=degree_t, n_bisections=n_bisections
+            ),
+            evaluation_plan(
+                knot_vector=knot_vector_u, degree=degree_u, n_bisections=n_bisections
+            ),
         )
-        self.u = evaluation_times(
-            knot_vector=knot_vector_u, degree=degree_u, n_bisections=n_bisections
-        )
-
-        self.x_of_t_u = np.zeros((len(self.t), len(self.u)), dtype=float)
-        self.y_of_t_u = np.zeros((len(self.t), len(self.u)), dtype=float)
-        self.z_of_t_u = np.zeros((len(self.t), len(self.u)), dtype=float)
-
-        ix = 0  # x-coordinate index
-        iy = 1  # y-coordinate index
-        iz = 2  # z-coordinate index
-
-        for i in np.arange(self.ncp_t):
-            for j in np.arange(self.ncp_u):
-
-                N_coef_t = np.zeros(self.ncp_t)
-                N_coef_u = np.zeros(self.ncp_u)
+        self.t, self.u = (plan.times for plan in plans)
 
-                N_coef_t[i] = 1.0
-                N_coef_u[j] = 1.0
-
-                Ni = Curve(knot_vector_t, N_coef_t, degree_t)
-                Nj = Curve(knot_vector_u, N_coef_u, degree_u)
-
-                if Ni.is_valid() and Nj.is_valid():
-                    Ni_of_t = Ni.evaluate(self.t)
-                    Nj_of_u = Nj.evaluate(self.u)
-                    Nij = np.outer(Ni_of_t, Nj_of_u)
-
-                    coef_x = coefficients[i][j][ix]
-                    coef_y = coefficients[i][j][iy]
-                    coef_z = coefficients[i][j][iz]
-
-                    self.x_of_t_u += Nij * coef_x
-                    self.y_of_t_u += Nij * coef_y
-                    self.z_of_t_u += Nij * coef_z
+        net = np.asarray(coefficients, dtype=float)[..., 0:3]
+        xyz = evaluate_tensor_product(plans=plans, coefficients=net)
+        self.x_of_t_u, self.y_of_t_u, self.z_of_t_u = np.moveaxis(xyz, -1, 0)
+        self._plans, self._net = plans, net
 
         self.valid = True
 
@@ -367,6 +567,59 @@ class Surface:
             # return error
             return (None, None, None)
 
+    def derivatives(self, *, t: int = 1, u: int = 0):
+        """Returns the partial derivative of the BSpline surface of order `t` in
+        the `t` direction and order `u` in the `u` direction, each 0, 1, or 2,
+        as a tuple of (x, y, z) values at all parameter evaluation points `t`
+        and `u`, aligned with `evaluations`.
+        """
+        xyz = evaluate_tensor_product(
+            plans=self._plans, coefficients=self._net, derivatives=(t, u)
+        )
+        return tuple(np.moveaxis(xyz, -1, 0))
+
+    @property
+    def normals(self):
+        """Returns the unit normal of the BSpline surface, (S_t x S_u) / |S_t x S_u|,
+        as a tuple of (x, y, z) values at all parameter evaluation points `t` and `u`,
+        nan where the surface is singular.
+        """
+        return tuple(np.moveaxis(self._unit_normals(), -1, 0))
+
+    @property
+    def curvatures(self) -> SurfaceCurvature:
+        """Returns the Gaussian and mean curvature of the BSpline surface at all
+        parameter evaluation points `t` and `u`, from the first and second
+        fundamental forms.
+        """
+        S_t, S_u, S_tt, S_tu, S_uu = (
+            evaluate_tensor_product(
+                plans=self._plans, coefficients=self._net, derivatives=orders
+            )
+            for orders in ((1, 0), (0, 1), (2, 0), (1, 1), (0, 2))
+        )
+        n = self._unit_normals()
+        E, F, G = (
+            (a * b).sum(axis=-1) for (a, b) in ((S_t, S_t), (S_t, S_u), (S_u, S_u))
+        )
+        L, M, N = ((a * n).sum(axis=-1) for a in (S_tt, S_tu, S_uu))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            det = E * G - F * F
+            return SurfaceCurvature(
+                gaussian=(L * N - M * M) / det,
+                mean=(E * N - 2.0 * F * M + G * L) / (2.0 * det),
+            )
+
+    def _unit_normals(self) -> np.ndarray:
+        """Returns the (n_times_t, n_times_u, 3) unit normals."""
+        S_t, S_u = (
+            evaluate_tensor_product(
+                plans=self._plans, coefficients=self._net, derivatives=orders
+            )
+            for orders in ((1, 0), (0, 1))
+        )
+        return _unit(np.cross(S_t, S_u))
+
     @property
     def evaluation_times_t(self):
         """Returns the BSpline surface evaluation time parameters in the `t` direction."""
@@ -445,62 +698,25 @@ class Volume:
         # self.ncp_t, self.ncp_u, self.nsd = np.array(coefficients).shape
         self.ncp_t, self.ncp_u, self.ncp_v, self.nsd = np.array(coefficients).shape
 
-        self.t = evaluation_times(
-            knot_vector=knot_vector_t, degree=degree_t, n_bisections=n_bisections
-        )
-        self.u = evaluation_times(
-            knot_vector=knot_vector_u, degree=degree_u, n_bisections=n_bisections
-        )
-        self.v = evaluation_times(
-            knot_vector=knot_vector_v, degree=degree_v, n_bisections=n_bisections
+        # cached basis matrices in each of t, u, and v, then contract the
+        # control lattice as sum_ijk N_i(t) N_j(u) N_k(v) c_ijk
+        _check_knot_vector(knot_vector_t, self.ncp_t, degree_t)
+        _check_knot_vector(knot_vector_u, self.ncp_u, degree_u)
+        _check_knot_vector(knot_vector_v, self.ncp_v, degree_v)
+        plans = tuple(
+            evaluation_plan(knot_vector=kv, degree=p, n_bisections=n_bisections)
+            for (kv, p) in (
+                (knot_vector_t, degree_t),
+                (knot_vector_u, degree_u),
+                (knot_vector_v, degree_v),
+            )
         )
+        self.t, self.u, self.v = (plan.times for plan in plans)
 
-        self.x_of_t_u_v = np.zeros((len(self.t), len(self.u), len(self.v)), dtype=float)
-        self.y_of_t_u_v = np.zeros((len(self.t), len(self.u), len(self.v)), dtype=float)
-        self.z_of_t_u_v = np.zeros((len(self.t), len(self.u), len(self.v)), dtype=float)
-
-        ix = 0  # x-coordinate index
-        iy = 1  # y-coordinate index
-        iz = 2  # z-coordinate index
-
-        for i in np.arange(self.ncp_t):
-            for j in np.arange(self.ncp_u):
-                for k in np.arange(self.ncp_v):
-
-                    N_coef_t = np.zeros(self.ncp_t)
-                    N_coef_u = np.zeros(self.ncp_u)
-                    N_coef_v = np.zeros(self.ncp_v)
-
-                    N_coef_t[i] = 1.0
-                    N_coef_u[j] = 1.0
-                    N_coef_v[k] = 1.0
-
-                    # walk the curves and make three outer products
-                    Ni = Curve(knot_vector_t, N_coef_t, degree_t)
-                    Nj = Curve(knot_vector_u, N_coef_u, degree_u)
-                    Nk = Curve(knot_vector_v, N_coef_v, degree_v)
-
-                    if Ni.is_valid() and Nj.is_valid() and Nk.is_valid():
-                        Ni_of_t = Ni.evaluate(self.t)
-                        Nj_of_u = Nj.evaluate(self.u)
-                        Nk_of_v = Nk.evaluate(self.v)
-
-                        # Nij = np.outer(Ni_of_t, Nj_of_u)
-                        # Nijk = np.outer(Ni_of_t, np.outer(Nj_of_u, Nk_of_v))
-                        Nijk = np.array(
-                            [_ * np.outer(Nj_of_u, Nk_of_v) for _ in Ni_of_t]
-                        )
-
-                        coef_x = coefficients[i][j][k][ix]
-                        coef_y = coefficients[i][j][k][iy]
-                        coef_z = coefficients[i][j][k][iz]
-
-                        # self.x_of_t_u += Nij * coef_x
-                        # self.y_of_t_u += Nij * coef_y
-                        # self.z_of_t_u += Nij * coef_z
-                        self.x_of_t_u_v += Nijk * coef_x
-                        self.y_of_t_u_v += Nijk * coef_y
-                        self.z_of_t_u_v += Nijk * coef_z
+        lattice = np.asarray(coefficients, dtype=float)[..., 0:3]
+        xyz = evaluate_tensor_product(plans=plans, coefficients=lattice)
+        self.x_of_t_u_v, self.y_of_t_u_v, self.z_of_t_u_v = np.moveaxis(xyz, -1, 0)
+        self._plans, self._lattice = plans, lattice
 
         self.valid = True
 
@@ -527,6 +743,17 @@ class Volume:
             # return error
             return (None, None, None)
 
+    def derivatives(self, *, t: int = 1, u: int = 0, v: int = 0):
+        """Returns the partial derivative of the BSpline volume of orders `t`, `u`,
+        and `v` in the `t`, `u`, and `v` directions, each 0, 1, or 2, as a tuple
+        of (x, y, z) values at all parameter evaluation points `t`, `u`, and `v`,
+        aligned with `evaluations`.
+        """
+        xyz = evaluate_tensor_product(
+            plans=self._plans, coefficients=self._lattice, derivatives=(t, u, v)
+        )
+        return tuple(np.moveaxis(xyz, -1, 0))
+
     @property
     def evaluation_times_t(self):
         """Returns the BSpline volume evaluation time parameters in the `t` direction."""
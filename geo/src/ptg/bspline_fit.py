@@ -3,14 +3,35 @@
 # certain rights in this software.
 
 
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 from numpy import ndarray
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import sparse
+from scipy.interpolate import BSpline as scipy_bspline
+from scipy.linalg import solve_banded, solveh_banded
 
 # from numpy import linalg
 
-import ptg.bspline as bsp
+
+def _bandwidths(matrix: sparse.csr_matrix) -> tuple[int, int]:
+    """Returns the (lower, upper) bandwidths of the sparse matrix nonzeros."""
+    coo = matrix.tocoo()
+    if coo.nnz == 0:
+        return (0, 0)
+    offsets = coo.col.astype(np.int64) - coo.row.astype(np.int64)
+    return (max(int(-offsets.min()), 0), max(int(offsets.max()), 0))
+
+
+def _banded(matrix: sparse.csr_matrix, lower: int, upper: int) -> ndarray:
+    """Returns the matrix in the diagonal ordered form of scipy.linalg.solve_banded,
+    ab[upper + i - j, j] = matrix[i, j].
+    """
+    coo = matrix.tocoo()
+    ab = np.zeros((lower + upper + 1, matrix.shape[1]))
+    ab[upper + coo.row - coo.col, coo.col] = coo.data
+    return ab
 
 
 class BSplineFit:
@@ -21,9 +42,11 @@ class BSplineFit:
         verbose: bool = False,
         sample_time_method: str = "chord",
         knot_method: str = "average",
+        n_control_points: Optional[int] = None,
     ):
         """Creates a B-Spline curve based on fits to sample_points on curve.
-        Sample points are either interpolated (default) or approximated (to come).
+        Sample points are either interpolated (default) or approximated in the
+        least squares sense, when there are fewer control points than samples.
 
         Args:
             sample_points (ArrayLike[float]): [[a0, a1, a2, ... am], [b0, b1, b2, ... bm],
@@ -39,6 +62,11 @@ class BSplineFit:
                 "average": default, recommended method for placing knots
                 "equal": (optional), not recommended, can lead to a singular matrix,
                 implemented herein for unit tests and testing purposes only.
+            n_control_points (int or None): number of control points (n + 1), in
+                [degree + 1, m + 1].  Default None, i.e., (m + 1), which interpolates
+                the samples.  Fewer control points approximate the samples in the
+                least squares sense, with the first and last samples interpolated,
+                Piegl 1997, Section 9.4.1.
         """
         if not isinstance(sample_points, (list, tuple, ndarray)):
             raise TypeError("Error: sample points must be a list, tuple, or ndarray.")
@@ -57,9 +85,21 @@ class BSplineFit:
         self.samples = np.asarray(sample_points)
         self.n_samples = len(self.samples)  # (m + 1)
         self._m = self.n_samples - 1  # m index
-        self.n_control_points = (
-            self.n_samples
-        )  # special case n = m, number of control points
+        if n_control_points is None:
+            n_control_points = self.n_samples  # special case n = m, interpolation
+
+        if not degree + 1 <= n_control_points <= self.n_samples:
+            raise ValueError(
+                "Error: n_control_points must be in [degree + 1, number of samples]."
+            )
+
+        self.n_control_points = n_control_points  # (n + 1)
+        _n = self.n_control_points - 1  # n index
+        self.interpolated = self.n_control_points == self.n_samples
+
+        _averaged = self.interpolated and knot_method == "average"
+        if _averaged and degree == 0 and self._m > 0:
+            raise ValueError("Error: knot_method 'average' requires degree >= 1.")
 
         # self.verbose = verbose
         self.valid = False
@@ -67,64 +107,82 @@ class BSplineFit:
 
         # Piegl 1997 page 364-365, chord length method or centripetal method
         chord_lengths = np.zeros(self.n_samples)
-
-        for k in range(1, self.n_samples):
-            chord_length = np.linalg.norm(self.samples[k] - self.samples[k - 1])
-            if sample_time_method == "chord":
-                chord_lengths[k] = chord_length  # norm from Eq. (9.5) Piegl 1997
-            else:  # "centripetal"
-                chord_lengths[k] = np.sqrt(chord_length)  # sqrt norm Eq. (9.6)
-
-        total_chord_length = sum(chord_lengths)
-
-        self._sample_times = np.zeros(self.n_samples)
-        for k in range(1, self.n_samples):
-            self._sample_times[k] = (
-                self._sample_times[k - 1] + chord_lengths[k] / total_chord_length
-            )  # Eq. (9.5) or (9.6) Piegl 1997
-
-        # averaging knots from sample times, Piegl 1997, page 365, Eq. (9.8)
-        self._n_knots = degree + 1 + self.n_samples  # (kappa + 1)
+        chord_lengths[1:] = np.linalg.norm(np.diff(self.samples, axis=0), axis=1)
+        if sample_time_method == "centripetal":
+            chord_lengths = np.sqrt(chord_lengths)  # sqrt norm Eq. (9.6)
+
+        # cumulative sums in sample order, Eq. (9.5) or (9.6) Piegl 1997,
+        # with round off kept from moving the last sample past the last knot
+        total_chord_length = np.cumsum(chord_lengths)[-1]
+        self._sample_times = np.cumsum(chord_lengths / total_chord_length)
+        self._sample_times[-1] = min(self._sample_times[-1], 1.0)
+
+        # knot vector of (kappa + 1) knots, interior knots j = 1 .. n - p
+        self._n_knots = degree + 1 + self.n_control_points  # (kappa + 1)
         self._kappa = self._n_knots - 1
         self._knot_vector = np.zeros(self._n_knots)
-        if knot_method == "average":
-            # averaging knots from sample times
-            for j in range(1, self._m - degree + 1):  # +1 for Python 0-index
-                # _phi_high = degree - 1 + j
-                _phi_high = degree + j  # add +1 back in to account for Python 0-index
-                _knot_subspan_average = (1 / degree) * sum(
-                    self._sample_times[j:_phi_high]
-                )
-                self._knot_vector[degree + j] = _knot_subspan_average
+        j = np.arange(1, _n - degree + 1)
+        if knot_method == "equal":
+            self._knot_vector[degree + j] = j / (_n - degree + 1)
+        elif self.interpolated:
+            # averaging knots from sample times, Piegl 1997, page 365, Eq. (9.8),
+            # none if n_samples == degree + 1, e.g., a Bezier curve
+            if j.size:
+                _windows = sliding_window_view(self._sample_times[1 : self._m], degree)
+                self._knot_vector[degree + j] = (1 / degree) * _windows.sum(axis=1)
         else:
-            # knot_method is "equal"
-            for j in range(1, self._m - degree + 1):  # +1 for Python 0-index
-                self._knot_vector[degree + j] = j / (self._m - degree + 1)
+            # averaging knots for approximation, Piegl 1997, Eqs. (9.68)-(9.69)
+            d = self.n_samples / (_n - degree + 1)
+            i = (j * d).astype(int)
+            alpha = j * d - i
+            t_lhs, t_rhs = self._sample_times[i - 1], self._sample_times[i]
+            self._knot_vector[degree + j] = (1.0 - alpha) * t_lhs + alpha * t_rhs
         # append end of knot vector with 1.0 repeated (degree + 1) times
         _kappa_minus_p = self._kappa - degree
         self._knot_vector[_kappa_minus_p : self._kappa + 1] = 1.0  # Python 0-index
 
-        # matrix A u = f -> (notation) N u = f
-        self._sample_basis_matrix = []  # (m x 1) by (n x 1) coefficient matrix
-        for column in range(self.n_control_points):
-            coef = np.zeros(self.n_control_points)
-            coef[column] = 1.0
-
-            # build the B-spline basis functions column-by-column
-            _bspline_basis_function = bsp.Curve(self.knot_vector, coef, degree)
-
-            if _bspline_basis_function.is_valid():
-                _y = _bspline_basis_function.evaluate(self.sample_times)
-                self._sample_basis_matrix.append(_y)
-
-        # now transpose the N matrix, since we filled column-wise
-        self._sample_basis_matrix = np.transpose(self._sample_basis_matrix)
-
-        # self.control_points = np.linalg.solve(self._N, sample_points)
-        self._control_points = np.linalg.solve(self._sample_basis_matrix, self.samples)
+        # matrix A u = f -> (notation) N u = f, with each row holding the at most
+        # (degree + 1) nonzero basis functions at a sample time, so N is banded
+        self._sample_basis_sparse = sparse.csr_matrix(
+            scipy_bspline.design_matrix(self.sample_times, self.knot_vector, degree)
+        )
+        self._sample_basis_matrix = None  # dense form, created on demand
+
+        if self.interpolated:
+            lower, upper = _bandwidths(self._sample_basis_sparse)
+            self._control_points = solve_banded(
+                (lower, upper),
+                _banded(self._sample_basis_sparse, lower, upper),
+                self.samples,
+            )
+        else:
+            self._control_points = self._least_squares(degree=degree)
 
         self.valid = True  # if we come to the end of __init__, all is valid
 
+    def _least_squares(self, *, degree: int) -> ndarray:
+        """Returns the control points that fit the samples in the least squares
+        sense, with the first and last samples interpolated, Piegl 1997,
+        Eqs. (9.63)-(9.67).  The normal equations are symmetric positive definite
+        and banded, with bandwidth degree.
+        """
+        N = self._sample_basis_sparse
+        Q = self.samples.astype(float)
+        P = np.zeros((self.n_control_points,) + Q.shape[1:])
+        P[0], P[-1] = Q[0], Q[-1]
+
+        # interior samples less the contribution of the end control points
+        N_inner = N[1:-1, 1:-1]
+        R = Q[1:-1] - np.multiply.outer(N[1:-1, [0]].toarray().ravel(), Q[0])
+        R -= np.multiply.outer(N[1:-1, [-1]].toarray().ravel(), Q[-1])
+
+        if N_inner.shape[1] > 0:
+            NtN = (N_inner.T @ N_inner).tocsr()
+            lower, _ = _bandwidths(NtN)
+            ab = _banded(sparse.tril(NtN).tocsr(), lower, 0)  # lower form
+            P[1:-1] = solveh_banded(ab, N_inner.T @ R, lower=True)
+        return P
+
     @property
     def control_points(self):
         """Returns the B-spline control points that fit the sample point data."""
@@ -140,8 +198,16 @@ class BSplineFit:
     def sample_basis_matrix(self):
         """Returns the matrix of B-spline basis functions equaluated at sample point
         times."""
+        if self._sample_basis_matrix is None:
+            self._sample_basis_matrix = self._sample_basis_sparse.toarray()
         return self._sample_basis_matrix
 
+    @property
+    def sample_basis_sparse(self):
+        """Returns the banded matrix of B-spline basis functions evaluated at sample
+        point times, in compressed sparse row format."""
+        return self._sample_basis_sparse
+
     @property
     def sample_times(self):
         """Returns the sample times for each sample point based on the 'chord' or
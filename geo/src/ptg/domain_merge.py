@@ -4,7 +4,8 @@
 
 
 """The module merges two domains at a single boundary."""
-from functools import reduce
+
+import math
 
 import numpy as np
 
@@ -12,88 +13,146 @@ from ptg.point import Points
 from ptg.quadtree import Domain, Mesh
 
 
-def boundary_match(
+class _SegmentIndex:
+    """A spatial hash of boundary segments, keyed by the number of points in the
+    segment and by the location of the segment's first and last points, quantized
+    to a grid with spacing equal to the tolerance.  Two points within tolerance of
+    each other in both x and y fall in the same or adjacent grid cells, so candidate
+    segments are found without comparing against every segment.
+    """
+
+    def __init__(self, *, tolerance: float):
+        self._tol = tolerance
+        self._buckets: dict = {}
+        self._removed: set = set()
+
+    def _key(self, n_points: int, x: float, y: float) -> tuple:
+        return (n_points, math.floor(x / self._tol), math.floor(y / self._tol))
+
+    def add(self, *, sid: int, n_points: int, first: tuple, last: tuple) -> None:
+        """Registers segment `sid` by its first point and by its last point."""
+        for x, y in set((first, last)):
+            self._buckets.setdefault(self._key(n_points, x, y), []).append(sid)
+
+    def remove(self, sid: int) -> None:
+        """Excludes segment `sid` from subsequent candidates."""
+        self._removed.add(sid)
+
+    def candidates(self, *, n_points: int, point: tuple) -> list[int]:
+        """Returns, in ascending order, the segments with n_points points whose
+        first or last point may lie within tolerance of point.
+        """
+        n, i, j = self._key(n_points, *point)
+        found = set()
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                found.update(self._buckets.get((n, i + di, j + dj), ()))
+        return sorted(found - self._removed)
+
+
+def _segment_coincident(
+    xy0: np.ndarray, b0: tuple[int, ...], xy1: np.ndarray, b1: tuple[int, ...], tol
+) -> bool:
+    """Returns True if each of the x and y distances between the points of segments
+    b0 and b1, taken in order, have a norm less than tol.
+    """
+    diff = xy0[list(b0)] - xy1[list(b1)]
+    return bool(
+        np.abs(np.linalg.norm(diff[:, 0])) < tol
+        and np.abs(np.linalg.norm(diff[:, 1])) < tol
+    )
+
+
+def _segment_matches(
     *,
     boundary0: tuple[tuple[int, ...], ...],
-    coordinates0: Points,
+    xy0: np.ndarray,
     boundary1: tuple[tuple[int, ...], ...],
-    coordinates1: Points,
+    xy1: np.ndarray,
     tolerance: float,
-) -> tuple[tuple[int, ...], ...]:
-    tol = tolerance  # typical is 1e-6
-
-    n_seg0 = len(boundary0)  # number of boundary segments
-    n_seg1 = len(boundary1)
-
-    # x and y coordinates in boundary zero
-    # c0x = tuple([c.x for c in coordinates0])
-    # c0y = tuple([c.y for c in coordinates0])
-    c0x, c0y = coordinates0.xs, coordinates0.ys
-
-    # x and y coordinates in boundary one
-    # c1x = tuple([c.x for c in coordinates1])
-    # c1y = tuple([c.y for c in coordinates1])
-    c1x, c1y = coordinates1.xs, coordinates1.ys
-
-    matches = [[0 for j in range(0, n_seg1)] for i in range(0, n_seg0)]
-    n_matches = 0
+) -> tuple[tuple[int, int, int], ...]:
+    """Returns the sparse form of the boundary_match matrix, as a tuple of
+    (m, n, match_k) for each non-zero match_k = match_matrix[m][n].
+    """
+    if tolerance <= 0.0:
+        return ()
+
+    index = _SegmentIndex(tolerance=tolerance)
+    for n, b1 in enumerate(boundary1):
+        index.add(
+            sid=n,
+            n_points=len(b1),
+            first=tuple(xy1[b1[0]]),
+            last=tuple(xy1[b1[-1]]),
+        )
 
+    matches = []
     for m, b0 in enumerate(boundary0):
+        for n in index.candidates(n_points=len(b0), point=tuple(xy0[b0[0]])):
+            b1 = boundary1[n]
+            if _segment_coincident(xy0, b0, xy1, b1, tolerance):
+                matches.append((m, n, len(matches) + 1))
+                break
+            if _segment_coincident(xy0, b0, xy1, b1[::-1], tolerance):
+                # negative number indicates order reversal
+                matches.append((m, n, -(len(matches) + 1)))
+                break
+
+    return tuple(matches)
+
+
+def _coordinates_array(coordinates: Points) -> np.ndarray:
+    """Returns the Points as an (n, 2) float array."""
+    return np.column_stack(
+        (
+            np.asarray(coordinates.xs, dtype=np.float64),
+            np.asarray(coordinates.ys, dtype=np.float64),
+        )
+    )
 
-        for n, b1 in enumerate(boundary1):
-
-            if len(b0) == len(b1):
-
-                (b0x, b0y) = (
-                    np.array([c0x[k] for k in b0]),
-                    np.array([c0y[k] for k in b0]),
-                )
-                (b1x, b1y) = (
-                    np.array([c1x[k] for k in b1]),
-                    np.array([c1y[k] for k in b1]),
-                )
-
-                (diffx, diffy) = (b0x - b1x, b0y - b1y)
-                (normx, normy) = (
-                    np.abs(np.linalg.norm(diffx)),
-                    np.abs(np.linalg.norm(diffy)),
-                )
-
-                if normx < tol and normy < tol:
-                    # b0 and b1 match
-                    n_matches += 1
-                    matches[m][n] = n_matches
-                    break  # stop further evaluation of this loop
-
-                # no match yet, so flip order of the second boundary
-                b1_r = b1[::-1]
 
-                (b1x_r, b1y_r) = (
-                    np.array([c1x[k] for k in b1_r]),
-                    np.array([c1y[k] for k in b1_r]),
-                )
-
-                (diffx_r, diffy_r) = (b0x - b1x_r, b0y - b1y_r)
+def boundary_match(
+    *,
+    boundary0: tuple[tuple[int, ...], ...],
+    coordinates0: Points,
+    boundary1: tuple[tuple[int, ...], ...],
+    coordinates1: Points,
+    tolerance: float,
+) -> tuple[tuple[int, ...], ...]:
+    """Compares each boundary segment of the first domain with the boundary
+    segments of the second domain.
 
-                (normx_r, normy_r) = (
-                    np.abs(np.linalg.norm(diffx_r)),
-                    np.abs(np.linalg.norm(diffy_r)),
-                )
+    Arguments:
+        boundary0 (tuple[tuple[int, ...], ...]): The boundary segments of the first
+            domain, as node numbers into coordinates0.
+        coordinates0 (Points): The coordinates of the first domain.
+        boundary1 (tuple[tuple[int, ...], ...]): The boundary segments of the second
+            domain, as node numbers into coordinates1.
+        coordinates1 (Points): The coordinates of the second domain.
+        tolerance (float): The maximum norm of the separate x and y distances
+            between two segments for the segments to be coincident.
+            Typically set to 1e-6.
 
-                if normx_r < tol and normy_r < tol:
-                    # b0 and b1_r match
-                    n_matches += 1
-                    # remove these matches from the unmatched buckets
-                    matches[m][
-                        n
-                    ] = -n_matches  # negative number indicates order reversal
-                    break  # stop further evaluation of this loop
-
-    match_tuple = tuple(
-        tuple(matches[i][j] for j in range(0, n_seg1)) for i in range(0, n_seg0)
+    Returns:
+        tuple[tuple[int, ...], ...]: The match matrix, with one row per segment of
+            boundary0 and one column per segment of boundary1.  A non-zero
+            value k marks the k-th match, negative if the second segment is
+            coincident in reverse order.  Each row has at most one match, with
+            the first coincident segment of boundary1.
+    """
+    matches = _segment_matches(
+        boundary0=boundary0,
+        xy0=_coordinates_array(coordinates0),
+        boundary1=boundary1,
+        xy1=_coordinates_array(coordinates1),
+        tolerance=tolerance,
     )
 
-    return match_tuple
+    match_matrix = [[0] * len(boundary1) for _ in range(len(boundary0))]
+    for m, n, match_k in matches:
+        match_matrix[m][n] = match_k
+
+    return tuple(tuple(row) for row in match_matrix)
 
 
 def boundary_substraction(
@@ -154,150 +213,193 @@ def domain_merge(
     """
     tol = tolerance  # typical is 1e-6
 
+    # number of nodes per element (=4 for quads)
+    nen0 = len(domain0.mesh.connectivity[0])
+    nen1 = len(domain1.mesh.connectivity[0])
+
+    if nen0 != 4 or nen1 != 4:
+        raise ValueError("Only 2D quadrilateral elements are allowed.")
+
     # Compare boundaries from the two domains.
     # It is possible that no boundaries are joined.
-    # mm is the so-called "match matrix"
-    match_matrix = boundary_match(
+    matches = _segment_matches(
         boundary0=domain0.boundaries,
-        coordinates0=domain0.mesh.coordinates,
+        xy0=_coordinates_array(domain0.mesh.coordinates),
         boundary1=domain1.boundaries,
-        coordinates1=domain1.mesh.coordinates,
+        xy1=_coordinates_array(domain1.mesh.coordinates),
         tolerance=tol,
     )
 
-    n_matches = max(map(abs, reduce(lambda x, y: x + y, match_matrix)))
-
     # number of nodal points
-    # nnp0 = len(domain0.mesh.coordinates)  # number of nodal points in mesh0
-    # nnp1 = len(domain1.mesh.coordinates)  # number of nodal points in mesh1
     nnp0 = domain0.mesh.coordinates.length  # number of nodal points in mesh0
     nnp1 = domain1.mesh.coordinates.length  # number of nodal points in mesh1
 
-    # number of faces
-    n_faces0 = len(domain0.mesh.connectivity)
-    n_faces1 = len(domain1.mesh.connectivity)
+    # renumber faces and boundaries to global numbering scheme
+    faces0 = _global_numbers(np.array(domain0.mesh.connectivity), nnp0, 0)
+    faces1 = _global_numbers(np.array(domain1.mesh.connectivity), nnp1, nnp0)
 
-    # number of nodes per element (=4 for quads)
-    nen0 = len(domain0.mesh.connectivity[0])
-    nen1 = len(domain1.mesh.connectivity[0])
+    bounds0 = _global_boundaries(domain0.boundaries, nnp0, 0)
+    bounds1 = _global_boundaries(domain1.boundaries, nnp1, nnp0)
 
-    if nen0 != 4 or nen1 != 4:
+    vertices = Points(
+        pairs=(domain0.mesh.coordinates.pairs + domain1.mesh.coordinates.pairs)
+    )
+
+    # map each matched node of domain1 onto its coincident node of domain0,
+    # in a single index array, where the first match of a node takes precedence
+    remap = np.arange(nnp0 + nnp1)
+    sources, targets = [], []
+    for m, n, match_k in matches:
+        seg1 = bounds1[n] if match_k > 0 else bounds1[n][::-1]
+        sources.extend(seg1)
+        targets.extend(bounds0[m])
+
+    if sources:
+        _sources, first = np.unique(sources, return_index=True)
+        remap[_sources] = np.asarray(targets)[first]
+
+    faces = _tuples(faces0) + _tuples(remap[faces1])
+
+    # remove merged boundaries
+    matched0 = set(bounds0[m] for m, _, _ in matches)
+    matched1 = set(bounds1[n] for _, n, _ in matches)
+    new_boundaries = tuple(b for b in bounds0 if b not in matched0) + tuple(
+        b for b in bounds1 if b not in matched1
+    )
+
+    # new mesh retains so-called dangling nodes from donor mesh
+    # as evidence of where they were prior to merge
+    new_mesh = Mesh(coordinates=vertices, connectivity=faces)
+
+    new_domain = Domain(mesh=new_mesh, boundaries=new_boundaries)
+    return new_domain
+
+
+def domain_merge_many(
+    *,
+    domains: tuple[Domain, ...],
+    tolerance: float,
+) -> Domain:
+    """Merges a collection of domains into a single domain in one pass.
+
+    The domains are visited in order.  Each boundary segment of a domain is merged
+    with the first coincident, not yet merged, boundary segment of any preceding
+    domain.  Coincident segments are found with a spatial hash of the segment
+    end points, and the connectivity is renumbered once with a single index array.
+
+    In contrast to repeated use of `domain_merge`, each merged node is renumbered
+    to the first node at that location, even when the coincident segment of the
+    preceding domain was itself merged, and the remaining (unmerged) boundaries
+    use the renumbered nodes.
+
+    Arguments:
+        domains (tuple[Domain, ...]): The domains, each composed of a mesh of 2D
+            quadrilaterals and mergeable boundary(ies).
+        tolerance (float): The maximum norm of the separate x and y distances
+            between two boundary segments for the segments to be merged.
+            Typically set to 1e-6.
+
+    Returns:
+        (Domain): The domain merged from all domains.  The coordinates of all
+            domains are retained, in order, so dangling nodes remain as evidence
+            of where they were prior to merge.
+
+    Raises:
+        ValueError: if no domains are given.
+        ValueError: if meshes with elements that are not 2D quadrilaterals.
+    """
+    if len(domains) == 0:
+        raise ValueError("At least one domain is required.")
+
+    if any(len(d.mesh.connectivity[0]) != 4 for d in domains):
         raise ValueError("Only 2D quadrilateral elements are allowed.")
 
-    # number of boundaries on each domain
-    n_bound0 = len(domain0.boundaries)  # number of boundaries on mesh0
-    n_bound1 = len(domain1.boundaries)  # number of boundaries on mesh1
+    nnps = tuple(d.mesh.coordinates.length for d in domains)
+    offsets = np.concatenate(([0], np.cumsum(nnps)))
 
-    # number of points per boundary
-    n_pts_per_bound0 = tuple(len(x) for x in domain0.boundaries)
-    n_pts_per_bound1 = tuple(len(x) for x in domain1.boundaries)
+    xy = np.concatenate(tuple(_coordinates_array(d.mesh.coordinates) for d in domains))
 
-    # renumber faces to global numbering scheme
-    faces0 = tuple(
+    faces = np.concatenate(
         tuple(
-            (
-                domain0.mesh.connectivity[i][j] + nnp0
-                if domain0.mesh.connectivity[i][j] < 0
-                else domain0.mesh.connectivity[i][j]
-            )
-            for j in range(0, nen0)
+            _global_numbers(np.array(d.mesh.connectivity), nnp, offset)
+            for d, nnp, offset in zip(domains, nnps, offsets)
         )
-        for i in range(0, n_faces0)
-    )
-    faces1 = tuple(
-        tuple(
-            (
-                domain1.mesh.connectivity[i][j] + nnp1 + nnp0
-                if domain1.mesh.connectivity[i][j] < 0
-                else domain1.mesh.connectivity[i][j] + nnp0
-            )
-            for j in range(0, nen1)
-        )
-        for i in range(0, n_faces1)
     )
 
-    # renumber boundaries to global numbering scheme
-    bounds0 = tuple(
-        tuple(
-            (
-                domain0.boundaries[i][j] + nnp0
-                if domain0.boundaries[i][j] < 0
-                else domain0.boundaries[i][j]
-            )
-            for j in range(0, n_pts_per_bound0[i])
-        )
-        for i in range(0, n_bound0)
-    )
-    bounds1 = tuple(
-        tuple(
-            (
-                domain1.boundaries[i][j] + nnp1 + nnp0
-                if domain1.boundaries[i][j] < 0
-                else domain1.boundaries[i][j] + nnp0
-            )
-            for j in range(0, n_pts_per_bound1[i])
-        )
-        for i in range(0, n_bound1)
+    bounds: list[tuple[int, ...]] = []  # all boundaries, global numbering
+    merged: list[bool] = []
+    remap = np.arange(offsets[-1])
+    index = _SegmentIndex(tolerance=tolerance)
+
+    for d, nnp, offset in zip(domains, nnps, offsets):
+        first_sid = len(bounds)
+        bounds.extend(_global_boundaries(d.boundaries, nnp, offset))
+        merged.extend([False] * len(d.boundaries))
+
+        sources, targets = [], []
+        for sid in range(first_sid, len(bounds)):
+            b = bounds[sid]
+            if tolerance <= 0.0:
+                break
+            for cid in index.candidates(n_points=len(b), point=tuple(xy[b[0]])):
+                c = bounds[cid]
+                if _segment_coincident(xy, b, xy, c, tolerance):
+                    pass
+                elif _segment_coincident(xy, b, xy, c[::-1], tolerance):
+                    c = c[::-1]
+                else:
+                    continue
+                sources.extend(b)
+                targets.extend(c)
+                merged[sid] = merged[cid] = True
+                index.remove(cid)
+                break
+
+        if sources:
+            # the targets belong to preceding domains, which are already renumbered
+            _sources, first = np.unique(sources, return_index=True)
+            remap[_sources] = remap[np.asarray(targets)[first]]
+
+        # boundaries of this domain become candidates for the following domains
+        for sid in range(first_sid, len(bounds)):
+            if not merged[sid]:
+                b = bounds[sid]
+                index.add(
+                    sid=sid,
+                    n_points=len(b),
+                    first=tuple(xy[b[0]]),
+                    last=tuple(xy[b[-1]]),
+                )
+
+    vertices = Points(pairs=tuple(map(tuple, xy.tolist())))
+    new_mesh = Mesh(coordinates=vertices, connectivity=_tuples(remap[faces]))
+
+    new_boundaries = tuple(
+        tuple(remap[list(b)].tolist()) for b, m in zip(bounds, merged) if not m
     )
 
-    vertices = Points(
-        pairs=(domain0.mesh.coordinates.pairs + domain1.mesh.coordinates.pairs)
+    return Domain(mesh=new_mesh, boundaries=new_boundaries)
+
+
+def _global_numbers(numbers: np.ndarray, nnp: int, offset: int) -> np.ndarray:
+    """Maps local node numbers, where negative numbers count back from the last
+    of the nnp nodes, to global node numbers starting at offset.
+    """
+    return np.where(numbers < 0, numbers + nnp, numbers) + offset
+
+
+def _global_boundaries(
+    boundaries: tuple[tuple[int, ...], ...], nnp: int, offset: int
+) -> tuple[tuple[int, ...], ...]:
+    """Maps the local node numbers of each boundary to global node numbers."""
+    return tuple(
+        tuple(_global_numbers(np.array(b), nnp, offset).tolist()) for b in boundaries
     )
 
-    if n_matches == 0:
-        # just return the two domains, without merged boudaries,
-        # as a new single domain
-
-        faces = faces0 + faces1
-
-        new_mesh = Mesh(coordinates=vertices, connectivity=faces)
-
-        new_boundaries = bounds0 + bounds1
-
-        new_domain = Domain(mesh=new_mesh, boundaries=new_boundaries)
-        return new_domain
-
-    else:
-
-        # initialize a copy of unmerged boundaries
-        bounds0_unmatched = bounds0
-        bounds1_unmatched = bounds1
-
-        for m, row in enumerate(match_matrix):
-            for n, match_k in enumerate(row):
-                if match_k != 0:
-                    seg0 = bounds0[m]
-                    if match_k > 0:
-                        seg1 = bounds1[n]
-                    elif match_k < 0:
-                        seg1 = bounds1[n][::-1]  # reversed
-                    # renumber the new faces1
-                    for pt in range(0, len(seg1)):
-                        faces1 = tuple(  # not faces1_merged, need to update face1 each k loop
-                            tuple(
-                                faces1[i][j] if faces1[i][j] != seg1[pt] else seg0[pt]
-                                for j in range(0, nen1)
-                            )
-                            for i in range(0, n_faces1)
-                        )
-                    # remove merged boundaries
-                    bounds0_unmatched = boundary_substraction(
-                        boundary=bounds0_unmatched, subtracted=(bounds0[m],)
-                    )
-                    bounds1_unmatched = boundary_substraction(
-                        boundary=bounds1_unmatched, subtracted=(bounds1[n],)
-                    )
-
-        new_boundaries = bounds0_unmatched + bounds1_unmatched
-
-        faces = faces0 + faces1
-
-        # new mesh retains so-called dangling nodes from donor mesh
-        # as evidence of where they were prior to merge
-        new_mesh = Mesh(coordinates=vertices, connectivity=faces)
-
-        new_domain = Domain(mesh=new_mesh, boundaries=new_boundaries)
-        return new_domain
+
+def _tuples(numbers: np.ndarray) -> tuple[tuple[int, ...], ...]:
+    """Returns a 2D int array as a tuple of tuples of ints."""
+    return tuple(map(tuple, numbers.tolist()))
 
 
 """
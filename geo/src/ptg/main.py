@@ -27,6 +27,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from ptg import reader as reader
+from ptg.view_mesh import face_collection
 import xybind as xyb
 
 
@@ -104,20 +105,20 @@ def dualize(*, input_path_file: str) -> bool:
             rc("text", usetex=True)
             rc("font", family="serif")
 
-        # get the nodes
-        nodes = mesh.nodes()
-        # nnp = len(nodes)  # number of nodal points
+        # get the nodes, in columns [node number, x, y, z]
+        nodes = np.array(mesh.nodes(), dtype=np.float64).reshape(-1, 4)
 
-        # create a dictionary lookup table from the index to the nodal (x, y, z)
-        # coordinates
-        keys = [str(int(n[0])) for n in nodes]
-        values = [(n[1], n[2]) for n in nodes]  # collect (x, y) pairs, ignore z value
-        zip_iterator = zip(keys, values)
-        key_value_dict = dict(zip_iterator)
-
-        # get the elements
+        # get the elements, as node numbers
         elements = mesh.connectivity()
 
+        face_style: Final = dict(
+            edgecolor="black",
+            alpha=1.0,
+            linestyle="solid",
+            linewidth=1.0,
+            facecolor="white",
+        )
+
         fig_size_x, fig_size_y = figure.size
         fig = plt.figure(figsize=(fig_size_x, fig_size_y))
 
@@ -139,20 +140,15 @@ def dualize(*, input_path_file: str) -> bool:
             ax.plot(xs, ys, ".")
 
         if figure.elements_shown:
-            # plot the mesh
-            for e in elements:
-                element_points = [key_value_dict[ii] for ii in map(str, e)]
-                exs = [pt[ix] for pt in element_points]
-                eys = [pt[iy] for pt in element_points]
-                plt.fill(
-                    exs,
-                    eys,
-                    edgecolor="black",
-                    alpha=1.0,
-                    linestyle="solid",
-                    linewidth=1.0,
-                    facecolor="white",
+            # plot the mesh, all elements as a single collection
+            ax.add_collection(
+                face_collection(
+                    coordinates=nodes[:, 1:3],
+                    faces=elements,
+                    node_ids=nodes[:, 0].astype(np.int64),
+                    **face_style,
                 )
+            )
 
         ax.set_aspect("equal")
         ax.set_frame_on(b=figure.frame)
@@ -225,34 +221,17 @@ def dualize(*, input_path_file: str) -> bool:
                     ax.plot(xs, ys, "-", alpha=0.5)
                     ax.plot(xs, ys, ".")
 
-                # plot the mesh
-                for row in elements:
-                    # strip off any -1 items in list
-                    e = np.array([i for i in row if i != -1])
-
-                    # Avoid plotting
-                    # "_10_mesh_",
-                    # since that has already been plotted as a non-.dev result above
-                    # if dev_plot_str == "_10_mesh_":
-                    #     keys = [str(int(n[0])) for n in nodes]
-                    #     values = [(n[1], n[2]) for n in nodes]
-                    #     zip_iterator = zip(keys, values)
-                    #     key_value_dict = zip(keys, values)
-                    #     element_points = [key_value_dict[ii] for ii in map(str, e)]
-                    # else:
-                    #     element_points = nodes[e - 1]  # zero offset in Python
-                    element_points = nodes[e - 1]  # zero offset in Python
-                    exs = [pt[ix] for pt in element_points]
-                    eys = [pt[iy] for pt in element_points]
-                    plt.fill(
-                        exs,
-                        eys,
-                        edgecolor="black",
-                        alpha=1.0,
-                        linestyle="solid",
-                        linewidth=1.0,
-                        facecolor="white",
+                # plot the mesh, with one-based node numbers, and with -1 padding
+                # of elements with fewer than the most nodes
+                ax.add_collection(
+                    face_collection(
+                        coordinates=nodes,
+                        faces=elements,
+                        node_ids=np.arange(1, len(nodes) + 1),
+                        **face_style,
                     )
+                )
+                ax.autoscale_view()
 
                 ax.set_title(dev_plot_str)
                 ax.set_aspect("equal")
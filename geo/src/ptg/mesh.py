@@ -11,6 +11,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from numpy import linalg as la
 
+from ptg.abaqus import AbaqusInp, read_inp
 from ptg.mesh_typing import (
     Edges,
     Face,
@@ -20,6 +21,7 @@ from ptg.mesh_typing import (
     Vertices,
     Vertex,
 )
+from ptg.topology import edge_topology
 
 
 class Mesh(NamedTuple):
@@ -97,15 +99,10 @@ def adjacency_upper_diagonal(x: Face) -> Edges:
 def adjacencies_upper_diagonal(xs: Faces) -> Edges:
     """Given a Faces collection, returns the indices of all edges that compose
     the union of Face items as the upper diagonal non-zero elements of the
-    adjacency matrix.
+    adjacency matrix.  The edges are in the order they first appear in the faces.
     """
-    a = tuple()
-    for x in xs:
-        es = adjacency_upper_diagonal(x)
-        for e in es:
-            if e not in a:
-                a += (e,)
-    return a
+    edges = edge_topology(faces=xs).edges_in_order()
+    return tuple(map(tuple, edges.tolist()))
 
 
 def inp_path_file_to_stream(*, pathfile: str):
@@ -116,41 +113,36 @@ def inp_path_file_to_stream(*, pathfile: str):
     return open(str(pf), "rt")
 
 
+def _read_inp(*, pathfile: str, keywords: tuple[str, ...]) -> AbaqusInp:
+    """Reads the keyword blocks of an .inp file, raising OSError if a block
+    cannot be read.
+    """
+    pf = Path(pathfile)
+    if not pf.is_file():
+        print(f"Error: no such file: {pf}")
+        raise FileNotFoundError
+    try:
+        inp = read_inp(pathfile=pathfile, keywords=keywords)
+    except ValueError as error:
+        print(f"Cannot read file: {pathfile}")
+        raise OSError(str(error)) from error
+    print(f"Finished reading file: {pathfile}")
+    return inp
+
+
 def inp_path_file_to_coordinates(*, pathfile: str) -> dict[str, Vertex]:
     """Given an .inp file, returns the coordinates as a dictionary.  The keys
     of the dictionary are a string index that contains the node number, which
     is generally nonsequential.  The values of the dictionary contain a tuple of
     floats that are the (x, y, z) position of the coordinate.
+
+    See ptg.abaqus.read_inp for the nodes as arrays.
     """
     print(f"Reading coordinates from file: {pathfile}")
-    keys = []
-    values = []
-    with inp_path_file_to_stream(pathfile=pathfile) as f:
-        try:
-            line = f.readline()
-            while line:
-                if "*NODE" in line or "*Node" in line:
-                    # collect all nodes
-                    line = f.readline()  # get the next line
-                    while "*" not in line:
-                        line = line.split(",")
-                        keys.append(
-                            line[0]
-                        )  # collect the node number, generally nonseqential
-                        line = line[1:]  # ignore the first column node number
-                        line = [x.strip() for x in line]  # remove whitespace and \t \n
-                        new_coordinate = tuple(map(lambda x: float(eval(x)), line))
-                        values.append(new_coordinate)
-                        line = f.readline()
-                else:
-                    line = f.readline()
-            print(f"Finished reading file: {pathfile}")
-        except SyntaxError:
-            print(f"Cannot read file: {pathfile}")
-            raise OSError
-    # return coordinates
-    zip_iterator = zip(keys, values)
-    return dict(zip_iterator)
+    inp = _read_inp(pathfile=pathfile, keywords=("NODE",))
+    keys = map(str, inp.node_ids.tolist())
+    values = map(tuple, inp.coordinates.tolist())
+    return dict(zip(keys, values))
 
 
 def inp_path_file_to_connectivities(*, pathfile: str) -> Faces:
@@ -158,29 +150,16 @@ def inp_path_file_to_connectivities(*, pathfile: str) -> Faces:
     of ints.  The first item in the tuple is the element number, which is generally
     non-sequential.  The remaining values in the tuple are the ordered connectivity
     of the element.
+
+    See ptg.abaqus.read_inp for the elements as arrays.
     """
     print(f"Reading connectivities from file: {pathfile}")
-    connectivities = ()  # empty tuple
-    with inp_path_file_to_stream(pathfile=pathfile) as f:
-        try:
-            line = f.readline()
-            while line:
-                if "*ELEMENT" in line or "*Element" in line:
-                    # collect all elements
-                    line = f.readline()  # get the next line
-                    while "*" not in line and len(line) > 0:
-                        line = line.split(",")
-                        # line = line[1:]  # ignore the first column node number
-                        line = [x.strip() for x in line]  # remove whitespace and \t \n
-                        new_connectivity = tuple(map(lambda x: int(eval(x)), line))
-                        connectivities += ((new_connectivity),)
-                        line = f.readline()
-                else:
-                    line = f.readline()
-            print(f"Finished reading file: {pathfile}")
-        except NameError:
-            print(f"Cannot read file: {pathfile}")
-            raise OSError
+    inp = _read_inp(pathfile=pathfile, keywords=("ELEMENT",))
+    connectivities = tuple(
+        tuple(row)
+        for block in inp.element_blocks
+        for row in np.column_stack((block.ids, block.connectivity)).tolist()
+    )
     return connectivities
 
 
@@ -192,36 +171,8 @@ def inp_path_file_to_boundary(*, pathfile: str) -> FixedDisplacements:
     boundary conditions (fixed x, y, and/or z displacements).
     """
     print(f"Reading boundary from file: {pathfile}")
-    keys = []
-    values = []
-    with inp_path_file_to_stream(pathfile=pathfile) as f:
-        try:
-            line = f.readline()
-            while line:
-                if "*BOUNDARY" in line or "*Boundary" in line:
-                    # collect all nodes
-                    line = f.readline()  # get the next line
-                    while "*" not in line:
-                        line = line.split(",")
-                        keys.append(
-                            line[0]
-                        )  # collect the node number, generally nonseqential
-                        line = line[1:]  # ignore the first column node number
-                        line = [x.strip() for x in line]  # remove whitespace and \t \n
-                        new_fixed_displacements = tuple(
-                            map(lambda x: int(eval(x)), line)
-                        )
-                        values.append(new_fixed_displacements)
-                        line = f.readline()
-                else:
-                    line = f.readline()
-            print(f"Finished reading file: {pathfile}")
-        except NameError:
-            print(f"Cannot read file: {pathfile}")
-            raise OSError
-    # return coordinates
-    zip_iterator = zip(keys, values)
-    return dict(zip_iterator)
+    inp = _read_inp(pathfile=pathfile, keywords=("BOUNDARY",))
+    return inp.boundary
 
 
 def faces_as_nodes_to_faces_as_vertices(
@@ -507,6 +458,185 @@ def minimum_scaled_jacobian_of_quad(*, vertices: QuadVertices) -> float:
     return min(scaled_js)
 
 
+def quad_vertices(*, coordinates: np.ndarray, connectivity: np.ndarray) -> np.ndarray:
+    """Given nodal coordinates and quad connectivity, returns the vertices of all
+    quads as a single array, the input of the vectorized quality metrics.
+
+    Arguments:
+        coordinates (np.ndarray): The (n_nodes, 2) or (n_nodes, 3) nodal
+            positions.  Only the x and y components are used.
+        connectivity (np.ndarray): The (n_quads, 4) zero-based row indices into
+            coordinates, counter-clockwise.
+
+    Returns:
+        The (n_quads, 4, 2) array of (x, y) vertices.
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    connectivity = np.asarray(connectivity, dtype=np.int64)
+    return coordinates[:, :2][connectivity]
+
+
+class QuadQuality(NamedTuple):
+    """Creates the quality metrics of n quads, each an (n,) array, as computed one
+    quad at a time by skew_of_quad, aspect_ratio_of_quad,
+    minimum_jacobian_of_quad, and minimum_scaled_jacobian_of_quad.
+    """
+
+    skew: np.ndarray
+    aspect_ratio: np.ndarray
+    minimum_jacobian: np.ndarray
+    minimum_scaled_jacobian: np.ndarray
+
+
+def _edges_of_quads(vertices: np.ndarray) -> np.ndarray:
+    """Returns the (n_quads, 4, 2) edge vectors e1, e2, e3, e4 of each quad, with
+    e1 from node 1 to node 2, ..., e4 from node 4 to node 1.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if vertices.ndim != 3 or vertices.shape[1:] != (4, 2):
+        raise ValueError("vertices must be an (n_quads, 4, 2) array")
+    return np.roll(vertices, -1, axis=1) - vertices
+
+
+def _nodal_areas(edges: np.ndarray) -> np.ndarray:
+    """Returns the (n_quads, 4) signed nodal areas, the z component of the cross
+    product of the two edges that meet at each node.
+    """
+    previous = np.roll(edges, 1, axis=1)  # e4, e1, e2, e3
+    return previous[..., 0] * edges[..., 1] - previous[..., 1] * edges[..., 0]
+
+
+def nodal_areas_of_quads(*, vertices: np.ndarray) -> np.ndarray:
+    """Vectorized nodal_areas_of_quad.
+
+    Arguments:
+        vertices (np.ndarray): The (n_quads, 4, 2) vertices, counter-clockwise.
+
+    Returns:
+        The (n_quads, 4) signed areas at nodes 1, 2, 3, and 4 of each quad.
+    """
+    return _nodal_areas(_edges_of_quads(vertices))
+
+
+def quality_of_quads(*, vertices: np.ndarray) -> QuadQuality:
+    """Computes all quality metrics of all quads in a single vectorized pass.
+
+    Arguments:
+        vertices (np.ndarray): The (n_quads, 4, 2) vertices, counter-clockwise,
+            e.g., from quad_vertices().
+
+    Returns:
+        QuadQuality: The skew, aspect ratio, minimum Jacobian, and minimum scaled
+            Jacobian of each quad.
+
+    Raises:
+        ValueError if vertices is not an (n_quads, 4, 2) array.
+    """
+    edges = _edges_of_quads(vertices)
+    areas = _nodal_areas(edges)
+
+    # principal axes
+    axis_x = edges[:, 2] - edges[:, 0]  # e3 - e1
+    axis_y = edges[:, 3] - edges[:, 1]  # e4 - e2
+    length_x = np.linalg.norm(axis_x, axis=-1)
+    length_y = np.linalg.norm(axis_y, axis=-1)
+
+    skew = np.absolute(
+        np.sum(
+            (axis_x / length_x[:, np.newaxis]) * (axis_y / length_y[:, np.newaxis]),
+            axis=-1,
+        )
+    )
+    aspect_ratio = np.maximum(length_x / length_y, length_y / length_x)
+
+    # edge length combinations L4L1, L1L2, L2L3, L3L4
+    lengths = np.linalg.norm(edges, axis=-1)
+    lilk = np.roll(lengths, 1, axis=1) * lengths
+
+    return QuadQuality(
+        skew=skew,
+        aspect_ratio=aspect_ratio,
+        minimum_jacobian=np.min(areas, axis=1),
+        minimum_scaled_jacobian=np.min(areas / lilk, axis=1),
+    )
+
+
+class MetricSummary(NamedTuple):
+    """Creates the distribution summary of one quality metric over a mesh."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    percentiles: dict[float, float]  # percentile -> value
+
+
+class QualitySummary(NamedTuple):
+    """Creates the quality summary of a quad mesh."""
+
+    n_quads: int
+    n_inverted: int  # number of quads with a negative minimum Jacobian
+    skew: MetricSummary
+    aspect_ratio: MetricSummary
+    minimum_jacobian: MetricSummary
+    minimum_scaled_jacobian: MetricSummary
+
+    def report(self) -> str:
+        """Returns the summary as a text table."""
+        qs = tuple(self.skew.percentiles.keys())
+        header = ("metric", "min") + tuple(f"p{q:g}" for q in qs) + ("max", "mean")
+        lines = [
+            f"quads: {self.n_quads}, inverted: {self.n_inverted}",
+            "".join(f"{h:>24}" if k == 0 else f"{h:>12}" for k, h in enumerate(header)),
+        ]
+        for name in QuadQuality._fields:
+            m = getattr(self, name)
+            values = (m.minimum,) + tuple(m.percentiles.values())
+            values += (m.maximum, m.mean)
+            lines.append(f"{name:>24}" + "".join(f"{v:>12.4g}" for v in values))
+        return "\n".join(lines)
+
+
+def quality_summary(
+    *,
+    quality: QuadQuality,
+    percentiles: tuple[float, ...] = (1.0, 5.0, 50.0, 95.0, 99.0),
+) -> QualitySummary:
+    """Summarizes the quality metrics of a mesh, e.g., for a quality histogram
+    report.
+
+    Arguments:
+        quality (QuadQuality): The metrics from quality_of_quads().
+        percentiles (tuple[float, ...]): The percentiles, in [0, 100], of each
+            metric to report.  Default is (1, 5, 50, 95, 99).
+
+    Returns:
+        QualitySummary: The minimum, percentiles, maximum, and mean of each
+            metric, and the number of inverted quads.
+
+    Raises:
+        ValueError if there are no quads.
+    """
+    n_quads = len(quality.skew)
+    if n_quads == 0:
+        raise ValueError("quality of at least one quad is required")
+
+    def summary(values: np.ndarray) -> MetricSummary:
+        return MetricSummary(
+            minimum=float(np.min(values)),
+            maximum=float(np.max(values)),
+            mean=float(np.mean(values)),
+            percentiles=dict(
+                zip(percentiles, np.percentile(values, percentiles).tolist())
+            ),
+        )
+
+    return QualitySummary(
+        n_quads=n_quads,
+        n_inverted=int(np.count_nonzero(quality.minimum_jacobian < 0.0)),
+        **{name: summary(getattr(quality, name)) for name in QuadQuality._fields},
+    )
+
+
 """
 Copyright 2023 Sandia National Laboratories
 
@@ -3,92 +3,206 @@
 # certain rights in this software.
 
 
-"""This module provides smoothing operation on a mesh."""
+"""This module provides smoothing operation on a mesh.
 
-from itertools import repeat
+The smoothing engine builds the sparse adjacency matrix of the mesh once, then
+applies Jacobi or Gauss-Seidel Laplacian sweeps as sparse matrix products,
+with degrees of freedom held fixed by a boolean mask.
+"""
+
+from typing import NamedTuple
 
 import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spsolve_triangular
 
-from ptg.mesh import adjacencies_upper_diagonal
+METHODS = ("jacobi", "gauss_seidel")
 
 
-def smooth_neighbor_nonweighted(*, nodes, elements, boundary, update_ratio):
-    """Given nonsequential nodes, elements, boundary elements
-    containing homogenous displacements in [1 .. n_space_dimensions],
-    and update_ratio between (0, 1), returns the nodes in updated positions.
-    """
-    assert update_ratio > 0.0 and update_ratio < 1.0
+class Smoothing(NamedTuple):
+    """Creates the result of a number of Laplacian smoothing sweeps."""
+
+    displacements: np.ndarray  # (n_nodes, n_dimensions) total of all sweeps
+    iterations: int  # number of sweeps performed
+    residual: float  # largest nodal displacement of the final sweep
+    converged: bool  # True if the residual is at or below the tolerance
+
 
-    displacements = dict()  # empty prior to update
+def adjacency_matrix(*, connectivity, n_nodes: int) -> sparse.csr_matrix:
+    """Given element connectivity as rows of 0-index node rows, returns the
+    symmetric node-to-node adjacency matrix.  The edges of an element connect
+    consecutive nodes, circularly, i.e., the edges of the right hand rule.
 
-    boundary_keys = boundary.keys()
+    Arguments:
+        connectivity (array_like of int): The (n_elements, n_nodes_per_element)
+            node rows of each element.
+        n_nodes (int): The number of nodes, i.e., rows of the matrix.
 
-    elements_wo_element_number = tuple([x[1:] for x in elements])
-    adj = adjacencies_upper_diagonal(xs=elements_wo_element_number)
+    Returns:
+        The (n_nodes, n_nodes) CSR matrix with a 1.0 for every edge.
 
-    # loop over all nodes in mesh
-    for node_key, node_values in nodes.items():
-        update = []
-        connected_node_labels = tuple(
-            y[0] if y[0] != int(node_key) else y[1]
-            for y in tuple(filter(lambda x: int(node_key) in x, adj))
+    Raises:
+        ValueError if the connectivity is not two dimensional or references a
+            node outside of [0, n_nodes).
+    """
+    xs = np.asarray(connectivity, dtype=np.int64)
+    if xs.ndim != 2:
+        raise ValueError(
+            "Error: connectivity must be (n_elements, n_nodes_per_element)."
+        )
+    if xs.size > 0 and (xs.min() < 0 or xs.max() >= n_nodes):
+        raise ValueError(f"Error: connectivity must be in [0, {n_nodes}).")
+
+    heads = xs.ravel()
+    tails = np.roll(xs, -1, axis=1).ravel()
+    edge = heads != tails
+    rows = np.concatenate((heads[edge], tails[edge]))
+    cols = np.concatenate((tails[edge], heads[edge]))
+    adjacency = sparse.coo_matrix(
+        (np.ones(rows.size), (rows, cols)), shape=(n_nodes, n_nodes)
+    ).tocsr()  # sums duplicate edges shared by neighboring elements
+    adjacency.data[:] = 1.0
+    return adjacency
+
+
+def smooth_laplacian(
+    *,
+    coordinates,
+    adjacency: sparse.csr_matrix,
+    fixed=None,
+    update_ratio: float = 0.5,
+    method: str = "jacobi",
+    iterations: int = 1,
+    tol: float = 0.0,
+) -> Smoothing:
+    """Given nodal coordinates and their adjacency matrix, moves each free
+    degree of freedom a fraction of the way toward the average of its neighbors,
+    for a number of sweeps or until the sweep displacement is within tolerance.
+
+    Arguments:
+        coordinates (array_like of float): The (n_nodes, n_dimensions)
+            positions, in the order of the adjacency rows.
+        adjacency (sparse.csr_matrix): The (n_nodes, n_nodes) matrix from
+            adjacency_matrix(), built once and reused.
+        fixed (array_like of bool or None): The (n_nodes, n_dimensions) mask of
+            fixed degrees of freedom.  Default None, i.e., all are free.
+            Nodes without neighbors are always fixed.
+        update_ratio (float): The fraction of the way to the neighbor average,
+            in (0, 1).  Default 0.5.
+        method (str): "jacobi" updates all nodes from the prior sweep;
+            "gauss_seidel" uses the nodes already updated in the current sweep.
+            Default "jacobi".
+        iterations (int): The maximum number of sweeps.  Default 1.
+        tol (float): The largest nodal displacement of a sweep at or below
+            which smoothing has converged.  Default 0.0.
+
+    Returns:
+        Smoothing: The total displacements and the convergence history.
+
+    Raises:
+        ValueError if the arguments are not consistent or out of range.
+    """
+    x0 = np.asarray(coordinates, dtype=np.float64)
+    if x0.ndim != 2 or adjacency.shape != (x0.shape[0], x0.shape[0]):
+        raise ValueError("Error: coordinates and adjacency shapes are inconsistent.")
+    if not 0.0 < update_ratio < 1.0:
+        raise ValueError("Error: update_ratio must be in (0, 1).")
+    if method not in METHODS:
+        raise ValueError(f"Error: method must be one of {METHODS}.")
+    if iterations < 1:
+        raise ValueError("Error: iterations must be one or more.")
+
+    free = np.ones(x0.shape, dtype=bool)
+    if fixed is not None:
+        fixed = np.asarray(fixed, dtype=bool)
+        if fixed.shape != x0.shape:
+            raise ValueError("Error: fixed and coordinates shapes are inconsistent.")
+        free &= ~fixed
+
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    free &= (degree > 0)[:, np.newaxis]
+    inverse_degree = np.divide(1.0, degree, out=np.zeros_like(degree), where=degree > 0)
+
+    if method == "gauss_seidel":
+        # Each sweep solves (I - r F L) x_new = x + r F (U x - x) per dimension,
+        # with L and U the strict lower and upper parts of D^-1 A, and F the
+        # free mask, so nodes use their neighbors' current sweep positions.
+        weights = sparse.diags(inverse_degree) @ adjacency
+        lower = sparse.tril(weights, k=-1, format="csr")
+        upper = sparse.triu(weights, k=1, format="csr")
+        identity = sparse.identity(x0.shape[0], format="csr")
+        systems = tuple(
+            (identity - update_ratio * sparse.diags(f.astype(float)) @ lower).tocsr()
+            for f in free.T
         )
-        if node_key in boundary_keys:
-            # node with at least one fixed dof
-            # number of space dimensions at this node
-            # node_nsd = len(nodes[node_key])
-            node_nsd = len(node_values)
-            # assume all ndof at node are active (non-fixed) as default
-            dof_fixity = [item for item in repeat(False, node_nsd)]
-            node_dof_fixed = boundary[node_key]
-            # node_dof_fixed = tuple(boundary[node_key])
-            # for i, fixed in enumerate(node_dof_fixed):
-            # for i, fixed in enumerate(node_dof_fixed):
-            # for fixed in range(node_dof_fixed[0], node_dof_fixed[-1] + 1):  # 0-index Python
-            # if isinstance(node_dof_fixed, str) and node_dof_fixed.lower() == "encastre":
-            #     node_dof_fixed = tuple([i + 1 for i in range(0, node_nsd)])  # 0-index Python
-            # else:
-            #     # cast as a tuple, guard against single dof being interpreted as an in
-            #     node_dof_fixed = tuple([node_dof_fixed])
-            for item in node_dof_fixed:
-                # dof_index = int(item)  # satisfy type explicitly for linting in Python
-                # dof_fixity[dof_index - 1] = True  # flip to be a fixed dof, 0-index Python
-                dof_fixity[item - 1] = True  # flip to be a fixed dof, 0-index Python
-
-            # for i, fixed in enumerate(node_dof_fixed):
-            for i, fixed in enumerate(dof_fixity):
-                if not fixed:
-                    # dof is not fixed
-                    # position of subject node
-                    # p_subject = nodes[str(node_key)][i]
-                    p_subject = node_values[i]
-                    # positions for degree of freedom i for connected nodes qs
-                    qs = [nodes[str(k)][i] for k in connected_node_labels]
-                    num_connections = len(qs)
-                    delta = (1.0 / num_connections) * sum(qs) - p_subject
-                    delta = delta * update_ratio
-                else:
-                    # dof is fixed
-                    delta = 0.0
-
-                # for both fixed and not fixed, append
-                update.append(delta)
-
-            displacements[node_key] = tuple(update)
+
+    x = x0.copy()
+    displacements = np.zeros(x0.shape)
+    residual = np.inf
+    k = 0
+    while k < iterations and not residual <= tol:
+        k += 1
+        if method == "jacobi":
+            average = (adjacency @ x) * inverse_degree[:, np.newaxis]
+            delta = np.where(free, (average - x) * update_ratio, 0.0)
         else:
-            # fully unconstrained node, all dof are active, no dof are fixed
-            # p_subject = nodes[str(node_key)]
-            p_subject = node_values
-            np_p_subject = np.array(p_subject)
-            qs = [nodes[str(k)] for k in connected_node_labels]
-            num_connections = len(qs)
-            np_qs = np.array(qs)
-            sum_np_qs = sum(np_qs)
-            deltas = (1.0 / num_connections) * sum_np_qs - np_p_subject
-            deltas = deltas * update_ratio
-            displacements[node_key] = tuple(deltas)
-
-    return displacements
+            rhs = x + update_ratio * np.where(free, upper @ x - x, 0.0)
+            x_new = np.column_stack(
+                tuple(
+                    spsolve_triangular(m, rhs[:, i], lower=True)
+                    for (i, m) in enumerate(systems)
+                )
+            )
+            delta = np.where(free, x_new - x, 0.0)
+        x += delta
+        displacements += delta
+        residual = float(np.linalg.norm(delta, axis=1).max(initial=0.0))
+
+    return Smoothing(
+        displacements=displacements,
+        iterations=k,
+        residual=residual,
+        converged=bool(residual <= tol),
+    )
+
+
+def smooth_neighbor_nonweighted(*, nodes, elements, boundary, update_ratio):
+    """Given nonsequential nodes, elements, boundary elements
+    containing homogenous displacements in [1 .. n_space_dimensions],
+    and update_ratio between (0, 1), returns the displacements of one
+    smoothing update of the nodes.
+
+    For many sweeps, build the adjacency_matrix() once and use
+    smooth_laplacian() instead.
+    """
+    assert update_ratio > 0.0 and update_ratio < 1.0
+
+    keys = tuple(nodes.keys())
+    rows = {int(key): i for (i, key) in enumerate(keys)}
+    coordinates = np.array(tuple(nodes[key] for key in keys), dtype=np.float64)
+
+    # group elements by number of nodes, e.g., for meshes of tris and quads
+    groups = dict()
+    for x in elements:
+        groups.setdefault(len(x) - 1, []).append(tuple(rows[n] for n in x[1:]))
+    adjacency = sum(
+        (adjacency_matrix(connectivity=g, n_nodes=len(keys)) for g in groups.values()),
+        sparse.csr_matrix((len(keys), len(keys))),
+    )
+    adjacency.data[:] = 1.0
+
+    fixed = np.zeros(coordinates.shape, dtype=bool)
+    for key, dofs in boundary.items():
+        if key in nodes:
+            fixed[rows[int(key)], np.array(dofs) - 1] = True
+
+    smoothing = smooth_laplacian(
+        coordinates=coordinates,
+        adjacency=adjacency,
+        fixed=fixed,
+        update_ratio=update_ratio,
+    )
+    return dict(zip(keys, map(tuple, smoothing.displacements)))
 
 
 """
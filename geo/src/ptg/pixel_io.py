@@ -0,0 +1,256 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module streams voxel volumes, e.g., pixel shape masks and composed
+scenes, to and from files, one slab of i (height) layers at a time.
+
+Formats:
+    raw: the voxels in C order, (i, j, k) with k fastest, as binary values of
+        the dtype, with no header.  The shape and dtype are not stored.
+    npy: the NumPy `.npy` format, which stores the shape and dtype.
+    spn: a segmentation text format, one integer label per line, in the C order
+        of the raw format.  The shape is not stored.
+
+Neither writing nor reading holds more than one slab in memory, so volumes
+larger than memory can be produced, e.g., from a memory mapped scene, and
+reloaded.
+"""
+
+from itertools import islice
+from pathlib import Path
+from typing import Final, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from ptg.pixel_scene import PixelScene
+from ptg.pixel_shape import PixelShapeBase
+
+FORMATS: Final = ("raw", "npy", "spn")
+
+
+def _format(pathfile: str, fmt: Optional[str]) -> str:
+    """Returns the format, given or else from the file suffix.
+
+    Raises:
+        ValueError if the format is unknown.
+    """
+    result = fmt if fmt is not None else Path(pathfile).suffix.lstrip(".").lower()
+    if result not in FORMATS:
+        raise ValueError(f"Error: voxel format '{result}' is not one of {FORMATS}.")
+    return result
+
+
+def _volume(volume) -> np.ndarray:
+    """Returns the voxel array of a shape, a scene, or an array."""
+    if isinstance(volume, PixelShapeBase):
+        return volume.mask
+    if isinstance(volume, PixelScene):
+        return volume.labels
+    return np.asanyarray(volume)
+
+
+def write_slabs(
+    *,
+    pathfile: str,
+    slabs: Iterable[np.ndarray],
+    shape: tuple[int, int, int],
+    dtype=np.uint8,
+    fmt: Optional[str] = None,
+):
+    """Writes a voxel volume from its slabs, in order along the i axis.
+
+    Arguments:
+        pathfile (str): The fully pathed output file.
+        slabs (Iterable of np.ndarray): The (n_i, shape[1], shape[2]) slabs
+            that, stacked along i, compose the volume, e.g., from a generator
+            that never holds the whole volume.
+        shape (tuple[int, int, int]): The (i, j, k) shape of the volume.
+        dtype: The data type of the voxels on file.  Defaults to np.uint8.
+        fmt (str or None): One of "raw", "npy", or "spn".  Default is None,
+            the suffix of pathfile.
+
+    Raises:
+        ValueError if the format is unknown, or the slabs do not compose the
+            shape.
+    """
+    _fmt = _format(pathfile, fmt)
+    shape = tuple(int(n) for n in shape)
+    dtype = np.dtype(dtype)
+
+    if _fmt == "npy":
+        out = np.lib.format.open_memmap(pathfile, mode="w+", dtype=dtype, shape=shape)
+    else:
+        out = open(pathfile, "wb" if _fmt == "raw" else "wt")
+
+    try:
+        i = 0
+        for slab in slabs:
+            slab = np.asarray(slab)
+            if slab.ndim != 3 or slab.shape[1:] != shape[1:]:
+                raise ValueError(
+                    f"Error: slab of shape {slab.shape} does not fit volume {shape}."
+                )
+            if i + len(slab) > shape[0]:
+                raise ValueError(f"Error: slabs exceed the {shape[0]} i layers.")
+
+            if _fmt == "npy":
+                out[i : i + len(slab)] = slab
+            elif _fmt == "raw":
+                np.ascontiguousarray(slab, dtype=dtype).tofile(out)
+            else:
+                np.savetxt(out, slab.astype(dtype, copy=False).reshape(-1), fmt="%d")
+            i += len(slab)
+
+        if i != shape[0]:
+            raise ValueError(f"Error: slabs give {i} of the {shape[0]} i layers.")
+    finally:
+        if _fmt == "npy":
+            out.flush()
+            del out
+        else:
+            out.close()
+
+
+def write_voxels(
+    *,
+    pathfile: str,
+    volume: Union[np.ndarray, PixelShapeBase, PixelScene],
+    dtype=None,
+    fmt: Optional[str] = None,
+    chunk: int = 64,
+):
+    """Writes a voxel volume, chunk i layers at a time, e.g., so a memory
+    mapped scene is never read into memory at once.
+
+    Arguments:
+        pathfile (str): The fully pathed output file.
+        volume (np.ndarray, PixelShapeBase, or PixelScene): The 3D voxels, the
+            mask of a shape, or the labels of a scene.
+        dtype: The data type of the voxels on file.  Default is None, the data
+            type of the volume.
+        fmt (str or None): One of "raw", "npy", or "spn".  Default is None,
+            the suffix of pathfile.
+        chunk (int): The number of i layers per slab.  Defaults to 64.
+
+    Raises:
+        ValueError if the format is unknown, the volume is not 3D, or chunk < 1.
+    """
+    if chunk < 1:
+        raise ValueError("Error: chunk must be one or greater.")
+
+    voxels = _volume(volume)
+    if voxels.ndim != 3:
+        raise ValueError(f"Error: the volume must be 3D, not {voxels.ndim}D.")
+
+    write_slabs(
+        pathfile=pathfile,
+        slabs=(voxels[i : i + chunk] for i in range(0, len(voxels), chunk)),
+        shape=voxels.shape,
+        dtype=voxels.dtype if dtype is None else dtype,
+        fmt=fmt,
+    )
+
+
+def open_voxels(
+    *,
+    pathfile: str,
+    shape: Optional[tuple[int, int, int]] = None,
+    dtype=np.uint8,
+    fmt: Optional[str] = None,
+) -> np.memmap:
+    """Returns a read only memory map of a raw or npy voxel file, which reads
+    voxels from file only as they are indexed.
+
+    Arguments:
+        pathfile (str): The fully pathed voxel file.
+        shape (tuple[int, int, int] or None): The (i, j, k) shape, required
+            for the raw format, and ignored for the npy format.
+        dtype: The data type of a raw file, ignored for the npy format.
+            Defaults to np.uint8.
+        fmt (str or None): One of "raw" or "npy".  Default is None, the suffix
+            of pathfile.
+
+    Raises:
+        FileNotFoundError if the file does not exist.
+        ValueError if the format cannot be mapped, e.g., spn text, or the shape
+            of a raw file is not given.
+    """
+    _fmt = _format(pathfile, fmt)
+    if not Path(pathfile).is_file():
+        raise FileNotFoundError(f"Error: no such file: {pathfile}")
+
+    if _fmt == "npy":
+        return np.load(pathfile, mmap_mode="r")
+    if _fmt == "raw":
+        if shape is None:
+            raise ValueError("Error: the shape of a raw voxel file is required.")
+        return np.memmap(pathfile, dtype=dtype, mode="r", shape=tuple(shape))
+    raise ValueError("Error: spn text cannot be memory mapped, use read_slabs().")
+
+
+def read_slabs(
+    *,
+    pathfile: str,
+    shape: Optional[tuple[int, int, int]] = None,
+    dtype=np.uint8,
+    fmt: Optional[str] = None,
+    chunk: int = 64,
+) -> Iterator[np.ndarray]:
+    """Yields the slabs of a voxel file, in order along the i axis, each a
+    (n_i, j, k) array of at most chunk i layers.
+
+    Arguments:
+        pathfile (str): The fully pathed voxel file.
+        shape (tuple[int, int, int] or None): The (i, j, k) shape, required
+            for the raw and spn formats, and ignored for the npy format.
+        dtype: The data type of the voxels.  Defaults to np.uint8.
+        fmt (str or None): One of "raw", "npy", or "spn".  Default is None,
+            the suffix of pathfile.
+        chunk (int): The number of i layers per slab.  Defaults to 64.
+
+    Raises:
+        FileNotFoundError if the file does not exist.
+        ValueError if the format is unknown, the shape is missing, chunk < 1, or
+            the file has fewer voxels than the shape.
+    """
+    if chunk < 1:
+        raise ValueError("Error: chunk must be one or greater.")
+
+    _fmt = _format(pathfile, fmt)
+    if _fmt != "spn":
+        voxels = open_voxels(pathfile=pathfile, shape=shape, dtype=dtype, fmt=_fmt)
+        for i in range(0, len(voxels), chunk):
+            yield np.array(voxels[i : i + chunk])
+        return
+
+    if shape is None:
+        raise ValueError("Error: the shape of a spn voxel file is required.")
+    if not Path(pathfile).is_file():
+        raise FileNotFoundError(f"Error: no such file: {pathfile}")
+
+    n_i, n_j, n_k = (int(n) for n in shape)
+    with open(pathfile, "rt") as f:
+        for i in range(0, n_i, chunk):
+            n_layers = min(chunk, n_i - i)
+            count = n_layers * n_j * n_k
+            values = np.fromiter(map(int, islice(f, count)), dtype=dtype)
+            if values.size != count:
+                raise ValueError(f"Error: {pathfile} ends before shape {shape}.")
+            yield values.reshape(n_layers, n_j, n_k)
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,232 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module composes many pixel shapes into one labeled world volume.
+
+Each shape is placed at its pixel anchor.  The world volume is the bounding box
+of all placed shapes, and is allocated once, in memory or as a memory mapped
+`.npy` file.  The volume is filled in tiles, slabs along the x (height) axis,
+and each tile applies, in order, only the shapes that overlap it.  Tiles are
+disjoint, so they are filled independently, and in parallel with more than one
+worker.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Iterable, NamedTuple, Optional, Union
+
+import numpy as np
+
+from ptg.pixel_shape import PixelAnchor, PixelBoundingBox, PixelShapeBase
+
+OPERATIONS: Final = ("union", "subtract")
+
+
+class Placement(NamedTuple):
+    """Creates the placement of a shape in the scene, as a namedtuple, with the
+    following attributes:
+
+    Attributes:
+        shape (PixelShapeBase): the shape, placed at its anchor.
+        label (int): the label written to the voxels the shape occupies.
+            Defaults to 1.
+        operation (str): "union" writes the label to the voxels the shape
+            occupies, and "subtract" clears those voxels to zero (0).
+            Defaults to "union".
+    """
+
+    shape: PixelShapeBase
+    label: int = 1
+    operation: str = "union"
+
+
+class PixelScene(NamedTuple):
+    """Creates the composed scene, as a namedtuple, with the following attributes:
+
+    Attributes:
+        anchor (PixelAnchor): the (x, y, z) pixel position of labels[0, 0, 0].
+        labels (np.ndarray): the (dx, dy, dz) label of each voxel, zero (0) if
+            no shape occupies it.  A np.memmap if the scene is written to file.
+    """
+
+    anchor: PixelAnchor
+    labels: np.ndarray
+
+
+def _extent(shape: PixelShapeBase) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the low (inclusive) and high (exclusive) pixel corners of a shape,
+    which cover both its bounding box and its mask.
+    """
+    low = np.array(shape.anchor, dtype=np.int64)
+    size = np.maximum(np.array(shape.bounding_box), shape.mask.shape)
+    return low, low + size
+
+
+def scene_bounding_box(
+    *, shapes: Iterable[PixelShapeBase]
+) -> tuple[PixelAnchor, PixelBoundingBox]:
+    """Returns the anchor and bounding box, in pixels, that enclose all shapes.
+
+    Raises:
+        ValueError if there are no shapes.
+    """
+    extents = [_extent(s) for s in shapes]
+    if not extents:
+        raise ValueError("Error: the scene must have at least one shape.")
+    low = np.min([e[0] for e in extents], axis=0)
+    high = np.max([e[1] for e in extents], axis=0)
+    return PixelAnchor(*map(int, low)), PixelBoundingBox(*map(int, high - low))
+
+
+def _as_placements(
+    items: Iterable[Union[Placement, PixelShapeBase]],
+) -> tuple[Placement, ...]:
+    """Returns the items as placements.  A bare shape is a union, labeled with
+    its one-based position among the items.
+    """
+    result = []
+    for k, item in enumerate(items):
+        placement = item if isinstance(item, Placement) else Placement(item, k + 1)
+        if placement.operation not in OPERATIONS:
+            raise ValueError(
+                f"Error: operation '{placement.operation}' is not one of {OPERATIONS}."
+            )
+        result.append(placement)
+    return tuple(result)
+
+
+def _fill_tile(
+    *,
+    labels: np.ndarray,
+    anchor: np.ndarray,
+    start: int,
+    stop: int,
+    placements: tuple[Placement, ...],
+    extents: tuple[tuple[np.ndarray, np.ndarray], ...],
+):
+    """Applies, in order, the placements that overlap the tile of world x pixels
+    [start, stop) to the labels of the tile.
+    """
+    tile_low = anchor + (start, 0, 0)
+    tile_high = anchor + (stop, labels.shape[1], labels.shape[2])
+    for placement, (low, high) in zip(placements, extents):
+        lo = np.maximum(low, tile_low)
+        hi = np.minimum(high, tile_high)
+        if np.any(lo >= hi):
+            continue  # the shape does not overlap the tile
+
+        mask = placement.shape.mask
+        # clip to the mask, whose shape may be smaller than the bounding box
+        hi = np.minimum(hi, low + mask.shape)
+        if np.any(lo >= hi):
+            continue
+
+        world = tuple(slice(a, b) for a, b in zip(lo - anchor, hi - anchor))
+        local = tuple(slice(a, b) for a, b in zip(lo - low, hi - low))
+        value = placement.label if placement.operation == "union" else 0
+        np.copyto(labels[world], value, where=mask[local] != 0)
+
+
+def compose(
+    *,
+    placements: Iterable[Union[Placement, PixelShapeBase]],
+    dtype=np.uint16,
+    pathfile: Optional[str] = None,
+    tile: int = 64,
+    workers: int = 1,
+) -> PixelScene:
+    """Composes shapes into one labeled world volume.  Placements are applied in
+    order, so a later union overwrites the label of an earlier one, and a
+    subtract clears the voxels of all earlier placements.
+
+    Arguments:
+        placements (Iterable of Placement or PixelShapeBase): The shapes.  A bare
+            shape is a union labeled with its one-based position, e.g., the
+            third shape is labeled 3.
+        dtype: The integer data type of the labels.  Defaults to np.uint16.
+        pathfile (str or None): If given, the labels are a memory mapped `.npy`
+            file at this path, readable with np.load(pathfile, mmap_mode="r").
+            Defaults to None, an in memory array.
+        tile (int): The number of x pixels of each tile.  Defaults to 64.
+        workers (int): The number of threads that fill tiles.  Default is
+            one (1), which fills tiles serially.  The labels are identical for
+            any number of workers.
+
+    Returns:
+        PixelScene: The anchor and labels of the world volume, which is the
+            bounding box of the union placements.  Subtract placements are
+            clipped to it.
+
+    Raises:
+        ValueError if there is no union placement, an operation is unknown, a
+            label does not fit the dtype, or tile or workers < 1.
+    """
+    if tile < 1:
+        raise ValueError("Error: tile must be one or greater.")
+
+    if workers < 1:
+        raise ValueError("Error: workers must be one or greater.")
+
+    _placements = _as_placements(placements)
+    info = np.iinfo(dtype)
+    for placement in _placements:
+        if not info.min <= placement.label <= info.max:
+            raise ValueError(
+                f"Error: label {placement.label} does not fit dtype {np.dtype(dtype)}."
+            )
+
+    anchor, box = scene_bounding_box(
+        shapes=(p.shape for p in _placements if p.operation == "union")
+    )
+    shape = (box.dx, box.dy, box.dz)
+    if pathfile is None:
+        labels = np.zeros(shape, dtype=dtype)
+    else:
+        labels = np.lib.format.open_memmap(
+            pathfile, mode="w+", dtype=dtype, shape=shape
+        )
+
+    extents = tuple(_extent(p.shape) for p in _placements)
+    origin = np.array(anchor, dtype=np.int64)
+    starts = range(0, box.dx, tile)
+
+    def fill(start: int):
+        _fill_tile(
+            labels=labels,
+            anchor=origin,
+            start=start,
+            stop=min(start + tile, box.dx),
+            placements=_placements,
+            extents=extents,
+        )
+
+    if workers == 1:
+        for start in starts:
+            fill(start)
+    else:
+        # tiles are disjoint slabs of labels, and NumPy releases the GIL as it
+        # copies, so threads fill tiles in parallel without locks
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(fill, starts):
+                pass
+
+    if isinstance(labels, np.memmap):
+        labels.flush()
+
+    return PixelScene(anchor=anchor, labels=labels)
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
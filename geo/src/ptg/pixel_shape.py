@@ -11,6 +11,11 @@ from typing import NamedTuple
 import numpy as np
 
 
+def _stack_layer(layer: np.ndarray, n_layers: int) -> np.ndarray:
+    """Returns n_layers copies of the 2D layer as a 3D array, allocated once."""
+    return np.broadcast_to(layer, (n_layers,) + layer.shape).copy()
+
+
 class PixelAnchor(NamedTuple):
     """Create the shape's anchor (x, y, z) position, in units of pixels, as a
     namedtuple, with the following attributes:
@@ -41,6 +46,47 @@ class PixelBoundingBox(NamedTuple):
     dz: int = 1  # pixels
 
 
+class PackedMask(NamedTuple):
+    """Creates a bit packed pixel mask, eight voxels per byte, as a namedtuple,
+    with the following attributes:
+
+    Attributes:
+        shape (tuple[int, int, int]): the (i, j, k) shape of the mask.
+        bits (np.ndarray): the np.packbits of the mask flattened in C order.
+    """
+
+    shape: tuple[int, int, int]
+    bits: np.ndarray
+
+    def unpack(self, dtype=np.uint8) -> np.ndarray:
+        """Returns the 3D pixel mask of 0 and 1 values."""
+        n = int(np.prod(self.shape))
+        return np.unpackbits(self.bits, count=n).reshape(self.shape).astype(dtype)
+
+
+class RunLengthMask(NamedTuple):
+    """Creates a run length encoded pixel mask as a namedtuple, with the following
+    attributes:
+
+    Attributes:
+        shape (tuple[int, int, int]): the (i, j, k) shape of the mask.
+        starts (np.ndarray): the flat C order index of the first voxel of each
+            run of occupied voxels.
+        lengths (np.ndarray): the number of voxels in each run.
+    """
+
+    shape: tuple[int, int, int]
+    starts: np.ndarray
+    lengths: np.ndarray
+
+    def unpack(self, dtype=np.uint8) -> np.ndarray:
+        """Returns the 3D pixel mask of 0 and 1 values."""
+        change = np.zeros(int(np.prod(self.shape)) + 1, dtype=np.int8)
+        np.add.at(change, self.starts, 1)
+        np.add.at(change, self.starts + self.lengths, -1)
+        return np.cumsum(change[:-1], dtype=dtype).reshape(self.shape)
+
+
 class PixelShapeBase(ABC):
     """Abstract base class for all 3D pixel shape classes.
     Creates a shape, at `pixel_per_len` resolution, composed of pixels as
@@ -107,9 +153,9 @@ class PixelShapeBase(ABC):
         self._dy_pixels = int(dy * pixels_per_len)
         self._dz_pixels = int(dz * pixels_per_len)
 
-        self._mask = np.zeros(
-            [self._dx_pixels, self._dy_pixels, self._dz_pixels], dtype=dtype
-        )
+        # subclasses create the mask, so the base allocates it only if needed
+        self._dtype = dtype
+        self._mask = None
 
     @property
     def anchor(self) -> PixelAnchor:
@@ -133,8 +179,31 @@ class PixelShapeBase(ABC):
             1 (int) cube does occupy that voxel (on boundary or interior).
         i indexes height, j indexes depth, k indexes width.
         """
+        if self._mask is None:
+            self._mask = np.zeros(
+                (self._dx_pixels, self._dy_pixels, self._dz_pixels), dtype=self._dtype
+            )
         return self._mask
 
+    @property
+    def packed_mask(self) -> PackedMask:
+        """PackedMask: Returns the mask packed eight voxels per byte."""
+        _mask = self.mask
+        return PackedMask(shape=_mask.shape, bits=np.packbits(_mask, axis=None))
+
+    @property
+    def run_length_mask(self) -> RunLengthMask:
+        """RunLengthMask: Returns the runs of occupied voxels of the mask, in
+        C order, a compact form for masks of few, long runs.
+        """
+        _mask = self.mask
+        _padded = np.zeros(_mask.size + 2, dtype=bool)
+        np.not_equal(_mask.reshape(-1), 0, out=_padded[1:-1])
+        # runs start and end, alternately, where occupancy changes
+        _changes = np.flatnonzero(_padded[1:] != _padded[:-1])
+        _starts, _ends = _changes[0::2], _changes[1::2]
+        return RunLengthMask(shape=_mask.shape, starts=_starts, lengths=_ends - _starts)
+
 
 class PixelCube(PixelShapeBase):
     """Creates a cube, at `pixel_per_len` resolution, composed of pixels as
@@ -261,7 +330,8 @@ class PixelCylinder(PixelShapeBase):
         _diameter_outer_pixels = int(diameter_outer * pixels_per_len)
         _height_pixels = int(height * pixels_per_len)
 
-        _y, _z = np.mgrid[
+        # open grids, (n, 1) and (1, n), broadcast to the (n, n) layer
+        _y, _z = np.ogrid[
             -_radius_outer_pixels : _radius_outer_pixels : _diameter_outer_pixels * 1j,
             -_radius_outer_pixels : _radius_outer_pixels : _diameter_outer_pixels * 1j,
         ]
@@ -282,7 +352,7 @@ class PixelCylinder(PixelShapeBase):
         self._mask_layer = np.array(_inner_mask * _outer_mask, dtype=dtype)
 
         # stack x layers to assembly volume in x-direction
-        self._mask = np.stack([self._mask_layer for _ in range(_height_pixels)])
+        self._mask = _stack_layer(self._mask_layer, _height_pixels)
 
 
 class PixelQuarterCylinder(PixelShapeBase):
@@ -354,7 +424,7 @@ class PixelQuarterCylinder(PixelShapeBase):
         _radius_outer_pixels = int(radius_outer * pixels_per_len)
         _height_pixels = int(height * pixels_per_len)
 
-        _y, _z = np.mgrid[
+        _y, _z = np.ogrid[
             1 : _radius_outer_pixels + 1,
             1 : _radius_outer_pixels + 1,
         ]
@@ -375,7 +445,7 @@ class PixelQuarterCylinder(PixelShapeBase):
         self._mask_layer = np.array(_inner_mask * _outer_mask, dtype=dtype)
 
         # stack x layers to assembly volume in x-direction
-        self._mask = np.stack([self._mask_layer for _ in range(_height_pixels)])
+        self._mask = _stack_layer(self._mask_layer, _height_pixels)
 
 
 class PixelSphere(PixelShapeBase):
@@ -432,16 +502,21 @@ class PixelSphere(PixelShapeBase):
         _radius_pixels = int(diameter / 2.0 * pixels_per_len) + 1
         _diameter_pixels = int(diameter * pixels_per_len)
 
-        _x, _y, _z = np.mgrid[
+        _x, _y, _z = np.ogrid[
             -_radius_pixels : _radius_pixels : _diameter_pixels * 1j,
             -_radius_pixels : _radius_pixels : _diameter_pixels * 1j,
             -_radius_pixels : _radius_pixels : _diameter_pixels * 1j,
         ]
-
-        _r_squared = _x**2 + _y**2 + _z**2
-        self._mask = np.array(
-            _r_squared <= _radius_pixels * _radius_pixels, dtype=dtype
-        )
+        _x_squared, _y_squared, _z_squared = _x.ravel() ** 2, _y[0] ** 2, _z[0, 0] ** 2
+        _limit = _radius_pixels * _radius_pixels
+
+        # compare one x layer of the open grids at a time, in place, into the
+        # mask of dtype, so no full size float array of radii is created
+        self._mask = np.empty((_diameter_pixels,) * 3, dtype=dtype)
+        _layer = np.empty((_diameter_pixels, _diameter_pixels))
+        for i, _xi_squared in enumerate(_x_squared):
+            np.add(_xi_squared + _y_squared, _z_squared, out=_layer)
+            np.less_equal(_layer, _limit, out=self._mask[i])
 
 
 class BoundingBoxLines:
@@ -3,6 +3,10 @@
 # certain rights in this software.
 
 
+from typing import Union
+
+import numpy as np
+
 from ptg.point import Point2D, Points
 
 
@@ -77,6 +81,14 @@ class Polygon2D:
 
         self._boundary = boundary
 
+        # edge segments from V[i] to V[i + 1], closed from V[n] to V[0]
+        xs = np.asarray(boundary.xs, dtype=np.float64)
+        ys = np.asarray(boundary.ys, dtype=np.float64)
+        self._edges = np.stack((xs, ys, np.roll(xs, -1), np.roll(ys, -1)), axis=1)
+
+        # edge-bucket indices, cached by number of buckets
+        self._edge_indices: dict = {}
+
     @property
     def length(self) -> int:
         """Returns the number of points composing the Polygon2D."""
@@ -179,6 +191,143 @@ class Polygon2D:
         else:
             return True
 
+    def winding_numbers(
+        self, probes: np.ndarray, *, n_buckets: Union[int, None] = None
+    ) -> np.ndarray:
+        """Calculates the winding number of many probe points at once.  The result
+        for each probe is identical to the winding_number method.
+
+        The boundary edges are bucketed into horizontal bands by their y-interval.
+        Only the edges of a probe's band can cross the probe's horizontal ray, so
+        each probe is evaluated against a subset of the edges instead of all of them.
+
+        Arguments:
+            probes (np.ndarray): The (n, 2) array of (x, y) probe coordinates.
+
+        Keyword Arguments:
+            n_buckets (int or None): The number of y-interval edge buckets.
+                Use 1 to evaluate every probe against every edge.  Defaults to None,
+                which uses about the square root of the number of edges.
+
+        Returns:
+            np.ndarray: The (n,) int array of winding numbers.
+
+        Raises:
+            ValueError if probes is not an (n, 2) array.
+            ValueError if n_buckets < 1.
+        """
+        _probes = np.asarray(probes, dtype=np.float64)
+        if _probes.ndim != 2 or _probes.shape[1] != 2:
+            raise ValueError("Probes must be an (n, 2) array of (x, y) pairs.")
+
+        if n_buckets is None:
+            n_buckets = max(1, int(np.sqrt(len(self._edges))))
+
+        if n_buckets < 1:
+            raise ValueError("Number of buckets must be >= 1.")
+
+        wn = np.zeros(len(_probes), dtype=np.int64)
+
+        if n_buckets == 1:
+            wn[:] = Polygon2D._winding_numbers(_probes, self._edges)
+            return wn
+
+        y_min, height, band_edges = self._edge_index(n_buckets=n_buckets)
+        bands = Polygon2D._bands(_probes[:, 1], y_min, height, n_buckets)
+
+        # group the probes by band, then evaluate each band in one pass
+        order = np.argsort(bands, kind="stable")
+        starts = np.searchsorted(bands[order], np.arange(n_buckets + 1))
+        for band in range(n_buckets):
+            selected = order[starts[band] : starts[band + 1]]
+            edges = self._edges[band_edges[band]]
+            if selected.size and edges.size:
+                wn[selected] = Polygon2D._winding_numbers(_probes[selected], edges)
+
+        return wn
+
+    def contains_many(
+        self, probes: np.ndarray, *, n_buckets: Union[int, None] = None
+    ) -> np.ndarray:
+        """Determines if many probe points lie within the boundary of the Polygon2D.
+        The result for each probe is identical to the contains method.
+
+        Arguments:
+            probes (np.ndarray): The (n, 2) array of (x, y) probe coordinates.
+
+        Keyword Arguments:
+            n_buckets (int or None): The number of y-interval edge buckets, see
+                winding_numbers.
+
+        Returns:
+            np.ndarray: The (n,) bool array, True if the probe is contained in the
+                boundary, False otherwise.
+        """
+        return self.winding_numbers(probes, n_buckets=n_buckets) != 0
+
+    def _edge_index(self, *, n_buckets: int) -> tuple:
+        """Returns, and caches, the y-interval edge buckets as the tuple
+        (y_min, band height, tuple of edge indices per band).
+        """
+        if n_buckets not in self._edge_indices:
+            e_y_min = np.minimum(self._edges[:, 1], self._edges[:, 3])
+            e_y_max = np.maximum(self._edges[:, 1], self._edges[:, 3])
+
+            y_min = e_y_min.min()
+            height = (e_y_max.max() - y_min) / n_buckets
+
+            first = Polygon2D._bands(e_y_min, y_min, height, n_buckets)
+            last = Polygon2D._bands(e_y_max, y_min, height, n_buckets)
+
+            # register each edge in every band that its y-interval overlaps
+            counts = last - first + 1
+            edge_ids = np.repeat(np.arange(len(self._edges)), counts)
+            band_ids = np.repeat(first, counts) + (
+                np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            )
+            order = np.argsort(band_ids, kind="stable")
+            splits = np.searchsorted(band_ids[order], np.arange(1, n_buckets))
+            band_edges = tuple(np.split(edge_ids[order], splits))
+
+            self._edge_indices[n_buckets] = (y_min, height, band_edges)
+
+        return self._edge_indices[n_buckets]
+
+    @staticmethod
+    def _bands(
+        ys: np.ndarray, y_min: float, height: float, n_buckets: int
+    ) -> np.ndarray:
+        """Maps y values to band indices in [0, n_buckets - 1]."""
+        if height <= 0.0:
+            return np.zeros(len(ys), dtype=np.int64)
+        bands = np.floor((ys - y_min) / height)
+        return np.clip(bands, 0, n_buckets - 1).astype(np.int64)
+
+    @staticmethod
+    def _winding_numbers(
+        probes: np.ndarray, edges: np.ndarray, chunk_size: int = 1 << 22
+    ) -> np.ndarray:
+        """Vectorized wn_PnPoly() of each probe against all edges, evaluated in
+        chunks of probes to bound the size of the (probes x edges) temporaries.
+        """
+        wn = np.zeros(len(probes), dtype=np.int64)
+        x0, y0, x1, y1 = (edges[:, k] for k in range(4))
+
+        step = max(1, chunk_size // max(1, len(edges)))
+        for start in range(0, len(probes), step):
+            px = probes[start : start + step, 0:1]
+            py = probes[start : start + step, 1:2]
+
+            # identical to is_left(P2=P, P0=V[i], P1=V[i + 1])
+            cross = (x1 - x0) * (py - y0) - (px - x0) * (y1 - y0)
+
+            upward = (y0 <= py) & (y1 > py) & (cross > 0)
+            downward = (y0 > py) & (y1 <= py) & (cross < 0)
+
+            wn[start : start + step] = upward.sum(axis=1) - downward.sum(axis=1)
+
+        return wn
+
 
 """
 Copyright 2023 Sandia National Laboratories
@@ -0,0 +1,206 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module provides closest point projection of points onto a boundary, and
+snapping of points onto the corners of a boundary.
+
+The boundary is one or more closed loops of (x, y) vertices, separated by nan,
+as in the boundary_xs and boundary_ys of xybind.  The projection of a batch of
+points uses a k-d tree over sample points of the boundary segments, so only the
+segments near each point are measured, rather than every segment of the
+boundary for every point.
+"""
+
+from itertools import chain
+from typing import Final, NamedTuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+CORNER_ANGLE: Final = 20.0  # degrees, as the dual mesh engine
+
+
+class Projection(NamedTuple):
+    """Creates the closest points on a boundary to a batch of points."""
+
+    points: np.ndarray  # (n, 2) closest points on the boundary
+    segments: np.ndarray  # (n,) index of the boundary segment of each point
+    parameters: np.ndarray  # (n,) position along the segment, in [0, 1]
+    distances: np.ndarray  # (n,) distance from each point to the boundary
+
+
+def loops(*, xs, ys) -> tuple[np.ndarray, ...]:
+    """Given boundary coordinates with loops separated by nan, returns the
+    (n_vertices, 2) vertices of each closed loop.  A last vertex that repeats
+    the first vertex is dropped, since every loop is closed.
+    """
+    xys = np.column_stack((np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)))
+    breaks = np.flatnonzero(np.isnan(xys).any(axis=1))
+    pieces = np.split(xys, breaks)
+    result = []
+    for k, piece in enumerate(pieces):
+        piece = piece[1:] if k > 0 else piece  # drop the nan separator
+        if len(piece) > 1 and np.array_equal(piece[0], piece[-1]):
+            piece = piece[:-1]
+        if len(piece) > 0:
+            result.append(piece)
+    return tuple(result)
+
+
+def _segment_distances(points, starts, ends) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the distances from points to segments, row by row, and the
+    parameter in [0, 1] of the closest point along each segment.
+    """
+    d = ends - starts
+    length2 = (d * d).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = ((points - starts) * d).sum(axis=1) / length2
+    s = np.clip(np.nan_to_num(s, nan=0.0), 0.0, 1.0)  # zero length segments
+    closest = starts + s[:, np.newaxis] * d
+    return np.linalg.norm(points - closest, axis=1), s
+
+
+class BoundaryProjector:
+    def __init__(self, *, xs, ys):
+        """Creates a projector onto the closed boundary loops of coordinates
+        xs and ys, with loops separated by nan.
+
+        Arguments:
+            xs (array_like of float): The x coordinates of the boundary.
+            ys (array_like of float): The y coordinates of the boundary.
+
+        Raises:
+            ValueError: If the boundary has no vertices.
+        """
+        self.loops = loops(xs=xs, ys=ys)
+        if not self.loops:
+            raise ValueError("Error: the boundary must have at least one vertex.")
+
+        # segment k runs from vertex k to the next vertex of its loop, circularly
+        self.starts = np.concatenate(self.loops)
+        self.ends = np.concatenate(tuple(np.roll(x, -1, axis=0) for x in self.loops))
+        self.loop_ids = np.repeat(
+            np.arange(len(self.loops)), [len(x) for x in self.loops]
+        )
+
+        # sample each segment so every point of it is within half a spacing of
+        # a sample, with the spacing of a typical segment
+        lengths = np.linalg.norm(self.ends - self.starts, axis=1)
+        positive = lengths[lengths > 0.0]
+        self.spacing = float(np.median(positive)) if positive.size else 0.0
+        if self.spacing > 0.0:
+            n_samples = np.maximum(np.ceil(lengths / self.spacing), 1).astype(int)
+        else:
+            n_samples = np.ones(lengths.size, dtype=int)
+        self._sample_segments = np.repeat(np.arange(lengths.size), n_samples)
+        first = np.repeat(np.cumsum(n_samples) - n_samples, n_samples)
+        position = np.arange(self._sample_segments.size) - first
+        s = (position + 0.5) / n_samples[self._sample_segments]
+        k = self._sample_segments
+        samples = self.starts[k] + s[:, np.newaxis] * (self.ends[k] - self.starts[k])
+        self._tree = cKDTree(samples)
+        self._half = 0.5 * self.spacing * (1.0 + 1.0e-9)  # with round off
+
+    @property
+    def n_segments(self) -> int:
+        """Returns the number of segments of all boundary loops."""
+        return len(self.starts)
+
+    def project(self, points) -> Projection:
+        """Returns the closest point on the boundary to each of the points.
+        Ties between segments resolve to the lowest segment index.
+
+        Arguments:
+            points (array_like of float): The (n, 2) points to project.
+
+        Returns:
+            Projection: The closest points, their segments, and distances.
+        """
+        p = np.asarray(points, dtype=float).reshape(-1, 2)
+        n = len(p)
+
+        # the segment of the nearest sample bounds the distance to the boundary
+        _, nearest = self._tree.query(p)
+        bound, _ = _segment_distances(
+            p,
+            self.starts[self._sample_segments[nearest]],
+            self.ends[self._sample_segments[nearest]],
+        )
+
+        # any closer segment has a sample within the bound plus half a spacing
+        candidates = self._tree.query_ball_point(p, r=bound + self._half)
+        counts = np.fromiter(map(len, candidates), dtype=np.int64, count=n)
+        owners = np.repeat(np.arange(n), counts)
+        segments = self._sample_segments[
+            np.fromiter(chain.from_iterable(candidates), dtype=np.int64)
+        ]
+        distances, s = _segment_distances(
+            p[owners], self.starts[segments], self.ends[segments]
+        )
+
+        # the closest candidate of each point, lowest segment on a tie
+        order = np.lexsort((segments, distances, owners))
+        best = order[np.searchsorted(owners[order], np.arange(n))]
+        segments, s = segments[best], s[best]
+        closest = self.starts[segments] + s[:, np.newaxis] * (
+            self.ends[segments] - self.starts[segments]
+        )
+        return Projection(
+            points=closest,
+            segments=segments,
+            parameters=s,
+            distances=distances[best],
+        )
+
+    def corners(self, *, angle: float = CORNER_ANGLE) -> np.ndarray:
+        """Returns the (n_corners, 2) boundary vertices at which the boundary
+        turns by more than angle degrees.
+        """
+        result = []
+        for loop in self.loops:
+            if len(loop) < 3:
+                continue
+            incoming = loop - np.roll(loop, 1, axis=0)
+            outgoing = np.roll(loop, -1, axis=0) - loop
+            cross = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+            dot = (incoming * outgoing).sum(axis=1)
+            turn = np.degrees(np.abs(np.arctan2(cross, dot)))
+            result.append(loop[turn > angle])
+        return np.concatenate(result) if result else np.zeros((0, 2))
+
+    def snap(self, points, *, corners=None) -> np.ndarray:
+        """Returns a copy of the points in which the point nearest to each corner
+        is moved onto that corner.
+
+        Arguments:
+            points (array_like of float): The (n, 2) points, e.g., the fringe
+                nodes of a dual mesh after projection.
+            corners (array_like of float or None): The (n_corners, 2) corners.
+                Default None, the corners() of the boundary.
+
+        Returns:
+            np.ndarray: The (n, 2) snapped points.
+        """
+        snapped = np.array(points, dtype=float).reshape(-1, 2)
+        corners = self.corners() if corners is None else np.asarray(corners, float)
+        if len(snapped) and len(corners):
+            _, nearest = cKDTree(snapped).query(corners.reshape(-1, 2))
+            snapped[nearest] = corners
+        return snapped
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
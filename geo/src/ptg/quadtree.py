@@ -3,14 +3,19 @@
 # certain rights in this software.
 
 
-from typing import Final, Iterable, NamedTuple, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Final, Iterable, NamedTuple, Optional, Union
 from functools import reduce
 import math
-from itertools import permutations, repeat
+from itertools import permutations
 from statistics import mean
+from types import MappingProxyType
+
+import numpy as np
 
 import ptg.dual_quad as dual_quad
 from ptg.point import Point2D, Points
+from ptg.topology import edge_topology
 
 # import ptg.polygon as poly
 
@@ -95,15 +100,8 @@ def edges(*, mesh: Mesh) -> tuple[tuple[int, int], ...]:
                 )
     """
 
-    cs = mesh.connectivity
-
-    # extend the connectivity to repeat the first node number after the last
-    cs_ext = tuple(c + (c[0],) for c in cs)
-
-    # group the items as pairs ((x0, y0), (x1, y1), ... (xn, yn))
-    cs_ext_pairs = tuple((c[i], c[i + 1]) for c in cs_ext for i in range(len(c) - 1))
-    edges = tuple(set(tuple(frozenset(i)) for i in set(cs_ext_pairs)))
-    return edges
+    edges = edge_topology(faces=mesh.connectivity).edges
+    return tuple(map(tuple, edges.tolist()))
 
 
 # def centroid(*, coordinates: tuple[Coordinate, ...]) -> Coordinate:
@@ -381,6 +379,241 @@ class TemplateFactory(NamedTuple):
     key_2110: NamedTuple = dual_quad.Template_2110()
 
 
+class CompiledTemplate(NamedTuple):
+    """A Template compiled to read-only NumPy arrays, for use in dualization.
+
+    Attributes:
+        name: The name of the source Template, e.g., "0001_r0_p0".
+        vertices_dual: The (n, 2) float array of dual vertices on the reference
+            square [-1, 1] x [-1, 1].
+        connectivity: The (n_faces, 4) int array of dual faces, including the port
+            faces for the Template_0001 family, with negative numbers counting
+            back from the end of vertices_dual.
+        boundaries_dual: The node numbers of each dual boundary.
+    """
+
+    name: str
+    vertices_dual: np.ndarray
+    connectivity: np.ndarray
+    boundaries_dual: tuple[tuple[int, ...], ...]
+
+
+def _read_only(values: tuple, dtype) -> np.ndarray:
+    """Returns the values as a NumPy array that cannot be modified."""
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+def _compile_templates() -> MappingProxyType:
+    """Compiles every Template of the TemplateFactory, keyed by template_key."""
+    factory = TemplateFactory()
+    compiled = {}
+    for key in factory._fields:
+        template = getattr(factory, key)
+        connectivity = template.faces_dual
+        if "key_0001" in key:
+            connectivity = connectivity + template.faces_ports
+        compiled[key] = CompiledTemplate(
+            name=template.name,
+            vertices_dual=_read_only(template.vertices_dual, np.float64),
+            connectivity=_read_only(connectivity, np.int64),
+            boundaries_dual=template.boundaries_dual,
+        )
+    return MappingProxyType(compiled)
+
+
+# The library of compiled templates, created once on import.
+TEMPLATES: Final = _compile_templates()
+
+
+class TemplateInstance(NamedTuple):
+    """A compiled template placed in the quadtree, by scaling the template
+    about the origin and then translating it to the center of a cell.
+    """
+
+    template_key: str  # key of the TEMPLATES library, e.g., "key_0000"
+    scale: float  # half of the cell size
+    translate: Point2D  # center of the cell
+
+
+def template_domain(instance: TemplateInstance) -> Domain:
+    """Returns the Domain of a single TemplateInstance, with coordinates
+    identical to scale_then_translate of the template dual vertices.
+    """
+    _template = TEMPLATES[instance.template_key]
+
+    _new_coordinates = _template.vertices_dual * instance.scale + (
+        instance.translate.x,
+        instance.translate.y,
+    )
+
+    mesh = Mesh(
+        coordinates=Points(pairs=tuple(map(tuple, _new_coordinates.tolist()))),
+        connectivity=tuple(map(tuple, _template.connectivity.tolist())),
+    )
+    return Domain(mesh=mesh, boundaries=_template.boundaries_dual)
+
+
+class MeshArrays(NamedTuple):
+    """Creates a mesh backed by NumPy arrays.
+
+    coordinates (np.ndarray): The (nnp, 2) float array of (x, y) nodal points.
+    connectivity (np.ndarray): The (nel, 4) int array of global node numbers.
+    """
+
+    coordinates: np.ndarray
+    connectivity: np.ndarray
+
+
+class DomainArrays(NamedTuple):
+    """Creates a Domain backed by NumPy arrays, composed of the domains of many
+    template instances, each numbered after the nodes of the preceding instances.
+
+    mesh (MeshArrays): The coordinates and connectivity of all instances.
+    boundaries (np.ndarray): The global node numbers of all boundaries, one
+        boundary after the other.
+    boundary_offsets (np.ndarray): Boundary k is
+        boundaries[boundary_offsets[k]:boundary_offsets[k + 1]].
+    node_offsets (np.ndarray): The nodes of instance i are rows
+        node_offsets[i] to node_offsets[i + 1] of the mesh coordinates.
+    """
+
+    mesh: MeshArrays
+    boundaries: np.ndarray
+    boundary_offsets: np.ndarray
+    node_offsets: np.ndarray
+
+
+def scale_then_translate_templates(
+    *, instances: tuple[TemplateInstance, ...]
+) -> DomainArrays:
+    """Scales and then translates many template instances in one vectorized step
+    per template, and writes the vertices, connectivity, and boundaries into
+    preallocated, contiguous arrays.
+
+    The coordinates are identical to those of template_domain for each instance,
+    concatenated in order.  The connectivity and boundaries are offset to the
+    global node numbering, with negative (counted from the end) node numbers
+    resolved.
+
+    Arguments:
+        instances (tuple[TemplateInstance, ...]): The templates and their placement.
+
+    Returns:
+        DomainArrays: The single domain composed of all instances.
+
+    Raises:
+        ValueError if a scale is not positive.
+    """
+    keys = tuple(TEMPLATES.keys())
+    key_ids = {key: k for k, key in enumerate(keys)}
+
+    n = len(instances)
+    ids = np.fromiter((key_ids[i.template_key] for i in instances), np.int64, n)
+    scales = np.fromiter((i.scale for i in instances), np.float64, n)
+    translates = np.array(
+        [(i.translate.x, i.translate.y) for i in instances], dtype=np.float64
+    ).reshape(n, 2)
+
+    if np.any(scales <= 0.0):
+        raise ValueError("Error: scale must be positive.")
+
+    templates = tuple(TEMPLATES[key] for key in keys)
+    nnps = np.array([len(t.vertices_dual) for t in templates])[ids]
+    nels = np.array([len(t.connectivity) for t in templates])[ids]
+    n_bounds = np.array([len(t.boundaries_dual) for t in templates])[ids]
+    n_bound_nodes = np.array([sum(map(len, t.boundaries_dual)) for t in templates])[ids]
+
+    node_offsets = np.concatenate(([0], np.cumsum(nnps)))
+    face_offsets = np.concatenate(([0], np.cumsum(nels)))
+    bound_offsets = np.concatenate(([0], np.cumsum(n_bounds)))
+    bound_node_offsets = np.concatenate(([0], np.cumsum(n_bound_nodes)))
+
+    coordinates = np.empty((node_offsets[-1], 2), dtype=np.float64)
+    connectivity = np.empty((face_offsets[-1], 4), dtype=np.int64)
+    boundaries = np.empty(bound_node_offsets[-1], dtype=np.int64)
+    boundary_lengths = np.empty(bound_offsets[-1], dtype=np.int64)
+
+    for k in np.unique(ids):
+        t = templates[k]
+        selected = np.flatnonzero(ids == k)
+        nnp = len(t.vertices_dual)
+        offsets = node_offsets[selected]
+
+        # (instances, vertices, 2), identical to scale_then_translate
+        xy = (
+            t.vertices_dual[np.newaxis, :, :] * scales[selected, np.newaxis, np.newaxis]
+            + translates[selected, np.newaxis, :]
+        )
+        rows = offsets[:, np.newaxis] + np.arange(nnp)
+        coordinates[rows] = xy
+
+        local = np.where(t.connectivity < 0, t.connectivity + nnp, t.connectivity)
+        rows = face_offsets[selected][:, np.newaxis] + np.arange(len(local))
+        connectivity[rows] = (
+            local[np.newaxis, :, :] + offsets[:, np.newaxis, np.newaxis]
+        )
+
+        flat = np.array([i for b in t.boundaries_dual for i in b], dtype=np.int64)
+        flat = np.where(flat < 0, flat + nnp, flat)
+        rows = bound_node_offsets[selected][:, np.newaxis] + np.arange(len(flat))
+        boundaries[rows] = flat[np.newaxis, :] + offsets[:, np.newaxis]
+
+        lengths = np.array([len(b) for b in t.boundaries_dual], dtype=np.int64)
+        rows = bound_offsets[selected][:, np.newaxis] + np.arange(len(lengths))
+        boundary_lengths[rows] = lengths
+
+    boundary_offsets = np.concatenate(([0], np.cumsum(boundary_lengths)))
+
+    return DomainArrays(
+        mesh=MeshArrays(coordinates=coordinates, connectivity=connectivity),
+        boundaries=boundaries,
+        boundary_offsets=boundary_offsets,
+        node_offsets=node_offsets,
+    )
+
+
+def concatenate_domain_arrays(*, parts: Iterable[DomainArrays]) -> DomainArrays:
+    """Concatenates array domains, in order, into a single array domain, with the
+    node numbers of each part offset by the number of nodes of the parts before it.
+    The nodes are not merged.
+
+    The result is identical to scale_then_translate_templates of all instances of
+    the parts, when each part is scale_then_translate_templates of a run of the
+    instances, in order.
+
+    Arguments:
+        parts (Iterable[DomainArrays]): The array domains, at least one.
+
+    Returns:
+        DomainArrays: The single domain composed of all parts.
+    """
+    parts = tuple(parts)
+    nodes = np.cumsum([0] + [len(p.mesh.coordinates) for p in parts])
+    bound_nodes = np.cumsum([0] + [len(p.boundaries) for p in parts])
+
+    coordinates = np.concatenate([p.mesh.coordinates for p in parts])
+    connectivity = np.concatenate(
+        [p.mesh.connectivity + n for p, n in zip(parts, nodes)]
+    )
+    boundaries = np.concatenate([p.boundaries + n for p, n in zip(parts, nodes)])
+    boundary_offsets = np.concatenate(
+        [p.boundary_offsets[:-1] + n for p, n in zip(parts, bound_nodes)]
+        + [bound_nodes[-1:]]
+    )
+    node_offsets = np.concatenate(
+        [p.node_offsets[:-1] + n for p, n in zip(parts, nodes)] + [nodes[-1:]]
+    )
+
+    return DomainArrays(
+        mesh=MeshArrays(coordinates=coordinates, connectivity=connectivity),
+        boundaries=boundaries,
+        boundary_offsets=boundary_offsets,
+        node_offsets=node_offsets,
+    )
+
+
 class Cell:
     # def __init__(self, *, center: Coordinate, size: float):
     def __init__(self, *, center: Point2D, size: float):
@@ -472,7 +705,44 @@ class Cell:
 
         self.has_children = True  # overwrite from False in __init__
 
-        print("Finished cell division.")
+
+class DualSubtree(NamedTuple):
+    """Creates a compact description of a divided cell and its descendants, whose
+    templates are dualized apart from the rest of the quadtree, e.g., by a worker
+    process.  The cells are rebuilt from the root cell center and size, and one
+    division flag per cell, in sw, nw, se, ne depth-first order.  Since rebuilt
+    cells are divided as the original cells were, their coordinates are identical.
+    """
+
+    center: Point2D  # center of the root cell of the subtree
+    size: float  # size of the root cell of the subtree
+    level: int  # level of the root cell of the subtree
+    divided: bytes  # b"\x01" if a cell has children, b"\x00" otherwise
+
+    @classmethod
+    def from_cell(cls, *, cell: Cell, level: int) -> "DualSubtree":
+        """Returns the description of the cell and its descendants."""
+        flags = bytearray()
+        stack = [cell]
+        while stack:
+            _cell = stack.pop()
+            flags.append(_cell.has_children)
+            if _cell.has_children:
+                stack.extend((_cell.ne, _cell.se, _cell.nw, _cell.sw))
+        return cls(
+            center=cell.center, size=cell.size, level=level, divided=bytes(flags)
+        )
+
+    def cell(self) -> Cell:
+        """Returns the root cell of the subtree, rebuilt with its descendants."""
+        root = Cell(center=self.center, size=self.size)
+        stack = [root]
+        for flag in self.divided:
+            _cell = stack.pop()
+            if flag:
+                _cell.divide()
+                stack.extend((_cell.ne, _cell.se, _cell.nw, _cell.sw))
+        return root
 
 
 # class QuadTree:
@@ -480,7 +750,15 @@ class Cell:
 #         self, *, cell: Cell, level: int, level_max: int, points: tuple[Coordinate, ...]
 #     ):
 class QuadTree:
-    def __init__(self, *, cell: Cell, level: int, level_max: int, points: Points):
+    def __init__(
+        self,
+        *,
+        cell: Cell,
+        level: int,
+        level_max: int,
+        points: Points,
+        balanced: bool = False,
+    ):
         """A QuadTree is a specific instance of a cell with zero or more recursive cell
         subdivisions.  Points passed into the QuadTree trigger cell division.  If points
         lie within a cell, then a cell will divide, otherwise a cell will not divide.
@@ -493,6 +771,10 @@ class QuadTree:
                 level_max >= level.  Must be >= 1.
             points (tuple[Coordinate,...]): Coordinates (x, y) that trigger local
                 refinement.
+            balanced (bool): If True, after the points trigger refinement, cells are
+                further divided so every quad differs by at most one level from the
+                quads that share an edge with it (2:1 balance).  See balance().
+                Default is False.
 
         Raises:
             ValueError if level_max is < 1.
@@ -556,6 +838,80 @@ class QuadTree:
                     points=self.points,
                 )
 
+            if balanced:
+                self.balance()
+
+    def balance(self) -> int:
+        """Divides cells until every quad differs by at most one level from each of
+        its edge neighbors (north, east, south, west), i.e., 2:1 balance, as with the
+        balanced refinement of the C++ QuadTree.  Only cells coarser than a
+        neighbor by two or more levels are divided, so the finest level is
+        unchanged.
+
+        Cells are located by a hash of (level, i, j), with i and j the integer x and
+        y position of the cell among the 2^level by 2^level cells of that level.  The
+        neighbor of a quad is the deepest hashed cell that covers the position on
+        the other side of the shared edge.
+
+        Returns:
+            The number of cell divisions made, zero (0) if already balanced.
+        """
+        cells: dict[tuple[int, int, int], Cell] = {}
+        stack = [((0, 0, 0), self.cell)]
+        while stack:
+            key, cell = stack.pop()
+            cells[key] = cell
+            if cell.has_children:
+                stack.extend(QuadTree._child_keys(key=key, cell=cell))
+
+        def covering(level: int, i: int, j: int) -> tuple[int, int, int]:
+            # the deepest existing cell that contains cell (level, i, j)
+            for k in range(level + 1):
+                key = (level - k, i >> k, j >> k)
+                if key in cells:
+                    return key
+            raise KeyError((level, i, j))  # unreachable, the root covers all
+
+        n_divisions = 0
+        queue = [key for key, cell in cells.items() if not cell.has_children]
+        while queue:
+            key = queue.pop()
+            if cells[key].has_children:
+                continue  # divided since it was queued
+            level, i, j = key
+            n_cells = 2**level
+            for ii, jj in ((i, j + 1), (i + 1, j), (i, j - 1), (i - 1, j)):
+                if not (0 <= ii < n_cells and 0 <= jj < n_cells):
+                    continue  # on the boundary of the root cell
+                neighbor = covering(level, ii, jj)
+                if neighbor[0] < level - 1:
+                    cells[neighbor].divide()
+                    n_divisions += 1
+                    for child_key, child in QuadTree._child_keys(
+                        key=neighbor, cell=cells[neighbor]
+                    ):
+                        cells[child_key] = child
+                        queue.append(child_key)
+                    queue.append(key)  # revisit until this neighbor is balanced
+                    break
+
+        return n_divisions
+
+    @staticmethod
+    def _child_keys(
+        *, key: tuple[int, int, int], cell: Cell
+    ) -> tuple[tuple[tuple[int, int, int], Cell], ...]:
+        """Given the (level, i, j) key of a divided cell, returns the (key, cell)
+        pairs of its sw, nw, se, ne children.
+        """
+        level, i, j = key
+        return (
+            ((level + 1, 2 * i, 2 * j), cell.sw),
+            ((level + 1, 2 * i, 2 * j + 1), cell.nw),
+            ((level + 1, 2 * i + 1, 2 * j), cell.se),
+            ((level + 1, 2 * i + 1, 2 * j + 1), cell.ne),
+        )
+
     def quads(self) -> tuple[Quad, ...]:
         """Maps the quadtree to an assembly of quadrilateral elements.
         Each quad has vertices composed of (x, y) coordinates.
@@ -570,28 +926,127 @@ class QuadTree:
                 ((x0, y0), (x1, y1), (x2, y2), (x3, y3)),  # <-- quad n
             )
         """
+        return tuple(cell.vertices for cell, _ in QuadTree._leaves(cell=self.cell))
 
-        # _vertices will have nested tuples
-        _vertices = QuadTree._child_vertices(self.cell)
-
-        # quads will have the same tuples, just flattened
-        _quads = tuple(QuadTree._quads_flatten(_vertices))
-
-        return _quads
+    def quads_array(self) -> np.ndarray:
+        """Returns the quads as a (n_quads, 4, 2) array of (x, y) vertices, ordered
+        as in quads().
+        """
+        _quads = self.quads()
+        return np.array(_quads, dtype=np.float64).reshape(len(_quads), 4, 2)
 
-    def domain_dual(self) -> tuple[Domain, ...]:
+    def domain_dual(
+        self, *, workers: int = 1, split_level: int = 2
+    ) -> tuple[Domain, ...]:
         """Maps the quadtree to a collection of dualized domains.
         Returns the domains = ((mesh=(vertices, faces), boundaries),...) for all
         templates embedded in the quadtree.
+
+        Arguments:
+            workers (int): The number of processes.  Default is one (1), which
+                dualizes serially in this process.  With more than one, the
+                subtrees at split_level are dualized in a process pool.  The
+                domains are identical, and in the same order, as with one worker.
+            split_level (int): The level, >= 1, at which subtrees are dispatched
+                to the process pool.  Level one (1) gives at most four subtrees,
+                and level two (2) gives at most sixteen.  Default is two (2).
+
+        Raises:
+            ValueError if workers < 1 or split_level < 1.
         """
-        _quad_levels_recursive = self.quad_levels_recursive()
-        _domain_dual = QuadTree._domain_dual(
-            cell=self.cell,
-            level=0,
-            quad_levels_recursive_subset=_quad_levels_recursive,
-            partial=False,
+        QuadTree._check_dual_options(workers=workers, split_level=split_level)
+        if workers == 1:
+            _domain_dual = QuadTree._domain_dual(
+                cell=self.cell,
+                level=0,
+                n_leaves=QuadTree._leaf_counter(cell=self.cell),
+            )
+            return _domain_dual
+
+        parts = self._dual_parts(
+            workers=workers,
+            split_level=split_level,
+            local=lambda instances: tuple(map(template_domain, instances)),
+            remote=_subtree_domains,
         )
-        return _domain_dual
+        return tuple(domain for part in parts for domain in part)
+
+    def domain_dual_arrays(
+        self, *, workers: int = 1, split_level: int = 2
+    ) -> DomainArrays:
+        """Maps the quadtree to a single dual domain backed by arrays, composed of
+        all templates embedded in the quadtree, in the order of domain_dual().
+
+        Arguments:
+            workers (int): The number of processes, see domain_dual().
+            split_level (int): The level of subtree dispatch, see domain_dual().
+
+        Raises:
+            ValueError if workers < 1 or split_level < 1.
+        """
+        QuadTree._check_dual_options(workers=workers, split_level=split_level)
+        if workers == 1:
+            _instances = QuadTree._dual_instances(
+                cell=self.cell,
+                level=0,
+                n_leaves=QuadTree._leaf_counter(cell=self.cell),
+            )
+            return scale_then_translate_templates(instances=_instances)
+
+        parts = self._dual_parts(
+            workers=workers,
+            split_level=split_level,
+            local=lambda instances: scale_then_translate_templates(instances=instances),
+            remote=_subtree_domain_arrays,
+        )
+        return concatenate_domain_arrays(parts=parts)
+
+    @staticmethod
+    def _check_dual_options(*, workers: int, split_level: int) -> None:
+        """Raises a ValueError if workers < 1 or split_level < 1, whether the dual
+        is computed serially or in a process pool.
+        """
+        if workers < 1:
+            raise ValueError("workers must be one or greater")
+
+        if split_level < 1:
+            raise ValueError("split_level must be one or greater")
+
+    def _dual_parts(
+        self,
+        *,
+        workers: int,
+        split_level: int,
+        local: Callable[[tuple[TemplateInstance, ...]], object],
+        remote: Callable[[DualSubtree], object],
+    ) -> list:
+        """Walks the quadtree to split_level, and returns, in traversal order, the
+        parts of the dual domain.  A run of templates found above split_level is
+        mapped with local in this process, and a subtree at split_level is mapped
+        with remote in a process pool of workers.
+        """
+        parts: list = []
+        run: list[TemplateInstance] = []
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for item in QuadTree._dual_walk(
+                cell=self.cell,
+                level=0,
+                n_leaves=QuadTree._leaf_counter(cell=self.cell),
+                split_level=split_level,
+            ):
+                if isinstance(item, DualSubtree):
+                    if run:
+                        parts.append(local(tuple(run)))
+                        run = []
+                    parts.append(executor.submit(remote, item))
+                else:
+                    run.append(item)
+
+            if run:
+                parts.append(local(tuple(run)))
+
+            return [p.result() if isinstance(p, Future) else p for p in parts]
 
     # def quad_levels_recursive(self) -> NestedInts:
     def quad_levels_recursive(self) -> tuple:
@@ -599,187 +1054,206 @@ class QuadTree:
         return qls
 
     def quad_levels(self) -> tuple[int, ...]:
-        qls = self.quad_levels_recursive()
-        return tuple(QuadTree._levels_flatten(nested=qls))
+        return tuple(level for _, level in QuadTree._leaves(cell=self.cell))
+
+    def quad_levels_array(self) -> np.ndarray:
+        """Returns the quad levels as a (n_quads,) array, ordered as in quads()."""
+        return np.array(self.quad_levels(), dtype=np.int64)
+
+    @staticmethod
+    def _leaf_counter(*, cell: Cell) -> Callable[[Cell], int]:
+        """Returns a function that gives, in O(1), the number of quads (leaf cells)
+        nested in the cell or any of its descendants.  The counts of all cells are
+        accumulated once, children before parents, with an explicit stack.
+        """
+        counts: dict[int, int] = {}
+        stack = [(cell, False)]
+        while stack:
+            _cell, visited = stack.pop()
+            if not _cell.has_children:
+                counts[id(_cell)] = 1
+            elif visited:
+                counts[id(_cell)] = (
+                    counts[id(_cell.sw)]
+                    + counts[id(_cell.nw)]
+                    + counts[id(_cell.se)]
+                    + counts[id(_cell.ne)]
+                )
+            else:
+                stack.append((_cell, True))
+                stack.extend(
+                    (child, False) for child in (_cell.sw, _cell.nw, _cell.se, _cell.ne)
+                )
+
+        return lambda cell: counts[id(cell)]
+
+    @staticmethod
+    def _leaves(*, cell: Cell, level: int = 0) -> Iterable[tuple[Cell, int]]:
+        """Given a cell, yields the (cell, level) of each undivided cell beneath it,
+        in sw, nw, se, ne depth-first order, with an explicit stack rather than
+        recursion.
+        """
+        stack = [(cell, level)]
+        while stack:
+            _cell, _level = stack.pop()
+            if _cell.has_children:
+                # push in reverse so that sw is visited first
+                stack.append((_cell.ne, _level + 1))
+                stack.append((_cell.se, _level + 1))
+                stack.append((_cell.nw, _level + 1))
+                stack.append((_cell.sw, _level + 1))
+            else:
+                yield _cell, _level
+
+    @staticmethod
+    def _nested(*, cell: Cell, level: int, leaf: Callable[[Cell, int], tuple]) -> tuple:
+        """Given a cell, returns leaf(cell, level) of each undivided cell beneath it,
+        nested as (sw, nw, se, ne) tuples that mirror the cell divisions.  The nesting
+        is assembled children first with an explicit stack rather than recursion.
+        """
+        built: list = []
+        stack = [(cell, level, False)]
+        while stack:
+            _cell, _level, visited = stack.pop()
+            if not _cell.has_children:
+                built.append(leaf(_cell, _level))
+            elif visited:
+                _children = tuple(built[-4:])
+                del built[-4:]
+                built.append(_children)
+            else:
+                stack.append((_cell, _level, True))
+                stack.append((_cell.ne, _level + 1, False))
+                stack.append((_cell.se, _level + 1, False))
+                stack.append((_cell.nw, _level + 1, False))
+                stack.append((_cell.sw, _level + 1, False))
+        return built[0]
 
     @staticmethod
     def _child_vertices(
         cell: Cell,
     ) -> Quads:
-        """Given a cell, returns the cell's vertices, and (recursively) the vertices of
-        the cell's children, grandchildren, et cetera.  Recursion ends when a cell level
-        has no children.
+        """Given a cell, returns the cell's vertices, and the vertices of the cell's
+        children, grandchildren, et cetera.  Nesting ends when a cell level has no
+        children.
         """
-        if cell.has_children:
-            return (
-                QuadTree._child_vertices(cell.sw),
-                QuadTree._child_vertices(cell.nw),
-                QuadTree._child_vertices(cell.se),
-                QuadTree._child_vertices(cell.ne),
-            )
-        else:
-            return (cell.vertices,)
-            # return cell.vertices
+        return QuadTree._nested(
+            cell=cell, level=0, leaf=lambda _cell, _level: (_cell.vertices,)
+        )
 
     # def _quad_levels(*, cell: Cell, level: int) -> Ints:
     # def _quad_levels(*, cell: Cell, level: int) -> NestedInts:
     @staticmethod
     def _quad_levels(*, cell: Cell, level: int) -> tuple:
-        """Given a cell, returns the cell's quad levels, and (recursively) the quad
-        levels of the cell's children, grandchildren, et cetera.  Recursion ends when
-        a cell level has no children.
+        """Given a cell, returns the cell's quad levels, and the quad levels of the
+        cell's children, grandchildren, et cetera.  Nesting ends when a cell level
+        has no children.
 
         Example:
             Returns
                 ((1,), (1,), (1,), ((2,), (2,), (2,) (2,)))
         """
-        if cell.has_children:
-            return (
-                QuadTree._quad_levels(cell=cell.sw, level=level + 1),
-                QuadTree._quad_levels(cell=cell.nw, level=level + 1),
-                QuadTree._quad_levels(cell=cell.se, level=level + 1),
-                QuadTree._quad_levels(cell=cell.ne, level=level + 1),
-            )
-        else:
-            return (level,)
+        return QuadTree._nested(
+            cell=cell, level=level, leaf=lambda _cell, _level: (_level,)
+        )
 
     @staticmethod
     def _domain_dual(
-        *, cell: Cell, level: int, quad_levels_recursive_subset: tuple, partial: bool
+        *, cell: Cell, level: int, n_leaves: Callable[[Cell], int]
     ) -> tuple[Domain, ...]:
         """Returns the dual domain encoded by the QuadTree."""
-
-        _factory = TemplateFactory()
-
-        subset_sw = quad_levels_recursive_subset[0]
-        subset_nw = quad_levels_recursive_subset[1]
-        subset_se = quad_levels_recursive_subset[2]
-        subset_ne = quad_levels_recursive_subset[3]
-
-        n_nested_sw = len(tuple(QuadTree._levels_flatten(subset_sw)))
-        n_nested_nw = len(tuple(QuadTree._levels_flatten(subset_nw)))
-        n_nested_se = len(tuple(QuadTree._levels_flatten(subset_se)))
-        n_nested_ne = len(tuple(QuadTree._levels_flatten(subset_ne)))
-
-        _template_key = template_key(
-            quad_corners=tuple([n_nested_sw, n_nested_nw, n_nested_se, n_nested_ne]),
+        _instances = QuadTree._dual_instances(
+            cell=cell,
             level=level,
-            partial=partial,
+            n_leaves=n_leaves,
         )
+        return tuple(map(template_domain, _instances))
 
-        if _template_key == "key_unknown":
+    @staticmethod
+    def _dual_instances(
+        *, cell: Cell, level: int, n_leaves: Callable[[Cell], int]
+    ) -> tuple[TemplateInstance, ...]:
+        """Returns the templates, and their placement, that compose the dual domain
+        encoded by the QuadTree.
 
-            # A known template cannot be fit to the combination of quad_corners,
-            # so recursively march down until a key is found.
+        Arguments:
+            cell (Cell): The divided cell from which the templates are found.
+            level (int): The level of the cell, typically zero (0) for the root.
+            n_leaves (Callable): Gives the number of quads nested in a cell, e.g.,
+                QuadTree._leaf_counter(cell=cell).
+        """
+        return tuple(QuadTree._dual_walk(cell=cell, level=level, n_leaves=n_leaves))
 
-            # Also, capture the topology of the parent template, prepend to the
-            # beginning of the recursion.
+    @staticmethod
+    def _dual_walk(
+        *,
+        cell: Cell,
+        level: int,
+        n_leaves: Callable[[Cell], int],
+        split_level: Optional[int] = None,
+    ) -> Iterable[Union[TemplateInstance, DualSubtree]]:
+        """Yields the templates of the dual domain in depth-first order.  If
+        split_level is given, a divided cell at split_level is yielded as a
+        DualSubtree in place of its templates, which are contiguous in the
+        depth-first order.
+        """
+        # cells are visited depth-first, sw, nw, se, ne, with an explicit stack
+        stack = [(cell, level)]
+        while stack:
+            _cell, _level = stack.pop()
 
-            # example: (1, 1, 1, 4) for Template_0001 parent
-            # n_parent_quads = tuple(
-            #     map(lambda x: len(x), (subset_sw, subset_nw, subset_se, subset_ne))
-            # )
-            n_parent_quads = tuple(
-                [len(xi) for xi in (subset_sw, subset_nw, subset_se, subset_ne)]
-            )
+            if split_level is not None and _level >= split_level and _cell is not cell:
+                yield DualSubtree.from_cell(cell=_cell, level=_level)
+                continue
 
-            # Example: ((1,), (1,), (1,), ((2,), (2,), (2,), (2,)))
-            n_subquads_per_quad: Final = 4  # given transition from level -> level + 1
-            quad_levels_recursive_parent = tuple(
-                (
-                    (
-                        (level + 1,)
-                        if x == 1
-                        else tuple(repeat((level + 2,), n_subquads_per_quad))
-                    )
-                    for x in n_parent_quads
-                )
-            )
+            _children = (_cell.sw, _cell.nw, _cell.se, _cell.ne)
 
-            # accumlate the parent part quad first
-            _subdomain = QuadTree._domain_dual(
-                cell=cell,
-                level=level,
-                quad_levels_recursive_subset=quad_levels_recursive_parent,
-                partial=True,
+            _template_key = template_key(
+                quad_corners=tuple(map(n_leaves, _children)),
+                level=_level,
+                partial=False,
             )
 
-            # then accumlate each of the children
-            if cell.sw.has_children:
-                _subquad_sw = QuadTree._domain_dual(
-                    cell=cell.sw,
-                    level=level + 1,
-                    quad_levels_recursive_subset=subset_sw,
-                    partial=False,
-                )
-                _subdomain = _subdomain + _subquad_sw
-
-            if cell.nw.has_children:
-                _subquad_nw = QuadTree._domain_dual(
-                    cell=cell.nw,
-                    level=level + 1,
-                    quad_levels_recursive_subset=subset_nw,
-                    partial=False,
-                )
-                _subdomain = _subdomain + _subquad_nw
-
-            if cell.se.has_children:
-                _subquad_se = QuadTree._domain_dual(
-                    cell=cell.se,
-                    level=level + 1,
-                    quad_levels_recursive_subset=subset_se,
-                    partial=False,
-                )
-                _subdomain = _subdomain + _subquad_se
-
-            if cell.ne.has_children:
-                _subquad_ne = QuadTree._domain_dual(
-                    cell=cell.ne,
-                    level=level + 1,
-                    quad_levels_recursive_subset=subset_ne,
-                    partial=False,
-                )
-                _subdomain = _subdomain + _subquad_ne
+            if _template_key == "key_unknown":
 
-            return _subdomain
+                # A known template cannot be fit to the combination of quad_corners,
+                # so march down until a key is found.
 
-        else:
-            # A known template can be constructed.  Example, _template.name == "0001"
-            _template = getattr(_factory, _template_key, None)
-            assert _template  # _template should never be None at this point
+                # Also, capture the topology of the parent template, prepend to the
+                # beginning of the children.
 
-            # _scaled_translated_vertices_dual = scale_then_translate(
-            #     ref=_template.vertices_dual,
-            #     scale=cell.size / 2.0,
-            #     translate=cell.center,
-            # )
-
-            # _new_coordinates = coordinates(pairs=_scaled_translated_vertices_dual)
-            # _new_coordinates = Points(pairs=_scaled_translated_vertices_dual)
+                # example: (1, 1, 1, 4) for Template_0001 parent
+                n_parent_quads = tuple(
+                    4 if child.has_children else 1 for child in _children
+                )
+                _parent_key = template_key(
+                    quad_corners=n_parent_quads, level=_level, partial=True
+                )
+                assert _parent_key != "key_unknown"  # all 1 and 4 corners are known
 
-            _new_coordinates = scale_then_translate(
-                ref=Points(pairs=_template.vertices_dual),
-                scale=cell.size / 2.0,
-                translate=cell.center,
-            )
+                # accumlate the parent part quad first
+                yield TemplateInstance(
+                    template_key=_parent_key,
+                    scale=_cell.size / 2.0,
+                    translate=_cell.center,
+                )
 
-            # temporary hard code to test key_0001
-            # if _template_key == "key_0001":
-            if "key_0001" in _template_key:
-                _new_connectivity = _template.faces_dual + _template.faces_ports
-                mesh = Mesh(
-                    coordinates=_new_coordinates, connectivity=_new_connectivity
+                # then accumlate each of the children, pushed in reverse so that
+                # sw is visited first
+                stack.extend(
+                    (child, _level + 1)
+                    for child in reversed(_children)
+                    if child.has_children
                 )
+
             else:
-                mesh = Mesh(
-                    coordinates=_new_coordinates, connectivity=_template.faces_dual
+                # A known template can be constructed.  Example, _template.name == "0001"
+                yield TemplateInstance(
+                    template_key=_template_key,
+                    scale=_cell.size / 2.0,
+                    translate=_cell.center,
                 )
 
-            domain = Domain(mesh=mesh, boundaries=_template.boundaries_dual)
-
-            # return (mesh,)
-            return (domain,)
-
     @staticmethod
     def _levels_flatten(nested: tuple) -> Iterable[int]:
         """Given a tuple of nest ints, yields an int in a flattened sequence.
@@ -790,15 +1264,377 @@ class QuadTree:
             Returns a generator for tuple of:
             (1, 1, 1, 2, 2, 2, 2,)
         """
-        for i in nested:
-            # yield from [i] if not isinstance(i, tuple) else QuadTree._tuple_flatten(i)
-            yield from [i] if isinstance(i, int) else QuadTree._levels_flatten(i)
+        stack = [iter(nested)]
+        while stack:
+            for i in stack[-1]:
+                if isinstance(i, int):
+                    yield i
+                else:
+                    stack.append(iter(i))
+                    break
+            else:
+                stack.pop()
 
     @staticmethod
     def _quads_flatten(nested: Quads) -> Iterable[Quad]:
         """Given a tuple of nested quads, yields a quad in a flattened sequence."""
-        for i in nested:
-            yield from [i] if isinstance(i, Quad) else QuadTree._quads_flatten(i)
+        stack = [iter(nested)]
+        while stack:
+            for i in stack[-1]:
+                if isinstance(i, Quad):
+                    yield i
+                else:
+                    stack.append(iter(i))
+                    break
+            else:
+                stack.pop()
+
+
+def _subtree_domains(subtree: DualSubtree) -> tuple[Domain, ...]:
+    """Returns the domains of a subtree, a process pool task of domain_dual()."""
+    cell = subtree.cell()
+    return QuadTree._domain_dual(
+        cell=cell,
+        level=subtree.level,
+        n_leaves=QuadTree._leaf_counter(cell=cell),
+    )
+
+
+def _subtree_domain_arrays(subtree: DualSubtree) -> DomainArrays:
+    """Returns the array domain of a subtree, a process pool task of
+    domain_dual_arrays().
+    """
+    cell = subtree.cell()
+    _instances = QuadTree._dual_instances(
+        cell=cell,
+        level=subtree.level,
+        n_leaves=QuadTree._leaf_counter(cell=cell),
+    )
+    return scale_then_translate_templates(instances=_instances)
+
+
+class LinearCell:
+    """A lightweight, read-only view of one cell stored in a LinearQuadTree.
+    Provides the same attributes as a Cell (center, size, has_children, and the
+    sw, nw, se, ne children) so the LinearQuadTree can be walked by code written
+    for the Cell object graph, without creating a Cell for every cell up front.
+    """
+
+    def __init__(self, *, tree: "LinearQuadTree", index: int):
+        self._tree = tree
+        self._index = index
+
+    @property
+    def index(self) -> int:
+        """Returns the row of this cell in the LinearQuadTree arrays."""
+        return self._index
+
+    @property
+    def center(self) -> Point2D:
+        """Returns the (x, y) center of the cell."""
+        cx, cy = self._tree.centers[self._index].tolist()
+        return Point2D(x=cx, y=cy)
+
+    @property
+    def size(self) -> float:
+        """Returns the side length of the cell."""
+        return float(self._tree.sizes[self._index])
+
+    @property
+    def has_children(self) -> bool:
+        """Returns True if the cell is divided, False otherwise."""
+        return bool(self._tree.children[self._index] >= 0)
+
+    def _child(self, offset: int) -> "LinearCell":
+        first = int(self._tree.children[self._index])
+        if first < 0:
+            raise AttributeError("Error: cell has no children.")
+        return LinearCell(tree=self._tree, index=first + offset)
+
+    @property
+    def sw(self) -> "LinearCell":
+        """Returns the southwest child."""
+        return self._child(0)
+
+    @property
+    def nw(self) -> "LinearCell":
+        """Returns the northwest child."""
+        return self._child(1)
+
+    @property
+    def se(self) -> "LinearCell":
+        """Returns the southeast child."""
+        return self._child(2)
+
+    @property
+    def ne(self) -> "LinearCell":
+        """Returns the northeast child."""
+        return self._child(3)
+
+
+class LinearQuadTree:
+    def __init__(self, *, cell: Cell, level: int, level_max: int, points: Points):
+        """A linear (Morton-keyed) quadtree stored in NumPy arrays.  The cells
+        subdivide with the same rules as the QuadTree, i.e., a cell divides if one or
+        more points lie inside of it or on its boundary, until level_max is reached.
+        Rather than a Cell object per cell and a filter of the client points at every
+        cell, the points are bucketed once per level with vectorized comparisons.
+
+        Cells are stored level by level.  The four children of a divided cell are
+        stored contiguously in sw, nw, se, ne order, and are located by the
+        `children` offset of the parent.
+
+        Arguments:
+            cell (Cell): The root cell to be recursively bisected.  Must be square.
+            level (int): The starting level of the root cell, typically zero (0).
+            level_max (int): The maximum level of bisection.
+                level_max >= level.  Must be >= 1.
+            points (Points): Coordinates (x, y) that trigger local refinement.
+
+        Raises:
+            ValueError if level_max is < 1.
+            ValueError if level_max - level exceeds the 31 levels that a 64-bit
+                Morton key can encode.
+        """
+        if level_max < 1:
+            raise ValueError("level_max must be one or greater")
+
+        depth_max = max(level_max - level, 0)
+        if depth_max > 31:
+            raise ValueError("level_max - level must be 31 or less")
+
+        self.cell = cell
+        self.level_max = level_max
+        self._depth_max = depth_max
+
+        xs = np.asarray(points.xs, dtype=np.float64)
+        ys = np.asarray(points.ys, dtype=np.float64)
+
+        centers = np.array([[cell.center.x, cell.center.y]], dtype=np.float64)
+        sizes = np.array([cell.size], dtype=np.float64)
+        keys = np.zeros(1, dtype=np.int64)
+
+        _centers = [centers]
+        _sizes = [sizes]
+        _levels = [np.zeros(1, dtype=np.int64)]
+        _keys = [keys]
+        _children = []
+
+        # (point, cell) membership pairs, with the cell as a local index of the
+        # current level.  A point on a shared cell edge belongs to all cells that
+        # touch it, consistent with Cell.contains.
+        inside = LinearQuadTree._contains(centers, sizes, xs, ys)
+        point_ids = np.flatnonzero(inside)
+        cell_ids = np.zeros(point_ids.size, dtype=np.int64)
+
+        offset = 0  # global index of the first cell of the current level
+
+        for depth in range(depth_max):
+            n_cells = sizes.size
+            children = np.full(n_cells, -1, dtype=np.int64)
+
+            parents = np.unique(cell_ids)
+            if parents.size == 0:
+                _children.append(children)
+                break
+
+            offset_next = offset + n_cells
+            children[parents] = offset_next + 4 * np.arange(parents.size)
+            _children.append(children)
+
+            centers, sizes = LinearQuadTree._divide(centers[parents], sizes[parents])
+            digits = np.tile(np.arange(4, dtype=np.int64), parents.size)
+            keys = np.repeat(keys[parents], 4) + digits * 4 ** (depth_max - depth - 1)
+
+            # bucket the parent's points into each of the four children
+            rank = np.searchsorted(parents, cell_ids)
+            candidates = (4 * rank[:, np.newaxis] + np.arange(4)).ravel()
+            point_candidates = np.repeat(point_ids, 4)
+            inside = LinearQuadTree._contains(
+                centers[candidates],
+                sizes[candidates],
+                xs[point_candidates],
+                ys[point_candidates],
+            )
+            point_ids = point_candidates[inside]
+            cell_ids = candidates[inside]
+
+            _centers.append(centers)
+            _sizes.append(sizes)
+            _levels.append(np.full(sizes.size, depth + 1, dtype=np.int64))
+            _keys.append(keys)
+
+            offset = offset_next
+
+        if len(_children) < len(_sizes):
+            _children.append(np.full(sizes.size, -1, dtype=np.int64))
+
+        self._centers = np.concatenate(_centers)
+        self._sizes = np.concatenate(_sizes)
+        self._levels = np.concatenate(_levels)
+        self._keys = np.concatenate(_keys)
+        self._children = np.concatenate(_children)
+
+    @staticmethod
+    def _contains(
+        centers: np.ndarray, sizes: np.ndarray, xs: np.ndarray, ys: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized Cell.contains, with the cell edges evaluated identically."""
+        half = sizes / 2.0
+        return (
+            (xs >= centers[:, 0] - half)
+            & (xs <= centers[:, 0] + half)
+            & (ys >= centers[:, 1] - half)
+            & (ys <= centers[:, 1] + half)
+        )
+
+    @staticmethod
+    def _divide(centers: np.ndarray, sizes: np.ndarray) -> tuple:
+        """Vectorized Cell.divide, returns the centers and sizes of the children of
+        all parent cells, ordered as sw, nw, se, ne for each parent.
+        """
+        half = sizes / 2.0
+        cx = centers[:, 0]
+        cy = centers[:, 1]
+
+        center_west_x = (cx + (cx - half)) / 2.0
+        center_east_x = (cx + (cx + half)) / 2.0
+
+        center_south_y = (cy + (cy - half)) / 2.0
+        center_north_y = (cy + (cy + half)) / 2.0
+
+        child_x = np.stack(
+            (center_west_x, center_west_x, center_east_x, center_east_x), axis=1
+        )
+        child_y = np.stack(
+            (center_south_y, center_north_y, center_south_y, center_north_y), axis=1
+        )
+        child_centers = np.stack((child_x.ravel(), child_y.ravel()), axis=1)
+        child_sizes = np.repeat(half, 4)
+        return child_centers, child_sizes
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Returns the (n_cells, 2) array of cell centers."""
+        return self._centers
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Returns the (n_cells,) array of cell side lengths."""
+        return self._sizes
+
+    @property
+    def levels(self) -> np.ndarray:
+        """Returns the (n_cells,) array of cell levels, relative to the root."""
+        return self._levels
+
+    @property
+    def keys(self) -> np.ndarray:
+        """Returns the (n_cells,) array of Morton keys.  Each level contributes a
+        base-4 digit, sw=0, nw=1, se=2, ne=3, padded to the finest level, so sorting
+        the leaf keys gives the sw, nw, se, ne depth-first order of the QuadTree.
+        """
+        return self._keys
+
+    @property
+    def children(self) -> np.ndarray:
+        """Returns the (n_cells,) array of offsets to the first (sw) child of each
+        cell, or -1 if the cell has no children.
+        """
+        return self._children
+
+    @property
+    def root(self) -> LinearCell:
+        """Returns a Cell-like view of the root cell."""
+        return LinearCell(tree=self, index=0)
+
+    def leaves(self) -> np.ndarray:
+        """Returns the indices of the undivided cells, in depth-first order."""
+        _leaves = np.flatnonzero(self._children < 0)
+        return _leaves[np.argsort(self._keys[_leaves], kind="stable")]
+
+    def quads(self) -> tuple[Quad, ...]:
+        """Maps the quadtree to an assembly of quadrilateral elements, identical
+        to QuadTree.quads().
+        """
+        return tuple(
+            Quad(
+                sw=Point2D(*sw),
+                se=Point2D(*se),
+                ne=Point2D(*ne),
+                nw=Point2D(*nw),
+            )
+            for sw, se, ne, nw in self.quads_array().tolist()
+        )
+
+    def quads_array(self) -> np.ndarray:
+        """Returns the quads as a (n_quads, 4, 2) array of (x, y) vertices, ordered
+        sw, se, ne, nw for each quad, and ordered as in QuadTree.quads().
+        """
+        _leaves = self.leaves()
+        half = self._sizes[_leaves] / 2.0
+        cx = self._centers[_leaves, 0]
+        cy = self._centers[_leaves, 1]
+
+        west = cx - half
+        east = cx + half
+        south = cy - half
+        north = cy + half
+
+        xs = np.stack((west, east, east, west), axis=1)
+        ys = np.stack((south, south, north, north), axis=1)
+        return np.stack((xs, ys), axis=2)
+
+    def quad_levels(self) -> tuple[int, ...]:
+        """Returns the level of each quad, ordered as in quads()."""
+        return tuple(self.quad_levels_array().tolist())
+
+    def quad_levels_array(self) -> np.ndarray:
+        """Returns the (n_quads,) array of quad levels, ordered as in quads()."""
+        return self._levels[self.leaves()]
+
+    def quad_levels_recursive(self) -> tuple:
+        """Returns the quad levels nested as in QuadTree.quad_levels_recursive()."""
+        return QuadTree._quad_levels(cell=self.root, level=0)
+
+    def leaf_counts(self) -> np.ndarray:
+        """Returns the (n_cells,) array of the number of quads (leaf cells) nested
+        in each cell, one (1) for an undivided cell.  The counts are accumulated
+        level by level, from the finest level up to the root.
+        """
+        counts = np.ones(self._sizes.size, dtype=np.int64)
+        parents = np.flatnonzero(self._children >= 0)
+        parent_levels = self._levels[parents]
+        for depth in range(self._depth_max - 1, -1, -1):
+            _parents = parents[parent_levels == depth]
+            first = self._children[_parents]
+            counts[_parents] = counts[first[:, np.newaxis] + np.arange(4)].sum(axis=1)
+        return counts
+
+    def _leaf_counter(self) -> Callable[[LinearCell], int]:
+        counts = self.leaf_counts().tolist()
+        return lambda cell: counts[cell.index]
+
+    def domain_dual(self) -> tuple[Domain, ...]:
+        """Maps the quadtree to a collection of dualized domains, identical to
+        QuadTree.domain_dual().
+        """
+        return QuadTree._domain_dual(
+            cell=self.root,
+            level=0,
+            n_leaves=self._leaf_counter(),
+        )
+
+    def domain_dual_arrays(self) -> DomainArrays:
+        """Maps the quadtree to a single dual domain backed by arrays, identical
+        to QuadTree.domain_dual_arrays().
+        """
+        _instances = QuadTree._dual_instances(
+            cell=self.root,
+            level=0,
+            n_leaves=self._leaf_counter(),
+        )
+        return scale_then_translate_templates(instances=_instances)
 
 
 """
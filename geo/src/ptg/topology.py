@@ -0,0 +1,141 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module provides the edge topology of a mesh of faces.
+
+The edges of every face connect consecutive node numbers, circularly, in the
+right hand rule order of the face.  All edges are found in one vectorized pass:
+each edge is packed into a single int64 key from the ranks of its two node
+numbers, and the keys are sorted, so no edge is ever searched for in a
+collection of edges.
+"""
+
+from itertools import chain
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+
+class EdgeTopology(NamedTuple):
+    """Creates the edges of a mesh and their incidence with faces and nodes.
+    Incidence is stored in compressed rows, e.g., the faces of edge k are
+    edge_faces[face_offsets[k] : face_offsets[k + 1]].
+    """
+
+    edges: np.ndarray  # (n_edges, 2) node numbers, low then high, sorted by row
+    first: np.ndarray  # (n_edges,) position of first appearance among face edges
+    face_offsets: np.ndarray  # (n_edges + 1,) offsets into edge_faces
+    edge_faces: np.ndarray  # face indices incident to each edge, ascending
+    nodes: np.ndarray  # (n_nodes,) sorted unique node numbers
+    node_offsets: np.ndarray  # (n_nodes + 1,) offsets into node_edges
+    node_edges: np.ndarray  # edge indices incident to each node, ascending
+    boundary: np.ndarray  # indices of edges that belong to exactly one face
+
+    def faces_of(self, edge: int) -> np.ndarray:
+        """Returns the face indices incident to the edge index."""
+        return self.edge_faces[self.face_offsets[edge] : self.face_offsets[edge + 1]]
+
+    def edges_of(self, node: int) -> np.ndarray:
+        """Returns the edge indices incident to the node number.
+
+        Raises:
+            KeyError if the node number is not in a face.
+        """
+        i = int(np.searchsorted(self.nodes, node))
+        if i == self.nodes.size or self.nodes[i] != node:
+            raise KeyError(f"Error: node {node} is not in a face.")
+        return self.node_edges[self.node_offsets[i] : self.node_offsets[i + 1]]
+
+    def edges_in_order(self) -> np.ndarray:
+        """Returns the (n_edges, 2) edges in the order they first appear in the
+        faces, e.g., to match a face-by-face traversal of the mesh.
+        """
+        return self.edges[np.argsort(self.first, kind="stable")]
+
+
+def _offsets(counts: np.ndarray) -> np.ndarray:
+    """Returns the compressed row offsets of rows with the given counts."""
+    offsets = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def edge_topology(*, faces: Iterable[Iterable[int]]) -> EdgeTopology:
+    """Given faces as collections of integer node numbers, possibly nonsequential
+    and of mixed length, returns the unique edges of the faces and their
+    incidence with faces and nodes.
+
+    Arguments:
+        faces (Iterable of Iterable of int): The node numbers of each face,
+            e.g., ((101, 2, 105, 4), (2, 103, 6, 105)).  A (n_faces, n) int
+            array is used directly.
+
+    Returns:
+        EdgeTopology: The edges, incidence, and boundary edges.
+    """
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        n_faces, width = faces.shape
+        flat = faces.astype(np.int64).ravel()
+        lengths = np.full(n_faces, width, dtype=np.int64)
+    else:
+        faces = tuple(tuple(f) for f in faces)
+        n_faces = len(faces)
+        lengths = np.fromiter(map(len, faces), dtype=np.int64, count=n_faces)
+        flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64)
+
+    # the tail of each face edge is the next node of the face, circularly
+    starts = _offsets(lengths)
+    face_ids = np.repeat(np.arange(n_faces), lengths)
+    following = np.arange(flat.size) + 1
+    last = starts[1:][lengths > 0] - 1
+    following[last] = starts[:-1][lengths > 0]
+
+    nodes, ranks = np.unique(flat, return_inverse=True)
+    ranks = ranks.ravel()
+    low = np.minimum(ranks, ranks[following])
+    high = np.maximum(ranks, ranks[following])
+    keys = low * np.int64(max(nodes.size, 1)) + high
+
+    unique_keys, first, inverse = np.unique(
+        keys, return_index=True, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    n_edges = unique_keys.size
+    n_nodes = nodes.size
+    edge_ranks = np.column_stack(np.divmod(unique_keys, max(n_nodes, 1)))
+    edges = nodes[edge_ranks].reshape(n_edges, 2)
+
+    face_counts = np.bincount(inverse, minlength=n_edges)
+    edge_faces = face_ids[np.argsort(inverse, kind="stable")]
+
+    node_ranks = edge_ranks.T.ravel()  # all low nodes, then all high nodes
+    edge_ids = np.tile(np.arange(n_edges), 2)
+    order = np.lexsort((edge_ids, node_ranks))
+
+    return EdgeTopology(
+        edges=edges,
+        first=first,
+        face_offsets=_offsets(face_counts),
+        edge_faces=edge_faces,
+        nodes=nodes,
+        node_offsets=_offsets(np.bincount(node_ranks, minlength=n_nodes)),
+        node_edges=edge_ids[order],
+        boundary=np.flatnonzero(face_counts == 1),
+    )
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
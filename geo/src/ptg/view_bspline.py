@@ -322,17 +322,13 @@ class ViewBSplineBasis(ViewBSplineBase):
         )  # None is basis, not None is curve, surface, or volume
         assert COEF is None
 
-        # build up B-spline basis functions
-        for i in np.arange(self.NCP):
-
-            coef = np.zeros(self.NCP)
-            coef[i] = 1.0
-
-            _B = bsp.Curve(self.knot_vector_t, coef, self.degree_t)
-
-            if _B.is_valid():
-                _y = _B.evaluate(self.evaluation_times)
-                self.evaluated_bases.append(_y)
+        # build up B-spline basis functions, all at once as matrix columns
+        _N = bsp.basis_matrix(
+            knot_vector=self.knot_vector_t,
+            degree=self.degree_t,
+            times=self.evaluation_times,
+        )
+        self.evaluated_bases = list(_N[:, 0 : self.NCP].T)
 
         # plot B-spline basis functions
         self.fig = plt.figure(figsize=plt.figaspect(1.0 / (self.nel + 1)), dpi=self.dpi)
@@ -396,19 +392,18 @@ class ViewBSplineCurve(ViewBSplineBase):
         _NSD = len(COEF[0])  # number of space dimensions
         assert _NSD == 2  # only 2D curves implemented for now, do 3D later
 
-        for i in np.arange(_NSD):
-
-            coef = np.array(COEF)[:, i]
-
-            _B = bsp.Curve(self.knot_vector_t, coef, self.degree_t)
-
-            if _B.is_valid():
-                _y = _B.evaluate(self.evaluation_times)
-                self.evaluated_curve.append(_y)
+        _N = bsp.basis_matrix(
+            knot_vector=self.knot_vector_t,
+            degree=self.degree_t,
+            times=self.evaluation_times,
+        )
+        self.evaluated_curve = list((_N @ np.array(COEF)).T)
 
-                if _knots_shown:
-                    _y = _B.evaluate(_knots_t)
-                    _evaluated_knots.append(_y)
+        if _knots_shown:
+            _N_knots = bsp.basis_matrix(
+                knot_vector=self.knot_vector_t, degree=self.degree_t, times=_knots_t
+            )
+            _evaluated_knots = list((_N_knots @ np.array(COEF)).T)
 
         # plot B-spline curve, assume 2D for now
         self.fig = plt.figure(dpi=self.dpi)
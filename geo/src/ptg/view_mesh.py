@@ -0,0 +1,120 @@
+# Copyright 2020 National Technology and Engineering Solutions of Sandia, LLC (NTESS).
+# Under the terms of Contract DE-NA0003525 with NTESS, the U.S. Government retains
+# certain rights in this software.
+
+
+"""This module draws the faces of a 2D mesh as a single Matplotlib collection.
+
+The (x, y) vertices of all faces are gathered into one (n_faces, n, 2) array
+with NumPy fancy indexing, and drawn as one PolyCollection, rather than as one
+artist per face, so figures of large meshes are created quickly.
+"""
+
+from typing import Optional
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+
+def face_vertices(
+    *,
+    coordinates,
+    faces,
+    node_ids=None,
+    pad: Optional[int] = -1,
+) -> np.ndarray:
+    """Returns the (x, y) vertices of the faces of a mesh.
+
+    Arguments:
+        coordinates (array_like of float): The (n_nodes, >= 2) nodal coordinates,
+            of which the first two columns are x and y.
+        faces (array_like of int): The (n_faces, n) nodes of each face.
+        node_ids (array_like of int or None): The (n_nodes,) node number of each
+            row of coordinates, generally nonsequential, e.g., (1, 2, ...) for
+            one-based node numbers.  Default is None, in which case the faces
+            are zero-based row indices of the coordinates.
+        pad (int or None): The value that pads faces with fewer than n nodes,
+            e.g., a triangle among quadrilaterals.  A pad repeats the last node of
+            its face, which does not change how the face is drawn.  Default is
+            negative one (-1).  None if the faces have no padding.
+
+    Returns:
+        np.ndarray: The (n_faces, n, 2) vertices of the faces.
+
+    Raises:
+        KeyError if a node number is not in node_ids.
+        ValueError if a face starts with a pad.
+    """
+    if np.size(faces) == 0:
+        return np.zeros((0, 0, 2))
+
+    xy = np.asarray(coordinates, dtype=np.float64)[:, 0:2]
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, np.shape(faces)[-1])
+
+    if pad is not None:
+        padded = faces == pad
+        if np.any(padded):
+            if np.any(padded[:, 0]):
+                raise ValueError("Error: a face must not start with a pad.")
+            # the column of the last node that is not a pad, in each position
+            columns = np.where(padded, 0, np.arange(faces.shape[1]))
+            np.maximum.accumulate(columns, axis=1, out=columns)
+            faces = np.take_along_axis(faces, columns, axis=1)
+
+    if node_ids is None:
+        rows = faces
+    else:
+        ids = np.asarray(node_ids, dtype=np.int64)
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        if sorted_ids.size == 0:
+            raise KeyError("Error: no node numbers are defined.")
+
+        positions = np.minimum(np.searchsorted(sorted_ids, faces), ids.size - 1)
+        missing = sorted_ids[positions] != faces
+        if np.any(missing):
+            raise KeyError(f"Error: undefined node number(s): {faces[missing][:10]}")
+        rows = order[positions]
+
+    return xy[rows]
+
+
+def face_collection(
+    *,
+    coordinates,
+    faces,
+    node_ids=None,
+    pad: Optional[int] = -1,
+    **kwargs,
+) -> PolyCollection:
+    """Returns the faces of a mesh as a single PolyCollection, to be added to an
+    axis with ax.add_collection(), followed by ax.autoscale_view() if the axis
+    limits are not set.
+
+    Arguments:
+        coordinates, faces, node_ids, pad: The mesh, see face_vertices().
+        kwargs: The Matplotlib properties of the faces, e.g., facecolor,
+            edgecolor, alpha, linestyle, and linewidth.
+
+    Returns:
+        PolyCollection: The faces.
+    """
+    vertices = face_vertices(
+        coordinates=coordinates, faces=faces, node_ids=node_ids, pad=pad
+    )
+    return PolyCollection(vertices, closed=True, **kwargs)
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,132 @@
+"""This module is a unit test of the Abaqus .inp reader.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_abaqus.py -v
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import ptg.abaqus as abaqus
+
+DATA_PATH = Path(__file__).resolve().parent.joinpath("../", "data", "mesh").resolve()
+
+
+def test_read_inp_four_quads():
+    """Given the canonical example, four_quad_nonseq.inp, verify the nodes,
+    elements, boundary, and sets are read in a single pass.
+    """
+    inp = abaqus.read_inp(pathfile=str(DATA_PATH.joinpath("four_quads_nonseq.inp")))
+
+    assert tuple(inp.node_ids) == (101, 2, 103, 4, 105, 6, 13, 23, 33)
+    assert inp.coordinates.shape == (9, 2)
+    assert tuple(inp.coordinates[4]) == (2.5, 2.5)
+
+    assert len(inp.element_blocks) == 1
+    block = inp.element_blocks[0]
+    assert block.element_type == "CPE4"
+    assert block.elset == "EB1"
+    assert tuple(block.ids) == (1, 20, 31, 44)
+    assert tuple(block.connectivity[1]) == (2, 103, 6, 105)
+
+    rows = inp.node_rows(block.connectivity)
+    assert np.array_equal(inp.node_ids[rows], block.connectivity)
+    known = ((1.0, 1.0), (2.5, 1.0), (2.5, 2.5), (1.0, 2.5))
+    assert tuple(map(tuple, inp.coordinates[rows[0]])) == known
+
+    assert inp.boundary["101"] == (1, 2)
+    assert inp.boundary["23"] == (2,)
+    assert len(inp.boundary) == 8
+
+    assert np.array_equal(inp.nsets["ALLNODES"], inp.node_ids)
+    assert np.array_equal(inp.elsets["EB1"], block.ids)
+
+    with pytest.raises(KeyError):
+        _ = inp.node_rows((101, 7))
+
+
+def test_read_inp_blocks_and_sets(tmp_path):
+    """Tests comments and blank lines, several element blocks, element definitions
+    continued across lines, generated and nested sets, and keyword selection.
+    """
+    deck = tmp_path.joinpath("deck.inp")
+    deck.write_text(
+        "** heading\n"
+        "*Node, nset=N1\n"
+        "10, 0.0, 0.0, 0.0\n"
+        "** comment inside of a block\n"
+        "\n"
+        "20, 1.0, 0.0, 0.0\n"
+        "30, 1.0, 1.0\n"
+        "*NODE\n"
+        "40, 0.0, 1.0, 2.0\n"
+        "*ELEMENT, TYPE=CPE4, ELSET=QUADS\n"
+        "1, 10, 20, 30, 40\n"
+        "*Element, type=CPE3\n"
+        "2, 10, 20,\n"
+        "   30\n"
+        "3, 10, 30, 40\n"
+        "*NSET, NSET=EVEN, GENERATE\n"
+        "20, 40, 20\n"
+        "*NSET, NSET=BOTH\n"
+        "EVEN, 10\n"
+        "*ELSET, ELSET=TRIS\n"
+        "2, 3\n"
+        "*BOUNDARY\n"
+        "this boundary cannot be read\n"
+    )
+
+    with pytest.raises(ValueError):
+        _ = abaqus.read_inp(pathfile=str(deck))
+
+    keywords = ("NODE", "ELEMENT", "NSET", "ELSET")
+    inp = abaqus.read_inp(pathfile=str(deck), keywords=keywords)
+
+    assert tuple(inp.node_ids) == (10, 20, 30, 40)
+    known = np.array(
+        ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 2.0))
+    )
+    assert np.array_equal(inp.coordinates, known)  # 2D node padded with zero
+
+    assert tuple(b.element_type for b in inp.element_blocks) == ("CPE4", "CPE3")
+    assert tuple(inp.element_blocks[1].ids) == (2, 3)
+    assert inp.element_blocks[1].connectivity.tolist() == [[10, 20, 30], [10, 30, 40]]
+
+    assert tuple(inp.nsets["N1"]) == (10, 20, 30)
+    assert tuple(inp.nsets["EVEN"]) == (20, 40)
+    assert tuple(inp.nsets["BOTH"]) == (20, 40, 10)
+    assert tuple(inp.elsets["QUADS"]) == (1,)
+    assert tuple(inp.elsets["TRIS"]) == (2, 3)
+    assert inp.boundary == {}
+
+
+def test_read_inp_bad_files():
+    with pytest.raises(FileNotFoundError):
+        _ = abaqus.read_inp(pathfile=str(DATA_PATH.joinpath("does_not_exist.inp")))
+
+    for name in (
+        "four_quads_bad_nodes.inp",
+        "four_quads_bad_elements.inp",
+        "four_quads_bad_boundary.inp",
+    ):
+        with pytest.raises(ValueError):
+            _ = abaqus.read_inp(pathfile=str(DATA_PATH.joinpath(name)))
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
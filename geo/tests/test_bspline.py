@@ -284,6 +284,123 @@ class TestBSpline(TestCase):
         known_t = (0.0, 0.5, 1.0, 1.5, 2.0, 2.25, 2.5, 2.75, 3.0)  # nti = 2
         self.assertTrue(self.same(calc_t, known_t))
 
+    def test_210_basis_matrix_matches_curves(self):
+        kv = (0.0, 0.0, 0.0, 1.0, 2.0, 2.0, 3.0, 3.0, 3.0)
+        deg = 2  # quadratic, with a repeated interior knot
+        ncp = len(kv) - deg - 1
+        t = bsp.evaluation_times(knot_vector=kv, degree=deg, n_bisections=3)
+        N = bsp.basis_matrix(knot_vector=kv, degree=deg, times=t)
+        self.assertEqual(N.shape, (len(t), ncp))
+
+        for i in range(ncp):
+            coef = np.zeros(ncp)
+            coef[i] = 1.0
+            Ni = bsp.Curve(kv, coef, deg)
+            Ni.is_valid()
+            self.assertTrue(np.array_equal(N[:, i], Ni.evaluate(t)))
+
+        self.assertTrue(self.same(N.sum(axis=1), np.ones(len(t))))  # unity
+
+        with pytest.raises(ValueError):
+            _ = bsp.basis_matrix(knot_vector=(0.0, 1.0), degree=1, times=t)
+
+        with pytest.raises(ValueError):
+            _ = bsp.Surface(kv, kv, np.zeros((ncp, ncp + 1, 3)), deg, deg)
+
+    def test_211_evaluation_plan_cache(self):
+        kv = [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+        deg = 2
+        plan = bsp.evaluation_plan(knot_vector=kv, degree=deg, n_bisections=2)
+        same = bsp.evaluation_plan(knot_vector=tuple(kv), degree=deg, n_bisections=2)
+        self.assertIs(plan, same)  # from the cache, list and tuple alike
+        self.assertIsNot(
+            plan, bsp.evaluation_plan(knot_vector=kv, degree=deg, n_bisections=3)
+        )
+
+        known_t = bsp.evaluation_times(knot_vector=kv, degree=deg, n_bisections=2)
+        self.assertTrue(np.array_equal(plan.times, known_t))
+        self.assertFalse(plan.basis.flags.writeable)
+
+        coef = np.array(((0.0, 0.0), (1.0, 2.0), (2.0, 2.0), (3.0, 0.0)))
+        C = bsp.Curve(kv, coef, deg)
+        C.is_valid()
+        self.assertTrue(self.same(plan.evaluate(coef), C.evaluate(plan.times)))
+
+        # a surface from two plans matches the outer product of the bases
+        net = np.random.default_rng(0).random((4, 4, 3))
+        S = bsp.Surface(kv, kv, net, deg, deg, n_bisections=2)
+        known = np.einsum("ai,bj,ijd->dab", plan.basis, plan.basis, net)
+        self.assertTrue(self.same(np.array(S.evaluations), known))
+
+    def test_212_curve_derivatives_and_curvature(self):
+        # the parabola y = x^2 on [0, 1] as a quadratic Bezier curve
+        kv = (0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        coef = ((0.0, 0.0), (0.5, 0.0), (1.0, 1.0))
+        C = bsp.Curve(kv, coef, 2)
+        C.is_valid()
+        t = np.linspace(0.0, 1.0, 9)
+
+        first = C.derivative(t)
+        self.assertTrue(self.same(first, np.column_stack((np.ones(9), 2.0 * t))))
+        self.assertTrue(self.same(C.derivative(t, nu=2), np.tile((0.0, 2.0), (9, 1))))
+        self.assertTrue(self.same(np.linalg.norm(C.tangents(t), axis=1), np.ones(9)))
+
+        known = 2.0 / (1.0 + 4.0 * t**2) ** 1.5
+        self.assertTrue(self.same(C.curvatures(t), known))
+
+        plan = bsp.evaluation_plan(knot_vector=kv, degree=2, n_bisections=3)
+        self.assertTrue(self.same(plan.evaluate(coef, 1), C.derivative(plan.times)))
+
+        with pytest.raises(ValueError):
+            _ = plan.evaluate(coef, 3)
+
+    def test_213_surface_and_volume_derivatives(self):
+        # the paraboloid z = t^2 + u^2 over [0, 1] x [0, 1], biquadratic Bezier
+        kv = (0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+        a = (0.0, 0.0, 1.0)  # Bernstein coefficients of t^2
+        net = tuple(
+            tuple((i / 2, j / 2, a[i] + a[j]) for j in range(3)) for i in range(3)
+        )
+        S = bsp.Surface(kv, kv, net, 2, 2, n_bisections=2)
+        t, u = np.meshgrid(S.evaluation_times_t, S.evaluation_times_u, indexing="ij")
+
+        S_t = S.derivatives(t=1, u=0)
+        self.assertTrue(self.same(S_t[0], np.ones_like(t)))
+        self.assertTrue(self.same(S_t[2], 2.0 * t))
+        S_tu = S.derivatives(t=1, u=1)
+        self.assertTrue(self.same(np.array(S_tu), np.zeros((3,) + t.shape)))
+
+        scale = np.sqrt(1.0 + 4.0 * t**2 + 4.0 * u**2)
+        n = S.normals
+        self.assertTrue(self.same(n[2], 1.0 / scale))
+        self.assertTrue(self.same(n[0], -2.0 * t / scale))
+
+        curvature = S.curvatures
+        self.assertTrue(self.same(curvature.gaussian, 4.0 / scale**4))
+        known_mean = (2.0 + 4.0 * t**2 + 4.0 * u**2) / scale**3
+        self.assertTrue(self.same(curvature.mean, known_mean))
+
+        # a volume x = t, y = 2 u, z = 3 v^2 has a constant diagonal Jacobian
+        lattice = tuple(
+            tuple(tuple((i / 2, j, 3.0 * a[k]) for k in range(3)) for j in range(3))
+            for i in range(3)
+        )
+        V = bsp.Volume(
+            knot_vector_t=kv,
+            knot_vector_u=kv,
+            knot_vector_v=kv,
+            coefficients=lattice,
+            degree_t=2,
+            degree_u=2,
+            degree_v=2,
+        )
+        shape = V.evaluations[0].shape
+        self.assertTrue(self.same(V.derivatives(t=1)[0], np.ones(shape)))
+        self.assertTrue(self.same(V.derivatives(t=0, u=1)[1], 2.0 * np.ones(shape)))
+        v = np.broadcast_to(V.evaluation_times_v, shape)
+        self.assertTrue(self.same(V.derivatives(t=0, v=1)[2], 6.0 * v))
+        self.assertTrue(self.same(V.derivatives(t=0, v=2)[2], 6.0 * np.ones(shape)))
+
     def test_201_recover_bezier_bilinear_B00_p1_surface(self):
         kv_t = (0.0, 0.0, 1.0, 1.0)  # knot vector for t parameter
         kv_u = (0.0, 0.0, 1.0, 1.0)  # knot vector for u parameter
@@ -289,6 +289,69 @@ class Test(TestCase):
         # Forthcoming unit test:  B-spline surface reconstruction from fitting.
         # https://github.com/orbingol/geomdl-examples/blob/master/fitting/interpolation/global_surface.py
 
+    def test_008_banded_basis_matrix(self):
+        theta = np.linspace(0.0, 1.5 * np.pi, 200)
+        points = np.column_stack((np.cos(theta), np.sin(theta), theta))
+        b = bsf.BSplineFit(sample_points=points, degree=self.degree)
+
+        N = b.sample_basis_sparse
+        self.assertEqual(N.shape, (200, 200))
+        rows, cols = N.nonzero()
+        self.assertTrue(np.all(np.abs(rows - cols) <= self.degree))
+        self.assertTrue(self.same(N.toarray(), b.sample_basis_matrix))
+
+        # the fit interpolates the samples
+        self.assertTrue(self.same(N @ b.control_points, points))
+
+    def test_009_least_squares_approximation(self):
+        theta = np.linspace(0.0, 2.0 * np.pi, 101)
+        points = np.column_stack((np.cos(theta), np.sin(2.0 * theta)))
+        ncp = 12
+        b = bsf.BSplineFit(
+            sample_points=points, degree=self.degree, n_control_points=ncp
+        )
+
+        self.assertFalse(b.interpolated)
+        self.assertEqual(b.control_points.shape, (ncp, 2))
+        self.assertEqual(len(b.knot_vector), ncp + self.degree + 1)
+        self.assertTrue(np.all(np.diff(b.knot_vector) >= 0.0))
+
+        # end points are interpolated, interior points minimize the residual
+        P = b.control_points
+        self.assertTrue(self.same(P[0], points[0]))
+        self.assertTrue(self.same(P[-1], points[-1]))
+        N = b.sample_basis_matrix
+        R = points - np.outer(N[:, 0], P[0]) - np.outer(N[:, -1], P[-1])
+        known, *_ = np.linalg.lstsq(N[1:-1, 1:-1], R[1:-1], rcond=None)
+        self.assertTrue(self.same(P[1:-1], known))
+
+        # more control points approximate the samples more closely
+        errors = []
+        for n in (ncp, 2 * ncp, 4 * ncp):
+            c = bsf.BSplineFit(sample_points=points, degree=3, n_control_points=n)
+            errors.append(np.abs(c.sample_basis_sparse @ c.control_points - points))
+        self.assertTrue(errors[0].max() > errors[1].max() > errors[2].max())
+
+        with self.assertRaises(ValueError):
+            bsf.BSplineFit(sample_points=points, degree=3, n_control_points=3)
+        with self.assertRaises(ValueError):
+            bsf.BSplineFit(sample_points=points, degree=3, n_control_points=102)
+
+    def test_010_bezier_interpolation(self):
+        # n_samples == degree + 1, so the knot vector has no interior knots
+        points = ((0.0, 0.0), (1.0, 2.0), (2.0, -1.0), (3.0, 1.0))
+        b = bsf.BSplineFit(sample_points=points, degree=3)
+
+        known_knots = (0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0)
+        known_control_points = (
+            (0.0, 0.0),
+            (1.47140452, 6.96649831),
+            (1.52859548, -5.96649831),
+            (3.0, 1.0),
+        )
+        self.assertTrue(self.same(known_knots, b.knot_vector))
+        self.assertTrue(self.same(known_control_points, b.control_points))
+
 
 # def test_000_simple_least_squares(self):
 #     # https://www.math.tamu.edu/~yvorobet/MATH304-503/Lect3-03web.pdf
@@ -6,11 +6,18 @@ To run
 > pytest geo/tests/test_domain_merge.py -v
 """
 
-# import pytest
+from functools import reduce
+
+import pytest
 
 from ptg.point import Point2D, Points
 import ptg.quadtree as qt
-from ptg.domain_merge import boundary_match, boundary_substraction, domain_merge
+from ptg.domain_merge import (
+    boundary_match,
+    boundary_substraction,
+    domain_merge,
+    domain_merge_many,
+)
 
 
 def test_boundary_subtraction():
@@ -549,6 +556,64 @@ def test_domain_merge_key_0001_r0_p1_and_key_0001_r1_p0():
     assert bounds2 == b2
 
 
+def test_domain_merge_many_key_0001_r0_p1_and_key_0001_r1_p0():
+    """Tests the n-way merge of the parent and child domains of the
+    test_domain_merge_key_0001_r0_p1_and_key_0001_r1_p0 quadtree.  The faces are
+    identical to the two-domain merge, and the remaining boundaries of the child
+    are renumbered to the merged nodes, 37->12 and 42->17.
+    """
+    ctr = Point2D(x=0.0, y=0.0)
+    cell = qt.Cell(center=ctr, size=2.0)
+    points = Points(pairs=((0.6, 0.6),))
+
+    tree = qt.QuadTree(cell=cell, level=0, level_max=3, points=points)
+    domain_dual = tree.domain_dual()
+
+    d2 = domain_merge(domain0=domain_dual[0], domain1=domain_dual[1], tolerance=1e-6)
+    dn = domain_merge_many(domains=domain_dual, tolerance=1e-6)
+
+    assert dn.mesh.coordinates.pairs == d2.mesh.coordinates.pairs
+    assert dn.mesh.connectivity == d2.mesh.connectivity
+    assert dn.boundaries == (
+        (23, 19, 16, 14),
+        (14, 13, 12),
+        (17, 18, 20),
+        (20, 21, 22, 23),
+        (12, 36, 35, 34),
+        (34, 39, 41, 17),
+    )
+
+
+def test_domain_merge_many_matches_pairwise():
+    """Tests the n-way merge of many domains gives the same faces as the
+    repeated two-domain merge.
+    """
+    ctr = Point2D(x=0.0, y=0.0)
+    cell = qt.Cell(center=ctr, size=2.0)
+    points = Points(pairs=((0.6, 0.6),))
+
+    tree = qt.QuadTree(cell=cell, level=0, level_max=5, points=points)
+    domain_dual = tree.domain_dual()
+    assert len(domain_dual) == 4
+
+    known = reduce(
+        lambda d0, d1: domain_merge(domain0=d0, domain1=d1, tolerance=1e-6),
+        domain_dual,
+    )
+    found = domain_merge_many(domains=domain_dual, tolerance=1e-6)
+
+    assert found.mesh.coordinates.pairs == known.mesh.coordinates.pairs
+    assert found.mesh.connectivity == known.mesh.connectivity
+    assert len(found.boundaries) == len(known.boundaries)
+
+    # a single domain is returned with global node numbering
+    single = domain_merge_many(domains=domain_dual[0:1], tolerance=1e-6)
+    assert single.mesh.connectivity[5] == (23, 19, 0, 22)
+
+    with pytest.raises(ValueError):
+        _ = domain_merge_many(domains=(), tolerance=1e-6)
+
+
 """
 Copyright 2023 Sandia National Laboratories
 
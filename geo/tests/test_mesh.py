@@ -875,6 +875,70 @@ def test_quad_bowtie():
     assert isinf(ar)  # divide by zero inf
 
 
+def test_quality_of_quads():
+    """Given the single quads of the tests above, and a perturbed grid of quads,
+    verify the vectorized quality metrics match the one-quad-at-a-time metrics,
+    and verify the quality summary.
+    """
+    rng = np.random.default_rng(seed=0)
+    grid = np.array(((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)))
+    random_quads = grid + rng.uniform(-0.3, 0.3, size=(50, 4, 2))
+    vertices = np.concatenate(
+        (
+            np.array(
+                (
+                    ((1.0, 1.0), (2.0, 1.0), (2.0, 2.0), (1.0, 2.0)),  # unit
+                    ((1.0, 1.0), (2.0, 1.0), (2.5, 2.0), (1.5, 2.0)),  # shear
+                    ((1.0, 1.0), (2.0, 2.0), (2.0, 1.0), (1.0, 2.0)),  # bowtie
+                )
+            ),
+            random_quads,
+        )
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        found = mesh.quality_of_quads(vertices=vertices)
+        known_skew = [mesh.skew_of_quad(vertices=v) for v in vertices.tolist()]
+        known_ar = [mesh.aspect_ratio_of_quad(vertices=v) for v in vertices.tolist()]
+
+    known_areas = [mesh.nodal_areas_of_quad(vertices=v) for v in vertices.tolist()]
+    known_min_j = [mesh.minimum_jacobian_of_quad(vertices=v) for v in vertices.tolist()]
+    known_min_sj = [
+        mesh.minimum_scaled_jacobian_of_quad(vertices=v) for v in vertices.tolist()
+    ]
+
+    assert np.allclose(found.skew, known_skew, equal_nan=True)
+    assert np.allclose(found.aspect_ratio, known_ar, equal_nan=True)
+    assert np.allclose(found.minimum_jacobian, known_min_j)
+    assert np.allclose(found.minimum_scaled_jacobian, known_min_sj)
+    assert np.allclose(mesh.nodal_areas_of_quads(vertices=vertices), known_areas)
+
+    # from coordinates and connectivity, a 2 x 1 mesh of unit quads
+    coordinates = np.array(
+        ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0))
+        + ((0.0, 1.0, 0.0), (1.0, 1.0, 0.0), (2.0, 1.0, 0.0))
+    )
+    connectivity = np.array(((0, 1, 4, 3), (1, 2, 5, 4)))
+    quads = mesh.quad_vertices(coordinates=coordinates, connectivity=connectivity)
+    assert quads.shape == (2, 4, 2)
+    quality = mesh.quality_of_quads(vertices=quads)
+    assert np.array_equal(quality.minimum_scaled_jacobian, (1.0, 1.0))
+
+    summary = mesh.quality_summary(quality=mesh.quality_of_quads(vertices=random_quads))
+    assert summary.n_quads == 50
+    assert summary.n_inverted == int(np.sum(np.array(known_min_j[3:]) < 0.0))
+    assert summary.skew.minimum <= summary.skew.percentiles[50.0]
+    assert summary.skew.percentiles[50.0] <= summary.skew.maximum
+    assert tuple(summary.aspect_ratio.percentiles) == (1.0, 5.0, 50.0, 95.0, 99.0)
+    assert "minimum_scaled_jacobian" in summary.report()
+
+    with pytest.raises(ValueError):
+        _ = mesh.quality_of_quads(vertices=np.zeros((2, 3, 2)))
+
+    with pytest.raises(ValueError):
+        _ = mesh.quality_summary(quality=mesh.quality_of_quads(vertices=quads[:0]))
+
+
 """
 Copyright 2023 Sandia National Laboratories
 
@@ -19,6 +19,7 @@ flake8 --ignore E203,E501,W503 geo/tests/test_mesh_morph.py --statistics
 """
 
 import numpy as np
+import pytest
 
 import ptg.mesh_morph as morph
 
@@ -174,6 +175,94 @@ def test_two_quads_two_dof_3D_representation():
     assert known_deltas == deltas
 
 
+def test_adjacency_matrix():
+    """Given two quads that share an edge, assure each edge appears once
+    and the matrix is symmetric.
+    """
+    quads = ((0, 1, 4, 3), (1, 2, 5, 4))
+    a = morph.adjacency_matrix(connectivity=quads, n_nodes=6)
+    known = np.array(
+        (
+            (0, 1, 0, 1, 0, 0),
+            (1, 0, 1, 0, 1, 0),
+            (0, 1, 0, 0, 0, 1),
+            (1, 0, 0, 0, 1, 0),
+            (0, 1, 0, 1, 0, 1),
+            (0, 0, 1, 0, 1, 0),
+        )
+    )
+    assert np.array_equal(a.toarray(), known)
+
+    springs = morph.adjacency_matrix(connectivity=((0, 1), (1, 2)), n_nodes=3)
+    assert np.array_equal(springs.toarray(), ((0, 1, 0), (1, 0, 1), (0, 1, 0)))
+
+    with pytest.raises(ValueError):
+        _ = morph.adjacency_matrix(connectivity=((0, 1, 6),), n_nodes=6)
+
+
+def test_smooth_laplacian():
+    """Given a patch of four quads with a perturbed center node and a fixed
+    perimeter, assure Jacobi and Gauss-Seidel sweeps converge to the center,
+    and Gauss-Seidel matches a node-by-node update.
+    """
+    coordinates = np.array(
+        tuple((float(i), float(j)) for j in range(3) for i in range(3))
+    )
+    coordinates[4] = (1.4, 0.7)
+    quads = ((0, 1, 4, 3), (1, 2, 5, 4), (3, 4, 7, 6), (4, 5, 8, 7))
+    adjacency = morph.adjacency_matrix(connectivity=quads, n_nodes=9)
+    fixed = np.ones(coordinates.shape, dtype=bool)
+    fixed[4] = False
+
+    one = morph.smooth_laplacian(
+        coordinates=coordinates, adjacency=adjacency, fixed=fixed, update_ratio=0.5
+    )
+    assert one.iterations == 1 and not one.converged
+    assert np.allclose(one.displacements[4], (-0.2, 0.15))
+    assert not np.any(one.displacements[fixed.all(axis=1)])
+
+    for method in morph.METHODS:
+        result = morph.smooth_laplacian(
+            coordinates=coordinates,
+            adjacency=adjacency,
+            fixed=fixed,
+            update_ratio=0.5,
+            method=method,
+            iterations=100,
+            tol=1.0e-10,
+        )
+        assert result.converged and result.iterations < 100
+        assert np.allclose(coordinates[4] + result.displacements[4], (1.0, 1.0))
+
+    # Gauss-Seidel with the bottom row free in x only, against a scalar sweep
+    fixed[0:3, 0] = False
+    ur = 0.25
+    result = morph.smooth_laplacian(
+        coordinates=coordinates,
+        adjacency=adjacency,
+        fixed=fixed,
+        update_ratio=ur,
+        method="gauss_seidel",
+        iterations=3,
+    )
+    x = coordinates.copy()
+    neighbors = tuple(adjacency[i].indices for i in range(9))
+    for _ in range(3):
+        for i in range(9):
+            average = x[neighbors[i]].mean(axis=0)
+            x[i] = np.where(fixed[i], x[i], x[i] + ur * (average - x[i]))
+    assert np.allclose(coordinates + result.displacements, x)
+
+    with pytest.raises(ValueError):
+        _ = morph.smooth_laplacian(
+            coordinates=coordinates, adjacency=adjacency, method="newton"
+        )
+    with pytest.raises(ValueError):
+        _ = morph.smooth_laplacian(
+            coordinates=coordinates, adjacency=adjacency, update_ratio=1.0
+        )
+
+
 """
 Copyright 2023 Sandia National Laboratories
 
@@ -0,0 +1,100 @@
+"""This module is a unit test of streaming voxel volumes to and from files.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_pixel_io.py -v
+"""
+
+import numpy as np
+import pytest
+
+from ptg.pixel_io import open_voxels, read_slabs, write_slabs, write_voxels
+from ptg.pixel_scene import compose
+from ptg.pixel_shape import PixelCube, PixelSphere
+
+
+@pytest.mark.parametrize("suffix", ("raw", "npy", "spn"))
+def test_write_and_read_round_trip(tmp_path, suffix):
+    sphere = PixelSphere(diameter=5.0, pixels_per_len=1)
+    pathfile = str(tmp_path / f"sphere.{suffix}")
+    write_voxels(pathfile=pathfile, volume=sphere, chunk=2)
+
+    slabs = list(read_slabs(pathfile=pathfile, shape=(5, 5, 5), chunk=2))
+    assert [len(s) for s in slabs] == [2, 2, 1]
+    assert np.array_equal(np.concatenate(slabs), sphere.mask)
+
+    if suffix != "spn":
+        voxels = open_voxels(pathfile=pathfile, shape=(5, 5, 5))
+        assert isinstance(voxels, np.memmap)
+        assert np.array_equal(voxels, sphere.mask)
+
+
+def test_spn_text(tmp_path):
+    pathfile = str(tmp_path / "cube.spn")
+    write_voxels(pathfile=pathfile, volume=PixelCube(dx=2.0))
+    with open(pathfile, "rt") as f:
+        assert f.read() == "1\n" * 8
+
+    with pytest.raises(ValueError):
+        open_voxels(pathfile=pathfile, shape=(2, 2, 2))
+    with pytest.raises(ValueError):
+        _ = list(read_slabs(pathfile=pathfile, shape=(3, 2, 2)))  # too short
+
+
+def test_write_scene_from_generator(tmp_path):
+    """Given slabs from a generator, and a scene in a memory mapped file, assure
+    the volume is written without holding it in memory at once.
+    """
+    scene = compose(
+        placements=(PixelCube(dx=4.0), PixelSphere(anchor_x=1.0, diameter=3.0)),
+        pathfile=str(tmp_path / "scene.npy"),
+    )
+    pathfile = str(tmp_path / "scene.raw")
+    write_voxels(pathfile=pathfile, volume=scene, dtype=np.uint8, chunk=3)
+    voxels = open_voxels(pathfile=pathfile, shape=scene.labels.shape)
+    assert np.array_equal(voxels, scene.labels)
+
+    pathfile = str(tmp_path / "layers.npy")
+    write_slabs(
+        pathfile=pathfile,
+        slabs=(np.full((1, 2, 3), i, dtype=np.int32) for i in range(4)),
+        shape=(4, 2, 3),
+        dtype=np.int32,
+    )
+    voxels = open_voxels(pathfile=pathfile)
+    assert voxels.dtype == np.int32
+    assert tuple(voxels[:, 1, 2]) == (0, 1, 2, 3)
+
+
+def test_errors(tmp_path):
+    mask = np.ones((2, 2, 2), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        write_voxels(pathfile=str(tmp_path / "a.vtk"), volume=mask)
+    with pytest.raises(ValueError):
+        write_voxels(pathfile=str(tmp_path / "a.raw"), volume=mask[0])
+    with pytest.raises(ValueError):
+        write_voxels(pathfile=str(tmp_path / "a.raw"), volume=mask, chunk=0)
+    with pytest.raises(ValueError):
+        write_slabs(pathfile=str(tmp_path / "a.raw"), slabs=(mask,), shape=(3, 2, 2))
+    with pytest.raises(ValueError):
+        write_slabs(pathfile=str(tmp_path / "a.raw"), slabs=(mask,), shape=(2, 2, 3))
+    with pytest.raises(ValueError):
+        open_voxels(pathfile=str(tmp_path / "a.raw"))  # no shape
+    with pytest.raises(FileNotFoundError):
+        open_voxels(pathfile=str(tmp_path / "missing.npy"))
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
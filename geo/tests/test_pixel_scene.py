@@ -0,0 +1,118 @@
+"""This module is a unit test of the composition of pixel shapes into a scene.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_pixel_scene.py -v
+"""
+
+import numpy as np
+import pytest
+
+from ptg.pixel_scene import Placement, compose, scene_bounding_box
+from ptg.pixel_shape import PixelCube, PixelCylinder, PixelSphere
+
+
+def test_scene_bounding_box():
+    cube = PixelCube(anchor_x=1.0, anchor_y=2.0, anchor_z=3.0, dx=2.0)
+    sphere = PixelSphere(anchor_x=-1.0, diameter=5.0)
+    anchor, box = scene_bounding_box(shapes=(cube, sphere))
+    assert tuple(anchor) == (-1, 0, 0)
+    assert tuple(box) == (5, 5, 5)
+
+    with pytest.raises(ValueError):
+        scene_bounding_box(shapes=())
+
+
+def test_compose_union_and_subtract():
+    big = PixelCube(dx=4.0)
+    small = PixelCube(anchor_x=1.0, anchor_y=1.0, anchor_z=1.0, dx=2.0)
+    corner = PixelCube(anchor_x=3.0, anchor_y=3.0, anchor_z=3.0, dx=2.0)
+
+    scene = compose(placements=(big, small, corner))
+    assert tuple(scene.anchor) == (0, 0, 0)
+    assert scene.labels.shape == (5, 5, 5)
+    assert scene.labels[0, 0, 0] == 1
+    assert scene.labels[1, 2, 2] == 2  # the later union overwrites
+    assert scene.labels[4, 4, 4] == 3
+    assert scene.labels[4, 0, 0] == 0
+
+    scene = compose(
+        placements=(
+            Placement(big, label=7),
+            Placement(small, operation="subtract"),
+            Placement(corner, label=9, operation="subtract"),
+        ),
+        dtype=np.uint8,
+    )
+    assert scene.labels.shape == (4, 4, 4)  # subtract does not grow the scene
+    assert scene.labels.dtype == np.uint8
+    assert np.count_nonzero(scene.labels) == 64 - 8 - 1
+    assert scene.labels[3, 3, 3] == 0
+    assert scene.labels[0, 3, 3] == 7
+
+
+def test_compose_tiles_workers_and_file(tmp_path):
+    """Given a lattice of cylinders, assure tiles, workers, and a memory mapped
+    file all give the labels of writing each mask directly.
+    """
+    shapes = [
+        PixelCylinder(
+            anchor_x=float(i),
+            anchor_y=6.0 * j,
+            anchor_z=6.0 * k,
+            height=3.0,
+            diameter_inner=0.0,
+            diameter_outer=5.0,
+            pixels_per_len=2,
+        )
+        for i in (0, 2, 5)
+        for j in range(3)
+        for k in range(2)
+    ]
+    known = np.zeros((16, 34, 22), dtype=np.uint16)
+    for label, s in enumerate(shapes, start=1):
+        a, m = s.anchor, s.mask
+        region = known[
+            a.x : a.x + m.shape[0], a.y : a.y + m.shape[1], a.z : a.z + m.shape[2]
+        ]
+        region[m != 0] = label
+
+    serial = compose(placements=shapes)
+    assert serial.labels.shape == known.shape
+    assert np.array_equal(serial.labels, known)
+
+    pathfile = str(tmp_path / "scene.npy")
+    parallel = compose(placements=shapes, tile=3, workers=3, pathfile=pathfile)
+    assert isinstance(parallel.labels, np.memmap)
+    assert np.array_equal(parallel.labels, known)
+    assert np.array_equal(np.load(pathfile, mmap_mode="r"), known)
+
+
+def test_compose_errors():
+    cube = PixelCube()
+    with pytest.raises(ValueError):
+        compose(placements=(Placement(cube, operation="intersect"),))
+    with pytest.raises(ValueError):
+        compose(placements=(Placement(cube, label=256),), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        compose(placements=(Placement(cube, operation="subtract"),))
+    with pytest.raises(ValueError):
+        compose(placements=(cube,), workers=0)
+    with pytest.raises(ValueError):
+        compose(placements=(cube,), tile=0)
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -337,6 +337,27 @@ def test_sphere_non_positive_pixels_per_len():
         pixel_sphere(diameter=good_diameter, pixels_per_len=bad_pixels_per_len)
 
 
+def test_packed_and_run_length_masks():
+    sphere = pixel_sphere(diameter=5.0, pixels_per_len=1)
+    packed = sphere.packed_mask
+    assert packed.shape == (5, 5, 5)
+    assert packed.bits.size == 16  # ceil(125 / 8) bytes
+    assert np.array_equal(packed.unpack(), sphere.mask)
+
+    runs = sphere.run_length_mask
+    assert runs.shape == (5, 5, 5)
+    assert runs.lengths.sum() == sphere.mask.sum()
+    assert tuple(runs.starts[0:2]) == (12, 31)  # center of the first layer
+    assert np.array_equal(runs.unpack(), sphere.mask)
+
+    cylinder = pixel_cylinder(
+        height=2.0, diameter_inner=6.0, diameter_outer=12.0, pixels_per_len=1
+    )
+    assert np.array_equal(cylinder.packed_mask.unpack(), cylinder.mask)
+    assert np.array_equal(cylinder.run_length_mask.unpack(), cylinder.mask)
+    assert np.array_equal(cylinder.mask[0], cylinder.mask[1])
+
+
 @pytest.mark.skip(reason="test not yet completed")
 def test_sphere_one_len_radius_high_resolution():
     sphere = pixel_sphere(diameter=1, pixels_per_len=5)
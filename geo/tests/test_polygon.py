@@ -14,6 +14,7 @@ from itertools import repeat
 # import itertools
 from functools import partial
 
+import numpy as np
 import pytest
 
 import ptg.polygon as pg
@@ -225,6 +226,71 @@ def test_unit_square():
     assert known == found
 
 
+def test_winding_numbers_unit_square():
+    """Tests the batch winding numbers match the single probe winding number,
+    including the edge and corner cases of the unit square.
+    """
+    pairs = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
+    pgon = pg.Polygon2D(boundary=Points(pairs=pairs))
+
+    px = (0, 0.5, 1, 1, 1, 0.5, 0, 0, 0.25, 0.75, -1, 2)
+    py = (0, 0, 0, 0.5, 1, 1, 1, 0.5, 0.25, 0.75, 0.5, 0.5)
+    probes = np.array(tuple(zip(px, py)))
+
+    known = tuple(pgon.winding_number(probe=Point2D(x, y)) for x, y in zip(px, py))
+    for n_buckets in (None, 1, 2, 7):
+        found = pgon.winding_numbers(probes, n_buckets=n_buckets)
+        assert tuple(found) == known
+
+    known_contains = (True, True, False, False, False, False, False, True)
+    known_contains += (True, True, False, False)
+    found_contains = pgon.contains_many(probes)
+    assert tuple(found_contains) == known_contains
+
+
+def test_winding_numbers_wrapped_and_star():
+    """Tests the batch winding numbers on a clockwise polygon that wraps twice
+    and on a star-shaped polygon with many edges.
+    """
+    pairs = (
+        (1.0, 1.0),
+        (1.0, 3.0),
+        (3.0, 3.0),
+        (3.0, 1.0),
+        (1.0, 1.0),
+        (1.0, 3.0),
+        (3.0, 3.0),
+        (3.0, 1.0),
+    )
+    pgon = pg.Polygon2D(boundary=Points(pairs=pairs))
+    found = pgon.winding_numbers(np.array([[2.1, 2.2], [7.0, 5.0]]))
+    assert tuple(found) == (-2, 0)
+
+    t = np.linspace(0.0, 2.0 * np.pi, 200, endpoint=False)
+    r = 1.0 + 0.4 * np.sin(7.0 * t)
+    star = pg.Polygon2D(boundary=Points(pairs=tuple(zip(r * np.cos(t), r * np.sin(t)))))
+
+    rng = np.random.default_rng(seed=0)
+    probes = rng.uniform(-1.5, 1.5, size=(400, 2))
+    probes[:20] = np.column_stack((r * np.cos(t), r * np.sin(t)))[:20]  # vertices
+
+    known = tuple(star.winding_number(probe=Point2D(x, y)) for x, y in probes)
+    for n_buckets in (None, 1, 13, 500):
+        found = star.winding_numbers(probes, n_buckets=n_buckets)
+        assert tuple(found) == known
+
+
+def test_winding_numbers_bad_input():
+    pairs = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
+    pgon = pg.Polygon2D(boundary=Points(pairs=pairs))
+
+    with pytest.raises(ValueError):
+        _ = pgon.winding_numbers(np.array([0.5, 0.5, 0.5]))
+
+    with pytest.raises(ValueError):
+        _ = pgon.winding_numbers(np.array([[0.5, 0.5]]), n_buckets=0)
+
+
 """
 Copyright 2023 Sandia National Laboratories
 
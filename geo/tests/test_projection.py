@@ -0,0 +1,98 @@
+"""This module is a unit test of the closest point projection onto a boundary.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_projection.py -v
+"""
+
+import numpy as np
+import pytest
+
+from ptg.projection import BoundaryProjector, loops
+
+
+def test_loops():
+    """Given two nan separated loops, one with a repeated closing vertex."""
+    nan = float("nan")
+    xs = (0.0, 1.0, 1.0, 0.0, 0.0, nan, 2.0, 3.0, 3.0)
+    ys = (0.0, 0.0, 1.0, 1.0, 0.0, nan, 0.0, 0.0, 1.0)
+    found = loops(xs=xs, ys=ys)
+    assert len(found) == 2
+    assert found[0].shape == (4, 2)  # closing vertex dropped
+    assert tuple(found[1][-1]) == (3.0, 1.0)
+
+    with pytest.raises(ValueError):
+        _ = BoundaryProjector(xs=(nan,), ys=(nan,))
+
+
+def test_project_unit_square():
+    """Given the unit square, project points inside, outside, and on a corner."""
+    b = BoundaryProjector(xs=(0.0, 1.0, 1.0, 0.0), ys=(0.0, 0.0, 1.0, 1.0))
+    assert b.n_segments == 4
+
+    points = ((0.5, 0.1), (2.0, 0.5), (1.5, 1.5), (0.2, 0.75), (0.5, 0.5))
+    p = b.project(points)
+    known = ((0.5, 0.0), (1.0, 0.5), (1.0, 1.0), (0.0, 0.75), (0.5, 0.0))
+    assert np.allclose(p.points, known)
+    assert np.allclose(p.distances, (0.1, 1.0, np.sqrt(0.5), 0.2, 0.5))
+    assert tuple(p.segments[0:2]) == (0, 1)
+    assert p.segments[4] == 0  # the center ties all four sides, lowest wins
+    assert np.allclose(p.parameters[0:2], (0.5, 0.5))
+
+
+def test_project_matches_brute_force():
+    """Given a wavy loop with uneven segments and a square hole, assure the
+    projection agrees with measuring every segment.
+    """
+    theta = np.sort(np.random.default_rng(0).random(400)) * 2.0 * np.pi
+    r = 1.0 + 0.2 * np.sin(9.0 * theta)
+    xs = np.concatenate((r * np.cos(theta), (np.nan,), (-0.2, 0.2, 0.2, -0.2)))
+    ys = np.concatenate((r * np.sin(theta), (np.nan,), (-0.2, -0.2, 0.2, 0.2)))
+    b = BoundaryProjector(xs=xs, ys=ys)
+
+    points = np.random.default_rng(1).uniform(-1.5, 1.5, size=(500, 2))
+    p = b.project(points)
+
+    d = b.ends - b.starts
+    s = ((points[:, np.newaxis, :] - b.starts) * d).sum(axis=2) / (d * d).sum(axis=1)
+    s = np.clip(s, 0.0, 1.0)
+    closest = b.starts + s[..., np.newaxis] * d
+    distances = np.linalg.norm(points[:, np.newaxis, :] - closest, axis=2)
+    assert np.allclose(p.distances, distances.min(axis=1), rtol=0.0, atol=1.0e-12)
+    assert np.array_equal(p.segments, distances.argmin(axis=1))
+    assert np.allclose(p.points, closest[np.arange(500), p.segments])
+
+
+def test_corners_and_snap():
+    """Given a square with a vertex along its bottom side, only the four
+    corners are found, and the nearest points are snapped onto them.
+    """
+    b = BoundaryProjector(xs=(0.0, 0.5, 1.0, 1.0, 0.0), ys=(0.0, 0.0, 0.0, 1.0, 1.0))
+    corners = b.corners()
+    assert len(corners) == 4
+    assert (0.5, 0.0) not in map(tuple, corners)
+
+    points = ((0.1, 0.05), (0.5, 0.02), (0.9, 0.1), (0.95, 0.9), (0.1, 0.8))
+    snapped = b.snap(points)
+    assert tuple(snapped[0]) == (0.0, 0.0)
+    assert tuple(snapped[1]) == (0.5, 0.02)  # not nearest to any corner
+    assert tuple(snapped[2]) == (1.0, 0.0)
+    assert tuple(snapped[3]) == (1.0, 1.0)
+    assert tuple(snapped[4]) == (0.0, 1.0)
+    assert points[0] == (0.1, 0.05)  # the input is not modified
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
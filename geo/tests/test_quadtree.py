@@ -6,6 +6,7 @@ To run
 > pytest geo/tests/test_quadtree.py -v
 """
 
+import numpy as np
 import pytest
 
 from ptg.point import Point2D, Points
@@ -385,6 +386,35 @@ def test_manual_0112():
     assert template.name == "0112"
 
 
+def test_compiled_templates():
+    factory = qt.TemplateFactory()
+    assert tuple(qt.TEMPLATES.keys()) == factory._fields
+
+    for key, compiled in qt.TEMPLATES.items():
+        template = getattr(factory, key)
+        assert compiled.name == template.name
+        assert compiled.vertices_dual.tolist() == [
+            list(v) for v in template.vertices_dual
+        ]
+        assert compiled.boundaries_dual == template.boundaries_dual
+        assert compiled.vertices_dual.flags.writeable is False
+        assert compiled.connectivity.flags.writeable is False
+
+    # the key_0001 family includes the port faces in the connectivity
+    compiled = qt.TEMPLATES["key_0001_r1_p1"]
+    template = factory.key_0001_r1_p1
+    known = template.faces_dual + template.faces_ports
+    assert tuple(map(tuple, compiled.connectivity.tolist())) == known
+
+    compiled = qt.TEMPLATES["key_1021"]
+    assert tuple(map(tuple, compiled.connectivity.tolist())) == (
+        factory.key_1021.faces_dual
+    )
+
+    with pytest.raises(TypeError):
+        qt.TEMPLATES["key_0000"] = compiled
+
+
 def test_scale_then_translate():
     ref = Points(pairs=((-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0)))
 
@@ -697,6 +727,84 @@ def test_static_domain_dual_key_0001_r0_p1_and_key_0001_r1_p0():
     assert known_boundaries_dual_child == found_boundaries_dual_child
 
 
+def test_domain_dual_arrays():
+    """Tests the batched, array-backed dual domain matches the concatenation of
+    the individual dual domains, with global node numbering.
+    """
+    ctr = Point2D(x=0.0, y=0.0)
+    points = Points(pairs=((0.6, 0.6),))
+
+    tree = qt.QuadTree(
+        cell=qt.Cell(center=ctr, size=2.0), level=0, level_max=3, points=points
+    )
+    linear = qt.LinearQuadTree(
+        cell=qt.Cell(center=ctr, size=2.0), level=0, level_max=3, points=points
+    )
+    domain_dual = tree.domain_dual()
+
+    for found in (tree.domain_dual_arrays(), linear.domain_dual_arrays()):
+        assert found.node_offsets.tolist() == [0, 24, 48]
+
+        known_coordinates = domain_dual[0].mesh.coordinates.pairs
+        known_coordinates += domain_dual[1].mesh.coordinates.pairs
+        assert tuple(map(tuple, found.mesh.coordinates.tolist())) == known_coordinates
+
+        # parent faces and the first child faces, offset by 24 nodes
+        assert found.mesh.connectivity.shape == (23, 4)
+        assert found.mesh.connectivity[0].tolist() == [0, 2, 3, 1]
+        assert found.mesh.connectivity[5].tolist() == [23, 19, 0, 22]
+        assert found.mesh.connectivity[12].tolist() == [24, 26, 27, 25]
+
+        boundaries = tuple(
+            tuple(found.boundaries[i:j].tolist())
+            for i, j in zip(found.boundary_offsets[:-1], found.boundary_offsets[1:])
+        )
+        assert boundaries == (
+            (23, 19, 16, 14),
+            (14, 13, 12),
+            (12, 8, 5),
+            (5, 6, 17),
+            (17, 18, 20),
+            (20, 21, 22, 23),
+            (24, 31, 37),
+            (37, 36, 35, 34),
+            (34, 39, 41, 42),
+            (42, 25, 24),
+        )
+
+
+def test_scale_then_translate_templates():
+    instances = (
+        qt.TemplateInstance(
+            template_key="key_0000", scale=1.0, translate=Point2D(0.0, 0.0)
+        ),
+        qt.TemplateInstance(
+            template_key="key_0000", scale=0.5, translate=Point2D(10.0, 20.0)
+        ),
+    )
+    found = qt.scale_then_translate_templates(instances=instances)
+
+    known = qt.scale_then_translate(
+        ref=Points(pairs=qt.TemplateFactory().key_0000.vertices_dual),
+        scale=0.5,
+        translate=Point2D(10.0, 20.0),
+    )
+    assert tuple(map(tuple, found.mesh.coordinates[4:].tolist())) == known.pairs
+    assert found.mesh.connectivity.tolist() == [[0, 2, 3, 1], [4, 6, 7, 5]]
+
+    single = qt.template_domain(instances[1])
+    assert single.mesh.coordinates.pairs == known.pairs
+    assert single.mesh.connectivity == ((0, 2, 3, 1),)
+
+    bad = (
+        qt.TemplateInstance(
+            template_key="key_0000", scale=0.0, translate=Point2D(0.0, 0.0)
+        ),
+    )
+    with pytest.raises(ValueError):
+        _ = qt.scale_then_translate_templates(instances=bad)
+
+
 def test_edges():
     """Tests that the edges of of a mesh are returned correctly."""
 
@@ -841,6 +949,289 @@ def test_centroid():
     assert known == found
 
 
+def test_linear_quadtree_arrays():
+    """
+    ^
+    |     *-----------*
+    |     |           |
+    *-----1-----2-----3-----4-->
+    |     |           |
+    |     *-----------*
+    """
+    ctr = Point2D(x=2.0, y=0.0)
+    cell = qt.Cell(center=ctr, size=2.0)
+    points = Points(pairs=((2.1, 0.1), (2.6, 0.6)))
+
+    tree = qt.LinearQuadTree(cell=cell, level=0, level_max=2, points=points)
+
+    # the client cell is not divided by the linear quadtree
+    assert cell.has_children is False
+
+    assert tree.levels.tolist() == [0, 1, 1, 1, 1, 2, 2, 2, 2]
+    assert tree.sizes.tolist() == [2.0, 1.0, 1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 0.5]
+    assert tree.children.tolist() == [1, -1, -1, -1, 5, -1, -1, -1, -1]
+    assert tree.centers.tolist() == [
+        [2.0, 0.0],
+        [1.5, -0.5],
+        [1.5, 0.5],
+        [2.5, -0.5],
+        [2.5, 0.5],
+        [2.25, 0.25],
+        [2.25, 0.75],
+        [2.75, 0.25],
+        [2.75, 0.75],
+    ]
+    # base-4 digits sw=0, nw=1, se=2, ne=3, padded to level_max
+    assert tree.keys.tolist() == [0, 0, 4, 8, 12, 12, 13, 14, 15]
+    assert tree.leaves().tolist() == [1, 2, 3, 5, 6, 7, 8]
+
+    assert tree.root.ne.center == Point2D(2.5, 0.5)
+    assert tree.root.ne.has_children is True
+    assert tree.root.ne.sw.center == Point2D(2.25, 0.25)
+    assert tree.root.ne.sw.has_children is False
+
+    with pytest.raises(ValueError):
+        _ = qt.LinearQuadTree(cell=cell, level=0, level_max=0, points=points)
+
+
+def test_linear_quadtree_matches_quadtree():
+    """The linear quadtree reproduces the quads and levels of the QuadTree,
+    including points that lie on shared cell edges and points outside the root.
+    """
+    pairs = (
+        (0.0, 0.0),  # center of the root, touches all four children
+        (0.5, 0.5),
+        (1.0, 1.0),  # corner of the root
+        (-1.0, 0.25),
+        (-0.3, -0.7),
+        (0.9, -0.1),
+        (2.0, 2.0),  # outside of the root
+    )
+    points = Points(pairs=pairs)
+
+    for level_max in (1, 2, 3, 4, 5):
+        tree = qt.QuadTree(
+            cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+            level=0,
+            level_max=level_max,
+            points=points,
+        )
+        linear = qt.LinearQuadTree(
+            cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+            level=0,
+            level_max=level_max,
+            points=points,
+        )
+        assert linear.quads() == tree.quads()
+        assert linear.quad_levels() == tree.quad_levels()
+        assert linear.quad_levels_recursive() == tree.quad_levels_recursive()
+
+
+def test_linear_quadtree_domain_dual():
+    points = Points(pairs=((0.6, 0.6),))
+
+    for level_max in (1, 2, 3):
+        tree = qt.QuadTree(
+            cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+            level=0,
+            level_max=level_max,
+            points=points,
+        )
+        linear = qt.LinearQuadTree(
+            cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+            level=0,
+            level_max=level_max,
+            points=points,
+        )
+        known = tree.domain_dual()
+        found = linear.domain_dual()
+
+        assert len(known) == len(found)
+        for k, f in zip(known, found):
+            assert k.mesh.coordinates.pairs == f.mesh.coordinates.pairs
+            assert k.mesh.connectivity == f.mesh.connectivity
+            assert k.boundaries == f.boundaries
+
+
+def test_levels_flatten_deep_nesting():
+    """Tests that flattening does not recurse, so nesting deeper than the
+    interpreter recursion limit is supported.
+    """
+    depth = 5000
+    given = (7,)
+    for _ in range(depth):
+        given = ((1,), (1,), (1,), given)
+    found = tuple(qt.QuadTree._levels_flatten(given))
+    assert len(found) == 3 * depth + 1
+    assert found[:3] == (1, 1, 1)
+    assert found[-1] == 7
+
+
+def test_leaf_counts_and_arrays():
+    points = Points(pairs=((0.6, 0.6), (-0.3, 0.1), (-0.95, -0.95)))
+    cell = qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0)
+
+    tree = qt.QuadTree(cell=cell, level=0, level_max=5, points=points)
+    linear = qt.LinearQuadTree(
+        cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+        level=0,
+        level_max=5,
+        points=points,
+    )
+
+    # leaf counts of every subtree
+    counts = linear.leaf_counts()
+    n_leaves = qt.QuadTree._leaf_counter(cell=tree.cell)
+    assert counts[0] == n_leaves(tree.cell) == len(tree.quads())
+    for k in (0, 1, 2, 3):
+        linear_child = linear.root._child(k)
+        tree_child = (tree.cell.sw, tree.cell.nw, tree.cell.se, tree.cell.ne)[k]
+        assert counts[linear_child.index] == n_leaves(tree_child)
+        assert n_leaves(tree_child) == len(
+            tuple(qt.QuadTree._levels_flatten(tree.quad_levels_recursive()[k]))
+        )
+
+    # flattened quads and levels as arrays
+    known_quads = np.array(tree.quads())
+    assert tree.quads_array().shape == (len(known_quads), 4, 2)
+    assert np.array_equal(tree.quads_array(), known_quads)
+    assert np.array_equal(linear.quads_array(), known_quads)
+
+    known_levels = np.array(tree.quad_levels())
+    assert np.array_equal(tree.quad_levels_array(), known_levels)
+    assert np.array_equal(linear.quad_levels_array(), known_levels)
+    assert tree.quad_levels() == tuple(
+        qt.QuadTree._levels_flatten(tree.quad_levels_recursive())
+    )
+    assert tree.quads() == tuple(
+        qt.QuadTree._quads_flatten(qt.QuadTree._child_vertices(tree.cell))
+    )
+
+
+def test_balanced_quadtree():
+    """Tests that 2:1 balance divides coarse cells until every quad differs by at
+    most one level from the quads that share an edge with it.
+    """
+
+    def level_jumps(tree: qt.QuadTree) -> int:
+        _quads = tree.quads_array()
+        _levels = tree.quad_levels_array()
+        lower = _quads[:, 0, :]  # sw vertex
+        upper = _quads[:, 2, :]  # ne vertex
+        overlap = np.minimum(upper[:, None, :], upper[None, :, :]) - np.maximum(
+            lower[:, None, :], lower[None, :, :]
+        )
+        share_edge = ((overlap[..., 0] > 0.0) & (overlap[..., 1] == 0.0)) | (
+            (overlap[..., 0] == 0.0) & (overlap[..., 1] > 0.0)
+        )
+        jumps = np.abs(_levels[:, None] - _levels[None, :]) > 1
+        return int(np.count_nonzero(share_edge & jumps)) // 2
+
+    points = Points(pairs=((0.31, 0.77), (-0.52, 0.13)))
+
+    tree = qt.QuadTree(
+        cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+        level=0,
+        level_max=6,
+        points=points,
+    )
+    assert level_jumps(tree) > 0
+
+    balanced = qt.QuadTree(
+        cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+        level=0,
+        level_max=6,
+        points=points,
+        balanced=True,
+    )
+    assert level_jumps(balanced) == 0
+    assert len(balanced.quads()) > len(tree.quads())
+    assert max(balanced.quad_levels()) == max(tree.quad_levels())
+
+    # balancing the unbalanced tree in place gives the same quads
+    n_divisions = tree.balance()
+    assert n_divisions > 0
+    assert tree.quads() == balanced.quads()
+    assert tree.quad_levels() == balanced.quad_levels()
+    assert tree.balance() == 0  # already balanced
+
+    # the area of the root cell is preserved
+    _quads = balanced.quads_array()
+    areas = np.prod(_quads[:, 2, :] - _quads[:, 0, :], axis=1)
+    assert np.isclose(areas.sum(), 4.0)
+
+    # the balanced quadtree dualizes
+    assert len(balanced.domain_dual()) > 0
+
+
+def test_dual_subtree_round_trip():
+    points = Points(pairs=((0.31, 0.77), (-0.52, 0.13)))
+    tree = qt.QuadTree(
+        cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+        level=0,
+        level_max=5,
+        points=points,
+    )
+    subtree = qt.DualSubtree.from_cell(cell=tree.cell.nw, level=1)
+    assert subtree.level == 1
+    assert subtree.divided[0] == 1
+
+    cell = subtree.cell()
+    known = tuple(q for q, _ in qt.QuadTree._leaves(cell=tree.cell.nw))
+    found = tuple(q for q, _ in qt.QuadTree._leaves(cell=cell))
+    assert tuple(q.vertices for q in known) == tuple(q.vertices for q in found)
+
+
+def test_domain_dual_workers():
+    """Tests the process pool dualization is identical to the serial dualization."""
+    points = Points(pairs=((0.31, 0.77), (-0.52, 0.13), (0.9, -0.9)))
+    tree = qt.QuadTree(
+        cell=qt.Cell(center=Point2D(x=0.0, y=0.0), size=2.0),
+        level=0,
+        level_max=5,
+        points=points,
+    )
+    known = tree.domain_dual()
+    known_arrays = tree.domain_dual_arrays()
+
+    for split_level in (1, 2, 6):
+        found = tree.domain_dual(workers=2, split_level=split_level)
+        assert len(known) == len(found)
+        for k, f in zip(known, found):
+            assert k.mesh.coordinates.pairs == f.mesh.coordinates.pairs
+            assert k.mesh.connectivity == f.mesh.connectivity
+            assert k.boundaries == f.boundaries
+
+        found_arrays = tree.domain_dual_arrays(workers=2, split_level=split_level)
+        assert np.array_equal(
+            known_arrays.mesh.coordinates, found_arrays.mesh.coordinates
+        )
+        assert np.array_equal(
+            known_arrays.mesh.connectivity, found_arrays.mesh.connectivity
+        )
+        assert np.array_equal(known_arrays.boundaries, found_arrays.boundaries)
+        assert np.array_equal(
+            known_arrays.boundary_offsets, found_arrays.boundary_offsets
+        )
+        assert np.array_equal(known_arrays.node_offsets, found_arrays.node_offsets)
+
+    with pytest.raises(ValueError):
+        _ = tree.domain_dual(workers=0)
+
+    with pytest.raises(ValueError):
+        _ = tree.domain_dual_arrays(workers=2, split_level=0)
+
+    # the serial dualization validates split_level as the pool does
+    with pytest.raises(ValueError):
+        _ = tree.domain_dual(workers=1, split_level=0)
+
+    with pytest.raises(ValueError):
+        _ = tree.domain_dual_arrays(split_level=0)
+
+    with pytest.raises(ValueError):
+        _ = tree.domain_dual_arrays(workers=-1)
+
+
 @pytest.mark.skip("work in progress")
 def test_trim():
     """Tests the 'trim' function under the edge case when a boundary
@@ -0,0 +1,78 @@
+"""This module is a unit test of the edge topology of a mesh.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_topology.py -v
+"""
+
+import numpy as np
+import pytest
+
+from ptg.topology import edge_topology
+
+
+def test_two_quads_nonsequential():
+    """Given two quadrilaterals with non-sequential node numbers, verify the
+    edges, incidence, and boundary edges.
+
+     4       105       6
+     *--------*--------*
+     |        |        |
+     |   (0)  |   (1)  |
+     |        |        |
+     *--------*--------*
+    101       2       103
+    """
+    faces = ((101, 2, 105, 4), (2, 103, 6, 105))
+    t = edge_topology(faces=faces)
+
+    known = ((2, 101), (2, 103), (2, 105), (4, 101), (4, 105), (6, 103), (6, 105))
+    assert tuple(map(tuple, t.edges.tolist())) == known
+
+    in_order = ((2, 101), (2, 105), (4, 105), (4, 101), (2, 103), (6, 103), (6, 105))
+    assert tuple(map(tuple, t.edges_in_order().tolist())) == in_order
+
+    shared = known.index((2, 105))
+    assert tuple(t.faces_of(shared)) == (0, 1)
+    assert tuple(t.faces_of(known.index((6, 103)))) == (1,)
+    assert tuple(t.boundary) == tuple(k for k in range(7) if k != shared)
+
+    assert tuple(t.nodes) == (2, 4, 6, 101, 103, 105)
+    assert tuple(t.edges_of(2)) == (0, 1, 2)
+    assert tuple(t.edges_of(105)) == (2, 4, 6)
+    with pytest.raises(KeyError):
+        _ = t.edges_of(3)
+
+    # an array of faces gives the same topology
+    t_array = edge_topology(faces=np.array(faces))
+    assert all(np.array_equal(a, b) for (a, b) in zip(t, t_array))
+
+
+def test_mixed_faces_and_empty():
+    """Given a quad and a triangle sharing an edge, and no faces at all."""
+    t = edge_topology(faces=((0, 1, 2, 3), (1, 4, 2)))
+    assert len(t.edges) == 6
+    shared = int(np.flatnonzero((t.edges == (1, 2)).all(axis=1))[0])
+    assert tuple(t.faces_of(shared)) == (0, 1)
+    assert len(t.boundary) == 5
+    assert t.face_offsets[-1] == 7  # four quad edges and three triangle edges
+
+    empty = edge_topology(faces=())
+    assert empty.edges.shape == (0, 2)
+    assert empty.boundary.size == 0
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""
@@ -0,0 +1,65 @@
+"""This module is a unit test of drawing mesh faces as a single collection.
+
+To run
+> conda activate siblenv
+> cd ~/sibl
+> pytest geo/tests/test_view_mesh.py -v
+"""
+
+import numpy as np
+import pytest
+
+from ptg.view_mesh import face_collection, face_vertices
+
+
+def test_face_vertices_nonsequential_and_padded():
+    """Given a quad and a triangle, padded with -1, on nonsequential node numbers,
+    the vertices are gathered by node number, and the pad repeats the last node.
+    """
+    coordinates = ((0.0, 0.0, 9.0), (1.0, 0.0, 9.0), (1.0, 1.0, 9.0), (0.0, 1.0, 9.0))
+    node_ids = (10, 30, 20, 40)  # not in sorted order
+    faces = ((10, 30, 20, 40), (30, 40, 10, -1))
+    v = face_vertices(coordinates=coordinates, faces=faces, node_ids=node_ids)
+    assert v.shape == (2, 4, 2)
+    assert np.array_equal(v[0], ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)))
+    assert np.array_equal(v[1], ((1.0, 0.0), (0.0, 1.0), (0.0, 0.0), (0.0, 0.0)))
+
+    # zero-based rows, without padding
+    v = face_vertices(coordinates=coordinates, faces=((0, 1, 2, 3),), pad=None)
+    assert np.array_equal(v[0], np.array(coordinates)[:, 0:2])
+
+    with pytest.raises(KeyError):
+        face_vertices(coordinates=coordinates, faces=((10, 30, 50),), node_ids=node_ids)
+    with pytest.raises(ValueError):
+        face_vertices(coordinates=coordinates, faces=((-1, 0, 1),))
+
+
+def test_face_collection():
+    coordinates = np.array(((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (2.0, 0.0)))
+    faces = ((1, 2, 3, 4), (2, 5, 3, -1))
+    collection = face_collection(
+        coordinates=coordinates,
+        faces=faces,
+        node_ids=np.arange(1, 6),
+        facecolor="white",
+        edgecolor="black",
+    )
+    paths = collection.get_paths()
+    assert len(paths) == 2
+    assert np.allclose(paths[1].vertices[0:4], ((1, 0), (2, 0), (1, 1), (1, 1)))
+    assert np.allclose(collection.get_facecolor(), (1.0, 1.0, 1.0, 1.0))
+
+
+"""
+Copyright 2023 Sandia National Laboratories
+
+Notice: This computer software was prepared by National Technology and Engineering Solutions of
+Sandia, LLC, hereinafter the Contractor, under Contract DE-NA0003525 with the Department of Energy
+(DOE). All rights in the computer software are reserved by DOE on behalf of the United States
+Government and the Contractor as provided in the Contract. You are authorized to use this computer
+software for Governmental purposes but it is not to be released or distributed to the public.
+NEITHER THE U.S. GOVERNMENT NOR THE CONTRACTOR MAKES ANY WARRANTY, EXPRESS OR IMPLIED, OR ASSUMES
+ANY LIABILITY FOR THE USE OF THIS SOFTWARE. This notice including this sentence must appear on any
+copies of this computer software. Export of this data may require a license from the United States
+Government.
+"""